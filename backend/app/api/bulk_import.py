@@ -0,0 +1,163 @@
+import csv
+import io
+import json
+from typing import Any, Dict, Iterator, List, NamedTuple, Type, TypeVar
+
+from fastapi import HTTPException, Request, status
+from pydantic import BaseModel, ValidationError
+
+from .. import schemas
+from ..crud.crud_ledger_totals import LedgerTotalsValues
+
+# Request parsing shared by the bulk import endpoints (POST /user/expenses/bulk, /user/savings/bulk).
+# The body is either a JSON array of items or CSV text with a `name,amount,frequency` header.
+# Either way the raw body is buffered (at most MAX_BULK_BODY_BYTES), then parsed one item at a
+# time, so only validated rows accumulate and MAX_BULK_ROWS stops parsing as soon as it is hit.
+
+MAX_BULK_ROWS = 10_000
+MAX_BULK_BODY_BYTES = 5 * 1024 * 1024 # 5 MiB
+MAX_REPORTED_ROW_ERRORS = 20 # Invalid rows listed in a 422 response; the rest are only counted
+
+JSON_CONTENT_TYPE = "application/json"
+CSV_CONTENT_TYPE = "text/csv"
+
+RowSchema = TypeVar("RowSchema", bound=BaseModel)
+
+class BulkBody(NamedTuple):
+    content_type: str
+    data: bytes
+
+async def read_bulk_body(request: Request) -> BulkBody:
+    """
+    Dependency reading the raw request body, refusing it as soon as it exceeds MAX_BULK_BODY_BYTES.
+    Async so that sync endpoints can use it: the endpoint itself then runs on the threadpool.
+    """
+    content_type = request.headers.get("content-type", JSON_CONTENT_TYPE).split(";")[0].strip().lower()
+    if content_type not in (JSON_CONTENT_TYPE, CSV_CONTENT_TYPE):
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail=f"Expected {JSON_CONTENT_TYPE} (an array of items) or {CSV_CONTENT_TYPE}."
+        )
+    chunks: List[bytes] = []
+    size = 0
+    async for chunk in request.stream():
+        size += len(chunk)
+        if size > MAX_BULK_BODY_BYTES:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f"Bulk imports are limited to {MAX_BULK_BODY_BYTES} bytes."
+            )
+        chunks.append(chunk)
+    return BulkBody(content_type, b"".join(chunks))
+
+def iter_bulk_rows(body: BulkBody) -> Iterator[Dict[str, Any]]:
+    """Yields the raw items of a bulk body one at a time (CSV lines are parsed lazily)."""
+    try:
+        text = body.data.decode("utf-8-sig")
+    except UnicodeDecodeError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Body must be UTF-8 encoded.")
+
+    if body.content_type == CSV_CONTENT_TYPE:
+        try:
+            yield from csv.DictReader(io.StringIO(text, newline=""))
+        except csv.Error as e: # E.g. a field over csv.field_size_limit()
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Invalid CSV: {e}")
+        return
+
+    try:
+        yield from _iter_json_array(text)
+    except json.JSONDecodeError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Invalid JSON: {e}")
+
+_json_decoder = json.JSONDecoder()
+_JSON_WHITESPACE = " \t\n\r"
+
+def _iter_json_array(text: str) -> Iterator[Any]:
+    """Decodes the items of a top-level JSON array one at a time, instead of the whole array up front."""
+    position = _skip_whitespace(text, 0)
+    if not text.startswith("[", position):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Expected a JSON array of items.")
+    position = _skip_whitespace(text, position + 1)
+    if text.startswith("]", position):
+        position += 1
+    else:
+        while True:
+            item, position = _json_decoder.raw_decode(text, position)
+            yield item
+            position = _skip_whitespace(text, position)
+            if text.startswith(",", position):
+                position = _skip_whitespace(text, position + 1)
+            elif text.startswith("]", position):
+                position += 1
+                break
+            else:
+                raise json.JSONDecodeError("Expecting ',' delimiter", text, position)
+    position = _skip_whitespace(text, position)
+    if position != len(text):
+        raise json.JSONDecodeError("Extra data", text, position)
+
+def _skip_whitespace(text: str, position: int) -> int:
+    while position < len(text) and text[position] in _JSON_WHITESPACE:
+        position += 1
+    return position
+
+def validate_bulk_rows(rows: Iterator[Dict[str, Any]], schema: Type[RowSchema]) -> List[RowSchema]:
+    """
+    Validates rows against `schema` as they are parsed. The import is all-or-nothing: any invalid
+    row fails it with a 422 listing the first MAX_REPORTED_ROW_ERRORS problems (rows are 1-based,
+    not counting a CSV header).
+    """
+    valid_rows: List[RowSchema] = []
+    row_errors: List[Dict[str, Any]] = []
+    invalid_row_count = 0
+    for row_number, row in enumerate(rows, start=1):
+        if row_number > MAX_BULK_ROWS:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f"Bulk imports are limited to {MAX_BULK_ROWS} rows."
+            )
+        try:
+            if not isinstance(row, dict):
+                raise TypeError("Expected an object")
+            valid_rows.append(schema(**row))
+        except (ValidationError, TypeError) as e:
+            invalid_row_count += 1
+            if len(row_errors) < MAX_REPORTED_ROW_ERRORS:
+                messages = (
+                    [f"{'.'.join(map(str, error['loc']))}: {error['msg']}" for error in e.errors()]
+                    if isinstance(e, ValidationError) else [str(e)]
+                )
+                row_errors.append({"row": row_number, "errors": messages})
+
+    if invalid_row_count:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail={
+                "message": f"{invalid_row_count} invalid row(s); nothing was imported.",
+                "invalid_rows": invalid_row_count,
+                "errors": row_errors,
+            }
+        )
+    return valid_rows
+
+def bulk_import_summary(inserted: int, totals: LedgerTotalsValues) -> schemas.bulk.BulkImportSummary:
+    return schemas.bulk.BulkImportSummary(
+        inserted=inserted,
+        ledger_totals=schemas.bulk.LedgerTotals(**totals._asdict())
+    )
+
+def bulk_openapi_extra(item_schema_name: str) -> Dict[str, Any]:
+    """Documents the raw request body (JSON array of `item_schema_name`, or CSV) in the OpenAPI schema."""
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {
+                JSON_CONTENT_TYPE: {
+                    "schema": {"type": "array", "items": {"$ref": f"#/components/schemas/{item_schema_name}"}}
+                },
+                CSV_CONTENT_TYPE: {
+                    "schema": {"type": "string", "example": "name,amount,frequency\nRent,1500,monthly\n"}
+                },
+            },
+        }
+    }
@@ -0,0 +1,37 @@
+import hashlib
+from typing import Hashable, Optional
+
+from fastapi import Response, status
+
+# Conditional GETs for responses derived from one user's financial data (the ledger listings and
+# projections). The user's data_version, bumped by every CRUD write to expenses, savings and
+# assumptions, identifies the data; the entity tag combines it with the request's parameters.
+# A request whose If-None-Match lists the current tag is answered 304 after reading the version
+# alone: nothing is loaded into the ORM, queried for the page or computed.
+
+ETAG_HEADER = "ETag"
+IF_NONE_MATCH_HEADER = "If-None-Match"
+# Clients may keep the response but must revalidate it before every use
+CACHE_CONTROL = "private, no-cache"
+
+def entity_tag(user_id: int, data_version: int, variant: Hashable) -> str:
+    """Strong entity tag of the representation of `variant` (path and parameters) for this data version."""
+    digest = hashlib.blake2b(repr(variant).encode(), digest_size=8).hexdigest()
+    return f'"{user_id}.{data_version}.{digest}"'
+
+def if_none_match(header: Optional[str], etag: str) -> bool:
+    """True when the If-None-Match header value lists `etag` (weak comparison, RFC 9110 13.1.2)."""
+    if header is None:
+        return False
+    if header.strip() == "*":
+        return True
+    return any(candidate.strip().removeprefix("W/") == etag for candidate in header.split(","))
+
+def set_entity_tag(response: Response, etag: str) -> None:
+    response.headers[ETAG_HEADER] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
+
+def not_modified(etag: str) -> Response:
+    response = Response(status_code=status.HTTP_304_NOT_MODIFIED)
+    set_entity_tag(response, etag)
+    return response
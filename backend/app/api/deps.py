@@ -0,0 +1,95 @@
+from typing import Any, Optional
+from fastapi import Depends, HTTPException, status
+from sqlalchemy.orm import Session
+
+from .. import crud, models
+from ..database import get_db, get_read_db
+from ..auth import get_current_active_user, oauth2_scheme
+from ..core.identity_cache import UserIdentity, identity_cache
+
+def email_from_user_stub(current_user_stub: Any) -> str:
+    user_email = current_user_stub.get("email")
+    if not user_email:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Could not validate credentials or extract user identifier from token stub"
+        )
+    return user_email
+
+def ensure_user_found(db_user: Optional[models.user.User]) -> models.user.User:
+    if not db_user:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Authenticated user not found in database."
+        )
+    return db_user
+
+def ensure_user_active(identity: UserIdentity) -> UserIdentity:
+    if not identity.is_active:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Inactive user.")
+    return identity
+
+def get_current_identity(
+    token: str = Depends(oauth2_scheme),
+    db: Session = Depends(get_read_db),
+    current_user_stub: Any = Depends(get_current_active_user)
+) -> UserIdentity:
+    """
+    The authenticated user's id, email, age and active flag, from the token -> identity cache:
+    no query on a hit, 1 query (the identity columns only) on a miss.
+    For endpoints that only need the user's id; see also get_current_user_context.
+    """
+    identity = identity_cache.get(token)
+    if identity is None:
+        row = crud.crud_user.get_user_identity(db, email=email_from_user_stub(current_user_stub))
+        identity = identity_cache.put(token, UserIdentity(*ensure_user_found(row)))
+    return ensure_user_active(identity)
+
+def load_user_context(db: Session, identity: UserIdentity) -> models.user.User:
+    """
+    The user with `assumption` and `ledger_totals` eagerly loaded (1 query), as get_current_user_context,
+    for endpoints that resolve the identity first and load the user only when they need to.
+    """
+    return ensure_user_found(crud.crud_user.get_user_context(db, email=identity.email))
+
+def current_data_version(db: Session, identity: UserIdentity) -> int:
+    data_version = crud.crud_user.get_user_data_version(db, user_id=identity.id)
+    if data_version is None: # Not ensure_user_found: version 0 is falsy
+        ensure_user_found(None)
+    return data_version
+
+def _load_current_user(db: Session, current_user_stub: Any, include_ledger: bool) -> models.user.User:
+    user_email = email_from_user_stub(current_user_stub)
+    return ensure_user_found(
+        crud.crud_user.get_user_context(db, email=user_email, include_ledger=include_ledger)
+    )
+
+def get_current_user_context(
+    db: Session = Depends(get_db),
+    current_user_stub: Any = Depends(get_current_active_user)
+) -> models.user.User:
+    """
+    The authenticated user with `assumption` and `ledger_totals` eagerly loaded (1 query).
+    Shared by the projection, expense, saving and assumption routers.
+    """
+    return _load_current_user(db, current_user_stub, include_ledger=False)
+
+def get_current_user_context_read(
+    db: Session = Depends(get_read_db),
+    current_user_stub: Any = Depends(get_current_active_user)
+) -> models.user.User:
+    """
+    As get_current_user_context, loaded through the read-only session (`get_read_db`).
+    For GET endpoints, which should take their `db` from `get_read_db` too.
+    """
+    return _load_current_user(db, current_user_stub, include_ledger=False)
+
+def get_current_user_context_with_ledger(
+    db: Session = Depends(get_db),
+    current_user_stub: Any = Depends(get_current_active_user)
+) -> models.user.User:
+    """
+    As get_current_user_context, plus every `expenses` and `savings` row (3 queries in total).
+    For views that need the whole ledger at once; paginated listings should query pages instead.
+    """
+    return _load_current_user(db, current_user_stub, include_ledger=True)
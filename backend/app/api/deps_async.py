@@ -0,0 +1,43 @@
+from typing import Any
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .. import models
+from ..crud import async_crud
+from ..database_async import get_async_db
+from ..auth import get_current_active_user, oauth2_scheme
+from ..core.identity_cache import UserIdentity, identity_cache
+from .deps import email_from_user_stub, ensure_user_active, ensure_user_found
+
+async def get_current_identity_async(
+    token: str = Depends(oauth2_scheme),
+    db: AsyncSession = Depends(get_async_db),
+    current_user_stub: Any = Depends(get_current_active_user)
+) -> UserIdentity:
+    """Async counterpart of deps.get_current_identity (shares its cache)."""
+    identity = identity_cache.get(token)
+    if identity is None:
+        row = await async_crud.get_user_identity(db, email=email_from_user_stub(current_user_stub))
+        identity = identity_cache.put(token, UserIdentity(*ensure_user_found(row)))
+    return ensure_user_active(identity)
+
+async def load_user_context_async(db: AsyncSession, identity: UserIdentity) -> models.user.User:
+    """Async counterpart of deps.load_user_context."""
+    return ensure_user_found(await async_crud.get_user_context(db, email=identity.email))
+
+async def current_data_version_async(db: AsyncSession, identity: UserIdentity) -> int:
+    data_version = await async_crud.get_user_data_version(db, user_id=identity.id)
+    if data_version is None: # Not ensure_user_found: version 0 is falsy
+        ensure_user_found(None)
+    return data_version
+
+async def get_current_user_context_async(
+    db: AsyncSession = Depends(get_async_db),
+    current_user_stub: Any = Depends(get_current_active_user)
+) -> models.user.User:
+    """
+    Async counterpart of deps.get_current_user_context: the authenticated user with
+    `assumption` and `ledger_totals` eagerly loaded (1 query), for the async routers.
+    """
+    user_email = email_from_user_stub(current_user_stub)
+    return ensure_user_found(await async_crud.get_user_context(db, email=user_email))
@@ -4,4 +4,5 @@ from .expense import router as expense_router
 from .saving import router as saving_router
 from .assumption import router as assumption_router
 from .projection import router as projection_router # Add this
+from .projection_jobs import router as projection_jobs_router
 
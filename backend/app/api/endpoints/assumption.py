@@ -3,35 +3,24 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
 from ....app import crud, models, schemas # Adjusted import path
+from ....app.api.instrumentation import InstrumentedRoute
+from ....app.core.query_budget import query_budget
 from ....app.database import get_db # Adjusted import path
-from ....app.auth import get_current_active_user # Adjusted import path
+from ....app.api.deps import get_current_identity, get_current_user_context_read
+from ....app.core.identity_cache import UserIdentity
 
-router = APIRouter()
+router = APIRouter(route_class=InstrumentedRoute)
 
 @router.get("/", response_model=schemas.assumption.Assumption)
+@query_budget(1)
 def read_user_assumptions(
-    db: Session = Depends(get_db),
-    current_user_stub: Any = Depends(get_current_active_user)
+    db_user: models.user.User = Depends(get_current_user_context_read)
 ) -> Any: # Return type can be models.assumption.Assumption or schemas.assumption.AssumptionBase
     """
     Retrieve the assumptions for the currently authenticated user.
-    If no assumptions are stored for the user, return default values.
+    The assumption row is loaded together with the user, so this costs a single query.
     """
-    user_email = current_user_stub.get("email")
-    if not user_email:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Could not validate credentials or extract user identifier from token stub"
-        )
-
-    db_user = crud.crud_user.get_user_by_email(db, email=user_email)
-    if not db_user:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Authenticated user not found in database."
-        )
-
-    db_assumption = crud.crud_assumption.get_assumption_by_user(db, user_id=db_user.id)
+    db_assumption = db_user.assumption
 
     if not db_assumption:
         # Per revised plan, raise 404. Frontend can use AssumptionCreate schema for defaults.
@@ -43,32 +32,19 @@ def read_user_assumptions(
     return db_assumption
 
 @router.post("/", response_model=schemas.assumption.Assumption, status_code=status.HTTP_200_OK) # 200 if updating, 201 if creating
+@query_budget(5)
 def create_or_update_user_assumptions_endpoint(
     assumption_in: schemas.assumption.AssumptionCreate, # AssumptionCreate has defaults for all fields
     db: Session = Depends(get_db),
-    current_user_stub: Any = Depends(get_current_active_user)
+    identity: UserIdentity = Depends(get_current_identity)
 ) -> models.assumption.Assumption:
     """
     Create or update assumptions for the currently authenticated user.
     Uses AssumptionCreate schema which provides defaults if not supplied by client.
     """
-    user_email = current_user_stub.get("email")
-    if not user_email:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Could not validate credentials or extract user identifier from token stub"
-        )
-
-    db_user = crud.crud_user.get_user_by_email(db, email=user_email)
-    if not db_user:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Authenticated user not found in database."
-        )
-
     # The CRUD function handles both creation and update
     return crud.crud_assumption.create_or_update_user_assumption(
         db=db,
         assumption_in=assumption_in,
-        user_id=db_user.id
+        user_id=identity.id
     )
@@ -1,67 +1,100 @@
 from typing import List, Any
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from ....app import crud, models, schemas # Adjusted import path
-from ....app.database import get_db # Adjusted import path
-from ....app.auth import get_current_active_user # Adjusted import path
+from ....app.api.instrumentation import InstrumentedRoute
+from ....app.core.query_budget import query_budget
+from ....app.database import get_db, get_read_db # Adjusted import path
+from ....app.api.deps import current_data_version, get_current_identity
+from ....app.core.identity_cache import UserIdentity
+from ....app.api.bulk_import import (
+    BulkBody, bulk_import_summary, bulk_openapi_extra, iter_bulk_rows, read_bulk_body, validate_bulk_rows
+)
+from ....app.api.fast_json import RowSerializer, fast_json_enabled, fast_json_response
+from ....app.api.conditional import IF_NONE_MATCH_HEADER, entity_tag, if_none_match, not_modified, set_entity_tag
+from ....app.api.pagination import PageQuery, page_query, set_next_cursor
+from ....app.api.export import EXPORT_CHUNK_ROWS, encode_rows, export_format_query, export_response
 
-router = APIRouter()
+router = APIRouter(route_class=InstrumentedRoute)
+
+expense_rows = RowSerializer(schemas.expense.Expense) # Fast JSON path of the listing
 
 @router.post("/", response_model=schemas.expense.Expense, status_code=status.HTTP_201_CREATED)
+@query_budget(5)
 def create_expense_for_current_user(
     expense_in: schemas.expense.ExpenseCreate,
     db: Session = Depends(get_db),
-    current_user_stub: Any = Depends(get_current_active_user) # Using Any for the stub
+    identity: UserIdentity = Depends(get_current_identity)
 ) -> models.expense.Expense:
     """
     Create a new expense for the currently authenticated user.
-    The current_user_stub is a placeholder. In a real app, it would provide user ID.
-    For now, we need a way to get a user_id. Let's assume the stub's email
-    can be used to fetch the user_id, similar to the GET /profile endpoint.
-    Or, if `get_current_active_user` could be modified to return a user model directly, that'd be better.
-    Let's proceed assuming we can get the user from the stub's email.
+    The user is resolved from the auth stub by `get_current_identity`.
     """
-    user_email = current_user_stub.get("email")
-    if not user_email:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Could not validate credentials or extract user identifier from token stub"
-        )
-
-    db_user = crud.crud_user.get_user_by_email(db, email=user_email)
-    if not db_user:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Authenticated user not found in database."
-        )
+    return crud.crud_expense.create_user_expense(db=db, expense=expense_in, user_id=identity.id)
 
-    return crud.crud_expense.create_user_expense(db=db, expense=expense_in, user_id=db_user.id)
+@router.post(
+    "/bulk",
+    response_model=schemas.bulk.BulkImportSummary,
+    status_code=status.HTTP_201_CREATED,
+    openapi_extra=bulk_openapi_extra("ExpenseCreate")
+)
+@query_budget(6)
+def bulk_create_expenses_for_current_user(
+    body: BulkBody = Depends(read_bulk_body),
+    db: Session = Depends(get_db),
+    identity: UserIdentity = Depends(get_current_identity)
+) -> schemas.bulk.BulkImportSummary:
+    """
+    Import many expenses at once, from a JSON array or from CSV (`Content-Type: text/csv`,
+    header `name,amount,frequency`). All rows are validated first; a single invalid row
+    fails the import with 422. Valid imports are written in one transaction.
+    Bodies over 5 MiB or 10,000 rows are refused with 413; the body is buffered, then parsed
+    and validated one row at a time.
+    """
+    expenses = validate_bulk_rows(iter_bulk_rows(body), schemas.expense.ExpenseCreate)
+    inserted = crud.crud_expense.create_user_expenses_bulk(db, expenses, user_id=identity.id)
+    return bulk_import_summary(inserted, crud.crud_ledger_totals.get_projection_totals(db, user_id=identity.id))
 
 @router.get("/", response_model=List[schemas.expense.Expense])
+@query_budget(3)
 def read_expenses_for_current_user(
-    db: Session = Depends(get_db),
-    skip: int = 0,
-    limit: int = 100,
-    current_user_stub: Any = Depends(get_current_active_user) # Using Any for the stub
+    request: Request,
+    response: Response,
+    page: PageQuery = Depends(page_query),
+    db: Session = Depends(get_read_db),
+    identity: UserIdentity = Depends(get_current_identity),
+    fast_json: bool = Depends(fast_json_enabled)
 ) -> List[models.expense.Expense]:
     """
-    Retrieve expenses for the currently authenticated user.
-    Similar to POST, we derive user_id from the stub.
+    Retrieve expenses for the currently authenticated user, ordered by id.
+    Follow the X-Next-Cursor response header (as `cursor`) for the next page.
     """
-    user_email = current_user_stub.get("email")
-    if not user_email:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Could not validate credentials or extract user identifier from token stub"
-        )
-
-    db_user = crud.crud_user.get_user_by_email(db, email=user_email)
-    if not db_user:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Authenticated user not found in database."
-        )
-
-    expenses = crud.crud_expense.get_expenses_by_user(db, user_id=db_user.id, skip=skip, limit=limit)
+    # The version is read before the page: a write in between only makes the tag older than the
+    # page (a spurious full response later), never a stale page under a current tag.
+    etag = entity_tag(identity.id, current_data_version(db, identity), ("expenses", page))
+    if if_none_match(request.headers.get(IF_NONE_MATCH_HEADER), etag):
+        return not_modified(etag)
+    expenses = crud.crud_expense.get_expenses_by_user(
+        db, user_id=identity.id, skip=page.skip, limit=page.limit, after_id=page.after_id
+    )
+    set_next_cursor(response, expenses, page.limit)
+    set_entity_tag(response, etag)
+    if fast_json:
+        return fast_json_response(expense_rows(expenses), response)
     return expenses
+
+@router.get("/export", response_class=StreamingResponse)
+@query_budget(2)
+def export_expenses_for_current_user(
+    format: str = Depends(export_format_query),
+    db: Session = Depends(get_read_db),
+    identity: UserIdentity = Depends(get_current_identity)
+) -> StreamingResponse:
+    """
+    Stream all of the user's expenses as NDJSON or CSV. Rows are fetched and encoded in batches,
+    so memory stays flat regardless of how many rows the user has.
+    """
+    rows = crud.crud_expense.iter_expense_rows_by_user(db, user_id=identity.id, batch_size=EXPORT_CHUNK_ROWS)
+    return export_response(encode_rows(rows, crud.crud_expense.EXPORT_COLUMNS, format), format, "expenses")
@@ -1,44 +1,58 @@
-from typing import List, Any, Optional
-from fastapi import APIRouter, Depends, HTTPException, status
+from itertools import islice
+from typing import List, Any, Dict, Iterator, NamedTuple, Optional, Literal, Tuple, Union, Hashable
+
+import numpy as np
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from ....app import crud, models, schemas # Main app's modules
-from ....app.database import get_db
-from ....app.auth import get_current_active_user
+from ....app.api.instrumentation import InstrumentedRoute
+from ....app.core.query_budget import query_budget
+from ....app.database import get_read_db
+from ....app.api.conditional import IF_NONE_MATCH_HEADER, entity_tag, if_none_match, not_modified, set_entity_tag
+from ....app.api.deps import current_data_version, get_current_identity, get_current_user_context_read, load_user_context
+from ....app.api.fast_json import FastJSONResponse, fast_json_enabled, fast_json_response
+from ....app.api.export import encode_rows, export_format_query, export_response
 from ....app.core.projections import ( # Core projection logic
     LIFESTYLE_MULTIPLIERS,
+    NO_RETIREMENT_AGE,
+    ProjectionInputs,
+    TimelineYear,
     calculate_retirement_projection,
-    get_total_annual_amount
+    calculate_retirement_projections_batch,
+    iter_projection_timeline
+)
+from ....app.core.goal_seek import solve_additional_savings
+from ....app.core.montecarlo import (
+    DEFAULT_INFLATION_VOLATILITY,
+    DEFAULT_RETURN_VOLATILITY,
+    DEFAULT_SIMULATION_PATHS,
+    DEFAULT_SUCCESS_PROBABILITY,
+    MAX_SIMULATION_PATHS,
+    MonteCarloProjection,
+    simulate_retirement_projections
 )
+from ....app.core.cache import projection_cache
+from ....app.core.executor import ExecutorSaturated, ProjectionJob, projection_executor
+from ....app.core.identity_cache import UserIdentity
+from ....app.core.sensitivity import MAX_SENSITIVITY_STEPS, SensitivityGrid, calculate_sensitivity_grid
 
-router = APIRouter()
+router = APIRouter(route_class=InstrumentedRoute)
 
-# Name for the specific saving item that holds the current total lump sum
-# This is based on the assumption in the plan to avoid immediate Saving model changes.
-LUMP_SUM_SAVING_NAME = "Current Total Savings"
+# Default half-widths of the sensitivity ranges, centred on the user's own assumptions
+DEFAULT_RETURN_RATE_SPREAD = 0.03
+DEFAULT_INFLATION_RATE_SPREAD = 0.02
 
-@router.get("/", response_model=schemas.projection.ProjectionResponse)
-def get_retirement_projections(
-    db: Session = Depends(get_db),
-    current_user_stub: Any = Depends(get_current_active_user)
-) -> schemas.projection.ProjectionResponse:
+# Years per page of GET /timeline in JSON format; the NDJSON / CSV formats stream every year
+DEFAULT_TIMELINE_PAGE_SIZE = 50
+MAX_TIMELINE_PAGE_SIZE = 200
+
+def load_projection_inputs(db: Session, db_user: models.user.User) -> ProjectionInputs:
     """
-    Calculate and return retirement projections for different lifestyles.
+    Reduce the user's profile, assumptions, expenses and savings to the plain numbers
+    the projection engines work on. Shared with the async router (via `AsyncSession.run_sync`).
     """
-    user_email = current_user_stub.get("email")
-    if not user_email:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Could not validate credentials or extract user identifier from token stub"
-        )
-
-    db_user = crud.crud_user.get_user_by_email(db, email=user_email)
-    if not db_user:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Authenticated user not found in database."
-        )
-
     if db_user.age is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, # Or 422 Unprocessable Entity
@@ -46,8 +60,8 @@ def get_retirement_projections(
         )
     current_age = db_user.age
 
-    # Fetch assumptions or use defaults
-    user_assumptions = crud.crud_assumption.get_assumption_by_user(db, user_id=db_user.id)
+    # Assumptions were loaded with the user; fall back to the schema defaults
+    user_assumptions = db_user.assumption
     if user_assumptions:
         investment_return_rate = user_assumptions.return_rate
         inflation_rate = user_assumptions.inflation_rate
@@ -59,58 +73,448 @@ def get_retirement_projections(
         inflation_rate = default_assumptions.inflation_rate
         life_expectancy = default_assumptions.life_expectancy
 
-    # Calculate base annual expenses
-    user_expenses = crud.crud_expense.get_expenses_by_user(db, user_id=db_user.id, limit=1000) # High limit
-    base_annual_expenses = get_total_annual_amount(user_expenses)
-
-    # Derive current_savings_total and annual_savings_contribution
-    user_savings = crud.crud_saving.get_savings_by_user(db, user_id=db_user.id, limit=1000) # High limit
-    current_savings_total: float = 0.0
-    recurring_savings_items: List[models.saving.Saving] = []
-
-    for saving_item in user_savings:
-        if saving_item.name == LUMP_SUM_SAVING_NAME:
-             # Assuming frequency for lump sum is 'one-time' or its amount is taken as is.
-             # If it has a frequency like 'yearly', it might be misinterpreted by get_total_annual_amount.
-             # For now, just sum up amounts of items with this specific name.
-            current_savings_total += saving_item.amount
-        else:
-            # Add to list for annual contribution calculation, if not 'one-time' frequency
-            if saving_item.frequency != "one-time": # Make sure 'one-time' is handled by normalize
-                 recurring_savings_items.append(saving_item)
-
-    annual_savings_contribution = get_total_annual_amount(recurring_savings_items)
-
-    # --- Debug prints (remove in production) ---
-    # print(f"User Age: {current_age}")
-    # print(f"Investment Rate: {investment_return_rate}, Inflation: {inflation_rate}, Life Expectancy: {life_expectancy}")
-    # print(f"Base Annual Expenses: {base_annual_expenses}")
-    # print(f"Current Total Savings: {current_savings_total}")
-    # print(f"Annual Savings Contribution: {annual_savings_contribution}")
-    # --- End Debug prints ---
+    # Running ledger totals (also loaded with the user): O(1) regardless of how many items the user has.
+    # Users without a totals record yet fall back to one SQL aggregation.
+    if db_user.ledger_totals is not None:
+        totals = crud.crud_ledger_totals.LedgerTotalsValues(
+            db_user.ledger_totals.annual_expense_total,
+            db_user.ledger_totals.annual_contribution_total,
+            db_user.ledger_totals.lump_sum_total
+        )
+    else:
+        totals = crud.crud_ledger_totals.aggregate_ledger_totals(db, user_id=db_user.id)
 
-    projection_results: List[schemas.projection.ProjectionResult] = []
+    return ProjectionInputs(
+        current_age=current_age,
+        current_savings_total=totals.lump_sum_total,
+        annual_savings_contribution=totals.annual_contribution_total,
+        base_annual_expenses=totals.annual_expense_total, # This is already the total for user
+        investment_return_rate=investment_return_rate,
+        inflation_rate=inflation_rate,
+        life_expectancy=life_expectancy
+    )
+
+# --- Projection executor ---
+# Monte Carlo runs and sensitivity grids are described as ProjectionJobs (plain inputs in,
+# numpy arrays out) and run on the projection executor, which keeps small jobs inline and
+# sends large ones to its pool.
+
+def _projection_years(inputs: ProjectionInputs) -> int:
+    return max(inputs.life_expectancy - inputs.current_age + 1, 1)
+
+def _executor_busy() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Too many projections are being computed. Please retry shortly.",
+        headers={"Retry-After": "1"}
+    )
+
+def run_projection_job(job: ProjectionJob) -> Any:
+    """Runs `job` on the projection executor; a full executor queue is reported as 503."""
+    try:
+        return projection_executor.run(job)
+    except ExecutorSaturated:
+        raise _executor_busy()
+
+async def run_projection_job_async(job: ProjectionJob) -> Any:
+    """As run_projection_job, awaiting offloaded jobs instead of blocking (async router)."""
+    try:
+        return await projection_executor.run_async(job)
+    except ExecutorSaturated:
+        raise _executor_busy()
 
-    for lifestyle, multiplier in LIFESTYLE_MULTIPLIERS.items():
-        # print(f"Calculating for lifestyle: {lifestyle}, multiplier: {multiplier}")
-        retirement_age = calculate_retirement_projection(
-            current_age=current_age,
-            current_savings_total=current_savings_total,
-            annual_savings_contribution=annual_savings_contribution,
-            base_annual_expenses=base_annual_expenses, # This is already the total for user
-            investment_return_rate=investment_return_rate,
-            inflation_rate=inflation_rate,
-            life_expectancy=life_expectancy,
-            expense_multiplier=multiplier
+# --- Query parameters and response builders ---
+# Parsed by dependencies and built by plain functions so the async router
+# (app/api/endpoints_async/projection.py) serves exactly the same API.
+
+class ProjectionQuery(NamedTuple):
+    mode: str
+    seed: Optional[int]
+    paths: int
+    success_probability: float
+    return_volatility: float
+    inflation_volatility: float
+
+def projection_query(
+    mode: Literal["deterministic", "montecarlo"] = Query(
+        "deterministic", description="'montecarlo' simulates random return/inflation paths"
+    ),
+    seed: Optional[int] = Query(None, description="Monte Carlo only: seed for reproducible results"),
+    paths: int = Query(DEFAULT_SIMULATION_PATHS, ge=1, le=MAX_SIMULATION_PATHS, description="Monte Carlo only: simulated paths"),
+    success_probability: float = Query(
+        DEFAULT_SUCCESS_PROBABILITY, gt=0, le=1,
+        description="Monte Carlo only: probability of success required to report a retirement age"
+    ),
+    return_volatility: float = Query(DEFAULT_RETURN_VOLATILITY, ge=0, description="Monte Carlo only"),
+    inflation_volatility: float = Query(DEFAULT_INFLATION_VOLATILITY, ge=0, description="Monte Carlo only")
+) -> ProjectionQuery:
+    return ProjectionQuery(mode, seed, paths, success_probability, return_volatility, inflation_volatility)
+
+def projection_variant(age: int, query: ProjectionQuery) -> Optional[Hashable]:
+    """
+    What, besides the user's data, determines a projection. Unseeded Monte Carlo runs are random
+    by design and have none (None): they are never cached and carry no entity tag.
+    """
+    if query.mode == "deterministic":
+        return (query.mode, age)
+    if query.seed is not None:
+        return (age,) + tuple(query)
+    return None
+
+def projection_cache_key(user_id: int, data_version: int, variant: Hashable) -> Tuple[int, int, Hashable]:
+    """Results are cached per user data version."""
+    return (user_id, data_version, variant)
+
+def projection_etag(user_id: int, data_version: int, variant: Hashable) -> str:
+    return entity_tag(user_id, data_version, ("projections", variant))
+
+def cache_projection_response(
+    response: Response, db_user: models.user.User, query: ProjectionQuery, projections: schemas.projection.ProjectionResponse
+) -> None:
+    """
+    Caches freshly computed `projections` and tags the response, under the data version that was
+    loaded: a write since the version was checked makes it newer than the one looked up.
+    """
+    variant = projection_variant(db_user.age, query)
+    set_entity_tag(response, projection_etag(db_user.id, db_user.data_version, variant))
+    projection_cache.put(projection_cache_key(db_user.id, db_user.data_version, variant), projections)
+
+def projection_job(
+    inputs: ProjectionInputs, query: ProjectionQuery, max_paths: int = MAX_SIMULATION_PATHS
+) -> ProjectionJob:
+    expense_multipliers = list(LIFESTYLE_MULTIPLIERS.values())
+    cost = _projection_years(inputs) * len(expense_multipliers)
+    if query.mode == "montecarlo":
+        return ProjectionJob(
+            simulate_retirement_projections,
+            dict(
+                **inputs._asdict(),
+                expense_multipliers=expense_multipliers,
+                paths=query.paths,
+                return_volatility=query.return_volatility,
+                inflation_volatility=query.inflation_volatility,
+                success_probability=query.success_probability,
+                seed=query.seed,
+                max_paths=max_paths
+            ),
+            cost * query.paths
         )
-        # print(f"Lifestyle: {lifestyle}, Calculated Age: {retirement_age}")
+    # All lifestyle tiers are evaluated in one pass; they share the savings trajectory.
+    return ProjectionJob(
+        calculate_retirement_projections_batch, dict(**inputs._asdict(), expense_multipliers=expense_multipliers), cost
+    )
 
+def projection_response(
+    query: ProjectionQuery, result: Union[MonteCarloProjection, np.ndarray]
+) -> schemas.projection.ProjectionResponse:
+    """Builds the response from the result of `projection_job`."""
+    projection_results: List[schemas.projection.ProjectionResult] = []
+    simulation = result if query.mode == "montecarlo" else None
+    retirement_ages = simulation.retirement_ages if simulation is not None else result
+
+    for tier, (lifestyle, calculated_age) in enumerate(zip(LIFESTYLE_MULTIPLIERS, retirement_ages)):
+        retirement_age = None if calculated_age == NO_RETIREMENT_AGE else int(calculated_age)
+        success_probabilities = None
+        if simulation is not None:
+            success_probabilities = [
+                schemas.projection.AgeSuccessProbability(age=int(age), probability=float(probability))
+                for age, probability in zip(simulation.candidate_ages, simulation.success_probabilities[tier])
+            ]
         projection_results.append(
             schemas.projection.ProjectionResult(
                 lifestyle=lifestyle,
                 retirement_age=retirement_age,
-                can_retire=(retirement_age is not None)
+                can_retire=(retirement_age is not None),
+                success_probabilities=success_probabilities
             )
         )
 
-    return schemas.projection.ProjectionResponse(projections=projection_results)
+    return schemas.projection.ProjectionResponse(projections=projection_results, mode=query.mode)
+
+def build_projection_response(inputs: ProjectionInputs, query: ProjectionQuery) -> schemas.projection.ProjectionResponse:
+    return projection_response(query, run_projection_job(projection_job(inputs, query)))
+
+def _ensure_known_lifestyle(lifestyle: str) -> None:
+    if lifestyle not in LIFESTYLE_MULTIPLIERS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown lifestyle '{lifestyle}'. Expected one of {list(LIFESTYLE_MULTIPLIERS)}."
+        )
+
+class GoalSeekQuery(NamedTuple):
+    target_age: int
+    lifestyle: str
+    mode: str
+
+def goal_seek_query(
+    target_age: int = Query(..., description="Age at which the user wants to retire"),
+    lifestyle: str = Query("frugal", description="One of the LIFESTYLE_MULTIPLIERS tiers"),
+    mode: Literal["annual_contribution", "lump_sum"] = Query(
+        "annual_contribution", description="Solve for an extra annual contribution or a one-off lump sum"
+    )
+) -> GoalSeekQuery:
+    _ensure_known_lifestyle(lifestyle)
+    return GoalSeekQuery(target_age, lifestyle, mode)
+
+def build_goal_seek_response(inputs: ProjectionInputs, query: GoalSeekQuery) -> schemas.projection.GoalSeekResponse:
+    try:
+        result = solve_additional_savings(
+            **inputs._asdict(),
+            expense_multiplier=LIFESTYLE_MULTIPLIERS[query.lifestyle],
+            target_retirement_age=query.target_age,
+            mode=query.mode
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    return schemas.projection.GoalSeekResponse(
+        lifestyle=query.lifestyle,
+        target_retirement_age=query.target_age,
+        mode=query.mode,
+        required_amount=result.required_amount,
+        projected_retirement_age=result.projected_retirement_age,
+        achievable=(result.required_amount is not None)
+    )
+
+class SensitivityQuery(NamedTuple):
+    return_rate_min: Optional[float]
+    return_rate_max: Optional[float]
+    return_rate_steps: int
+    inflation_rate_min: Optional[float]
+    inflation_rate_max: Optional[float]
+    inflation_rate_steps: int
+
+def sensitivity_query(
+    return_rate_min: Optional[float] = Query(None, gt=-1, description="Defaults to the user's return rate minus 3 points"),
+    return_rate_max: Optional[float] = Query(None, gt=-1, description="Defaults to the user's return rate plus 3 points"),
+    return_rate_steps: int = Query(7, ge=1, le=MAX_SENSITIVITY_STEPS),
+    inflation_rate_min: Optional[float] = Query(None, ge=0, description="Defaults to the user's inflation rate minus 2 points"),
+    inflation_rate_max: Optional[float] = Query(None, ge=0, description="Defaults to the user's inflation rate plus 2 points"),
+    inflation_rate_steps: int = Query(5, ge=1, le=MAX_SENSITIVITY_STEPS)
+) -> SensitivityQuery:
+    return SensitivityQuery(
+        return_rate_min, return_rate_max, return_rate_steps,
+        inflation_rate_min, inflation_rate_max, inflation_rate_steps
+    )
+
+def _sensitivity_axis(name: str, minimum: float, maximum: float, steps: int) -> np.ndarray:
+    if minimum > maximum:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"{name}_min must not be greater than {name}_max."
+        )
+    return np.linspace(minimum, maximum, steps)
+
+def sensitivity_job(inputs: ProjectionInputs, query: SensitivityQuery) -> ProjectionJob:
+    return_rates = _sensitivity_axis(
+        "return_rate",
+        query.return_rate_min if query.return_rate_min is not None else inputs.investment_return_rate - DEFAULT_RETURN_RATE_SPREAD,
+        query.return_rate_max if query.return_rate_max is not None else inputs.investment_return_rate + DEFAULT_RETURN_RATE_SPREAD,
+        query.return_rate_steps
+    )
+    inflation_rates = _sensitivity_axis(
+        "inflation_rate",
+        query.inflation_rate_min if query.inflation_rate_min is not None else max(inputs.inflation_rate - DEFAULT_INFLATION_RATE_SPREAD, 0.0),
+        query.inflation_rate_max if query.inflation_rate_max is not None else inputs.inflation_rate + DEFAULT_INFLATION_RATE_SPREAD,
+        query.inflation_rate_steps
+    )
+    expense_multipliers = list(LIFESTYLE_MULTIPLIERS.values())
+    return ProjectionJob(
+        calculate_sensitivity_grid,
+        dict(
+            current_age=inputs.current_age,
+            current_savings_total=inputs.current_savings_total,
+            annual_savings_contribution=inputs.annual_savings_contribution,
+            base_annual_expenses=inputs.base_annual_expenses,
+            life_expectancy=inputs.life_expectancy,
+            return_rates=return_rates,
+            inflation_rates=inflation_rates,
+            expense_multipliers=expense_multipliers
+        ),
+        _projection_years(inputs) * len(expense_multipliers) * len(return_rates) * len(inflation_rates)
+    )
+
+def sensitivity_content(grid: SensitivityGrid) -> Dict[str, Any]:
+    """The SensitivityResponse for the result of `sensitivity_job`, as plain JSON values (fast JSON path)."""
+    return {
+        "return_rates": grid.return_rates.tolist(),
+        "inflation_rates": grid.inflation_rates.tolist(),
+        "grids": [
+            {
+                "lifestyle": lifestyle,
+                "retirement_ages": [
+                    [None if age == NO_RETIREMENT_AGE else age for age in row]
+                    for row in grid.retirement_ages[tier].tolist()
+                ]
+            }
+            for tier, lifestyle in enumerate(LIFESTYLE_MULTIPLIERS)
+        ]
+    }
+
+def sensitivity_response(grid: SensitivityGrid) -> schemas.projection.SensitivityResponse:
+    """Builds the response from the result of `sensitivity_job`."""
+    return schemas.projection.SensitivityResponse(**sensitivity_content(grid))
+
+def build_sensitivity_response(inputs: ProjectionInputs, query: SensitivityQuery) -> schemas.projection.SensitivityResponse:
+    return sensitivity_response(run_projection_job(sensitivity_job(inputs, query)))
+
+class TimelineQuery(NamedTuple):
+    lifestyle: str
+    retirement_age: Optional[int]
+    format: str
+    offset: int
+    limit: int
+
+def timeline_query(
+    lifestyle: str = Query("frugal", description="One of the LIFESTYLE_MULTIPLIERS tiers"),
+    retirement_age: Optional[int] = Query(
+        None, description="Retire at this age; defaults to the earliest possible age for the lifestyle"
+    ),
+    format: Literal["json", "ndjson", "csv"] = Query(
+        "json", description="'json' returns one page of years; 'ndjson' and 'csv' stream the whole timeline"
+    ),
+    offset: int = Query(0, ge=0, description="JSON only: first year (offset from the current age) of the page"),
+    limit: int = Query(DEFAULT_TIMELINE_PAGE_SIZE, ge=1, le=MAX_TIMELINE_PAGE_SIZE, description="JSON only: years per page")
+) -> TimelineQuery:
+    _ensure_known_lifestyle(lifestyle)
+    return TimelineQuery(lifestyle, retirement_age, format, offset, limit)
+
+def projection_timeline(inputs: ProjectionInputs, query: TimelineQuery) -> Tuple[Optional[int], Iterator[TimelineYear]]:
+    """The retirement age the timeline uses and a lazy iterator over its years."""
+    expense_multiplier = LIFESTYLE_MULTIPLIERS[query.lifestyle]
+    retirement_age = query.retirement_age
+    if retirement_age is None:
+        retirement_age = calculate_retirement_projection(**inputs._asdict(), expense_multiplier=expense_multiplier)
+    elif not inputs.current_age <= retirement_age <= inputs.life_expectancy:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="retirement_age must be between the current age and life expectancy."
+        )
+    years = iter_projection_timeline(
+        **inputs._asdict(), expense_multiplier=expense_multiplier, retirement_age=retirement_age
+    )
+    return retirement_age, years
+
+def build_timeline_response(
+    inputs: ProjectionInputs, query: TimelineQuery, fast_json: bool = False
+) -> Union[schemas.projection.TimelinePage, StreamingResponse, FastJSONResponse]:
+    """
+    JSON: one page, simulating only the years up to the end of the page.
+    NDJSON / CSV: the whole timeline, encoded as the generator yields it.
+    """
+    retirement_age, years = projection_timeline(inputs, query)
+    if query.format != "json":
+        return export_response(
+            encode_rows(years, TimelineYear._fields, query.format), query.format, f"projection_timeline_{query.lifestyle}"
+        )
+
+    total = max(inputs.life_expectancy - inputs.current_age + 1, 0)
+    page_end = query.offset + query.limit
+    page = {
+        "lifestyle": query.lifestyle,
+        "retirement_age": retirement_age,
+        "total": total,
+        "offset": query.offset,
+        "next_offset": page_end if page_end < total else None,
+        "items": [year._asdict() for year in islice(years, query.offset, page_end)]
+    }
+    if fast_json:
+        return fast_json_response(page)
+    return schemas.projection.TimelinePage(**page)
+
+# --- Endpoints ---
+
+@router.get("/", response_model=schemas.projection.ProjectionResponse)
+@query_budget(3)
+def get_retirement_projections(
+    request: Request,
+    response: Response,
+    query: ProjectionQuery = Depends(projection_query),
+    db: Session = Depends(get_read_db),
+    identity: UserIdentity = Depends(get_current_identity)
+) -> schemas.projection.ProjectionResponse:
+    """
+    Calculate and return retirement projections for different lifestyles.
+    In Monte Carlo mode each lifestyle also reports the probability of success per candidate age,
+    and `retirement_age` is the first age reaching `success_probability`.
+    Reproducible results carry an ETag; revalidating it with If-None-Match answers 304 while
+    the user's data is unchanged, and cached results are served, from the user's data version
+    alone (1 query) without loading the user.
+    """
+    variant = projection_variant(identity.age, query)
+    if variant is not None:
+        data_version = current_data_version(db, identity)
+        etag = projection_etag(identity.id, data_version, variant)
+        if IF_NONE_MATCH_HEADER in request.headers and if_none_match(request.headers[IF_NONE_MATCH_HEADER], etag):
+            return not_modified(etag)
+        cached_response = projection_cache.get(projection_cache_key(identity.id, data_version, variant))
+        if cached_response is not None:
+            set_entity_tag(response, etag)
+            return cached_response
+
+    db_user = load_user_context(db, identity)
+    inputs = load_projection_inputs(db, db_user)
+    projections = build_projection_response(inputs, query)
+    if variant is not None:
+        cache_projection_response(response, db_user, query, projections)
+    return projections
+
+@router.get("/goal", response_model=schemas.projection.GoalSeekResponse)
+@query_budget(1)
+def get_goal_seek_projection(
+    query: GoalSeekQuery = Depends(goal_seek_query),
+    db: Session = Depends(get_read_db),
+    db_user: models.user.User = Depends(get_current_user_context_read)
+) -> schemas.projection.GoalSeekResponse:
+    """
+    How much more does the user need to save to retire at `target_age`?
+    Returns the minimum extra annual contribution (in today's dollars) or lump sum.
+    """
+    inputs = load_projection_inputs(db, db_user)
+    return build_goal_seek_response(inputs, query)
+
+@router.get("/sensitivity", response_model=schemas.projection.SensitivityResponse)
+@query_budget(1)
+def get_sensitivity_grid(
+    query: SensitivityQuery = Depends(sensitivity_query),
+    db: Session = Depends(get_read_db),
+    db_user: models.user.User = Depends(get_current_user_context_read),
+    fast_json: bool = Depends(fast_json_enabled)
+) -> schemas.projection.SensitivityResponse:
+    """
+    Retirement age per lifestyle over a return-rate x inflation-rate surface.
+    User data is loaded once and the whole grid is computed in one broadcasted pass.
+    """
+    inputs = load_projection_inputs(db, db_user)
+    grid = run_projection_job(sensitivity_job(inputs, query))
+    if fast_json:
+        return fast_json_response(sensitivity_content(grid))
+    return sensitivity_response(grid)
+
+@router.get("/inputs", response_class=StreamingResponse)
+@query_budget(1)
+def export_projection_inputs(
+    format: str = Depends(export_format_query),
+    db: Session = Depends(get_read_db),
+    db_user: models.user.User = Depends(get_current_user_context_read)
+) -> StreamingResponse:
+    """
+    The numbers the projection engines run on (age, ledger totals, assumptions) as one NDJSON or CSV record.
+    """
+    inputs = load_projection_inputs(db, db_user)
+    return export_response(encode_rows([tuple(inputs)], ProjectionInputs._fields, format), format, "projection_inputs")
+
+@router.get("/timeline", response_model=schemas.projection.TimelinePage)
+@query_budget(1)
+def get_projection_timeline(
+    query: TimelineQuery = Depends(timeline_query),
+    db: Session = Depends(get_read_db),
+    db_user: models.user.User = Depends(get_current_user_context_read),
+    fast_json: bool = Depends(fast_json_enabled)
+) -> Union[schemas.projection.TimelinePage, StreamingResponse]:
+    """
+    Year-by-year balance, contribution and expenses from the current age to life expectancy
+    for one lifestyle, paginated (format=json) or streamed (format=ndjson / csv).
+    """
+    inputs = load_projection_inputs(db, db_user)
+    return build_timeline_response(inputs, query, fast_json)
@@ -0,0 +1,171 @@
+from datetime import datetime, timezone
+from math import ceil
+from typing import Optional, Union
+
+import numpy as np
+from fastapi import APIRouter, Body, Depends, HTTPException, Request, Response, status
+from sqlalchemy.orm import Session
+
+from ....app import models, schemas
+from ....app.api.instrumentation import InstrumentedRoute
+from ....app.core.query_budget import query_budget
+from ....app.database import get_read_db
+from ....app.api.deps import get_current_identity, get_current_user_context_read
+from ....app.api.endpoints.projection import (
+    ProjectionQuery,
+    SensitivityQuery,
+    load_projection_inputs,
+    projection_job,
+    projection_response,
+    sensitivity_job,
+    sensitivity_response
+)
+from ....app.core.executor import projection_executor
+from ....app.core.identity_cache import UserIdentity
+from ....app.core.jobs import JobFunction, JobQueueFull, JobRecord, ProgressCallback, job_manager
+from ....app.core.montecarlo import (
+    DEFAULT_INFLATION_VOLATILITY,
+    DEFAULT_RETURN_VOLATILITY,
+    DEFAULT_SIMULATION_PATHS,
+    DEFAULT_SUCCESS_PROBABILITY
+)
+from ....app.core.projections import ProjectionInputs
+from ....app.core.sensitivity import SensitivityGrid
+
+router = APIRouter(route_class=InstrumentedRoute)
+
+# Return-rate rows of a sensitivity sweep computed per step; progress is reported after each
+JOB_SENSITIVITY_CHUNK_ROWS = 16
+
+JobResult = Union[schemas.projection.SensitivityResponse, schemas.projection.ProjectionResponse]
+
+# --- Job functions ---
+# The user's data is reduced to ProjectionInputs when the job is submitted, so jobs never touch
+# the database; their heavy parts still run on the projection executor.
+
+def sensitivity_sweep(inputs: ProjectionInputs, query: SensitivityQuery) -> JobFunction:
+    # Built (and its ranges validated) before the job is queued, so bad ranges are a 400 right away
+    sweep = sensitivity_job(inputs, query)
+    return_rates = sweep.kwargs["return_rates"]
+
+    def run(report_progress: ProgressCallback) -> schemas.projection.SensitivityResponse:
+        chunks = np.array_split(return_rates, ceil(len(return_rates) / JOB_SENSITIVITY_CHUNK_ROWS))
+        retirement_ages = []
+        for done, chunk in enumerate(chunks, start=1):
+            chunk_job = sweep._replace(
+                kwargs={**sweep.kwargs, "return_rates": chunk}, cost=sweep.cost * len(chunk) // len(return_rates)
+            )
+            retirement_ages.append(projection_executor.run(chunk_job).retirement_ages)
+            report_progress(done / len(chunks))
+        grid = SensitivityGrid(return_rates, sweep.kwargs["inflation_rates"], np.concatenate(retirement_ages, axis=1))
+        return sensitivity_response(grid)
+    return run
+
+def monte_carlo_run(inputs: ProjectionInputs, query: ProjectionQuery) -> JobFunction:
+    simulation = projection_job(inputs, query, max_paths=schemas.projection.MAX_JOB_SIMULATION_PATHS)
+
+    def run(report_progress: ProgressCallback) -> schemas.projection.ProjectionResponse:
+        return projection_response(query, projection_executor.run(simulation))
+    return run
+
+def _default(value, default):
+    return default if value is None else value
+
+def job_function(inputs: ProjectionInputs, job_in: schemas.projection.ProjectionJobCreate) -> JobFunction:
+    if isinstance(job_in, schemas.projection.SensitivityJobCreate):
+        return sensitivity_sweep(inputs, SensitivityQuery(
+            job_in.return_rate_min, job_in.return_rate_max, job_in.return_rate_steps,
+            job_in.inflation_rate_min, job_in.inflation_rate_max, job_in.inflation_rate_steps
+        ))
+    return monte_carlo_run(inputs, ProjectionQuery(
+        "montecarlo",
+        job_in.seed,
+        _default(job_in.paths, DEFAULT_SIMULATION_PATHS),
+        _default(job_in.success_probability, DEFAULT_SUCCESS_PROBABILITY),
+        _default(job_in.return_volatility, DEFAULT_RETURN_VOLATILITY),
+        _default(job_in.inflation_volatility, DEFAULT_INFLATION_VOLATILITY)
+    ))
+
+# --- Shared with the async router ---
+
+def submit_projection_job(
+    user_id: int, inputs: ProjectionInputs, job_in: schemas.projection.ProjectionJobCreate,
+    request: Request, response: Response
+) -> schemas.projection.ProjectionJobStatus:
+    fn = job_function(inputs, job_in)
+    try:
+        record = job_manager.submit(user_id, job_in.kind, fn)
+    except JobQueueFull:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many projection jobs are queued. Please retry later.",
+            headers={"Retry-After": "5"}
+        )
+    response.headers["Location"] = str(request.url_for("get_projection_job", job_id=record.id))
+    return job_status(record)
+
+def _timestamp(value: Optional[float]) -> Optional[datetime]:
+    return None if value is None else datetime.fromtimestamp(value, tz=timezone.utc)
+
+def job_status(record: JobRecord) -> schemas.projection.ProjectionJobStatus:
+    return schemas.projection.ProjectionJobStatus(
+        id=record.id,
+        kind=record.kind,
+        status=record.status,
+        progress=record.progress,
+        created_at=_timestamp(record.created_at),
+        finished_at=_timestamp(record.finished_at),
+        expires_at=_timestamp(record.expires_at),
+        error=record.error
+    )
+
+def find_job(job_id: str, user_id: int) -> JobRecord:
+    record = job_manager.get(job_id, user_id)
+    if record is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Projection job not found. Finished jobs are kept for a limited time."
+        )
+    return record
+
+def job_result(record: JobRecord) -> JobResult:
+    if record.status != "succeeded":
+        detail = f"Projection job failed: {record.error}" if record.status == "failed" else f"Projection job is {record.status}."
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=detail)
+    return record.result
+
+# --- Endpoints ---
+
+@router.post("", response_model=schemas.projection.ProjectionJobStatus, status_code=status.HTTP_202_ACCEPTED)
+@query_budget(1)
+def create_projection_job(
+    request: Request,
+    response: Response,
+    job_in: schemas.projection.ProjectionJobCreate = Body(..., discriminator="kind"),
+    db: Session = Depends(get_read_db),
+    db_user: models.user.User = Depends(get_current_user_context_read)
+) -> schemas.projection.ProjectionJobStatus:
+    """
+    Queue a large sensitivity sweep or Monte Carlo run on the background workers.
+    Poll the job at the returned Location until it has succeeded, then fetch `{location}/result`.
+    """
+    inputs = load_projection_inputs(db, db_user)
+    return submit_projection_job(db_user.id, inputs, job_in, request, response)
+
+@router.get("/{job_id}", response_model=schemas.projection.ProjectionJobStatus)
+@query_budget(1)
+def get_projection_job(
+    job_id: str,
+    identity: UserIdentity = Depends(get_current_identity)
+) -> schemas.projection.ProjectionJobStatus:
+    """Status and progress of one of the user's projection jobs."""
+    return job_status(find_job(job_id, identity.id))
+
+@router.get("/{job_id}/result", response_model=JobResult)
+@query_budget(1)
+def get_projection_job_result(
+    job_id: str,
+    identity: UserIdentity = Depends(get_current_identity)
+) -> JobResult:
+    """The result of a succeeded job (409 while it is queued or running, or if it failed)."""
+    return job_result(find_job(job_id, identity.id))
@@ -1,63 +1,100 @@
 from typing import List, Any
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from ....app import crud, models, schemas # Adjusted import path
-from ....app.database import get_db # Adjusted import path
-from ....app.auth import get_current_active_user # Adjusted import path
+from ....app.api.instrumentation import InstrumentedRoute
+from ....app.core.query_budget import query_budget
+from ....app.database import get_db, get_read_db # Adjusted import path
+from ....app.api.deps import current_data_version, get_current_identity
+from ....app.core.identity_cache import UserIdentity
+from ....app.api.bulk_import import (
+    BulkBody, bulk_import_summary, bulk_openapi_extra, iter_bulk_rows, read_bulk_body, validate_bulk_rows
+)
+from ....app.api.fast_json import RowSerializer, fast_json_enabled, fast_json_response
+from ....app.api.conditional import IF_NONE_MATCH_HEADER, entity_tag, if_none_match, not_modified, set_entity_tag
+from ....app.api.pagination import PageQuery, page_query, set_next_cursor
+from ....app.api.export import EXPORT_CHUNK_ROWS, encode_rows, export_format_query, export_response
 
-router = APIRouter()
+router = APIRouter(route_class=InstrumentedRoute)
+
+saving_rows = RowSerializer(schemas.saving.Saving) # Fast JSON path of the listing
 
 @router.post("/", response_model=schemas.saving.Saving, status_code=status.HTTP_201_CREATED)
+@query_budget(5)
 def create_saving_for_current_user(
     saving_in: schemas.saving.SavingCreate,
     db: Session = Depends(get_db),
-    current_user_stub: Any = Depends(get_current_active_user)
+    identity: UserIdentity = Depends(get_current_identity)
 ) -> models.saving.Saving:
     """
     Create a new saving entry for the currently authenticated user.
-    User ID is derived from the auth stub via email (temporary workaround).
-    """
-    user_email = current_user_stub.get("email")
-    if not user_email:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Could not validate credentials or extract user identifier from token stub"
-        )
-
-    db_user = crud.crud_user.get_user_by_email(db, email=user_email)
-    if not db_user:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Authenticated user not found in database."
-        )
+    The user is resolved from the auth stub by `get_current_identity`.
+    """
+    return crud.crud_saving.create_user_saving(db=db, saving=saving_in, user_id=identity.id)
 
-    return crud.crud_saving.create_user_saving(db=db, saving=saving_in, user_id=db_user.id)
+@router.post(
+    "/bulk",
+    response_model=schemas.bulk.BulkImportSummary,
+    status_code=status.HTTP_201_CREATED,
+    openapi_extra=bulk_openapi_extra("SavingCreate")
+)
+@query_budget(6)
+def bulk_create_savings_for_current_user(
+    body: BulkBody = Depends(read_bulk_body),
+    db: Session = Depends(get_db),
+    identity: UserIdentity = Depends(get_current_identity)
+) -> schemas.bulk.BulkImportSummary:
+    """
+    Import many saving entries at once, from a JSON array or from CSV (`Content-Type: text/csv`,
+    header `name,amount,frequency`). All rows are validated first; a single invalid row
+    fails the import with 422. Valid imports are written in one transaction.
+    Bodies over 5 MiB or 10,000 rows are refused with 413; the body is buffered, then parsed
+    and validated one row at a time.
+    """
+    savings = validate_bulk_rows(iter_bulk_rows(body), schemas.saving.SavingCreate)
+    inserted = crud.crud_saving.create_user_savings_bulk(db, savings, user_id=identity.id)
+    return bulk_import_summary(inserted, crud.crud_ledger_totals.get_projection_totals(db, user_id=identity.id))
 
 @router.get("/", response_model=List[schemas.saving.Saving])
+@query_budget(3)
 def read_savings_for_current_user(
-    db: Session = Depends(get_db),
-    skip: int = 0,
-    limit: int = 100,
-    current_user_stub: Any = Depends(get_current_active_user)
+    request: Request,
+    response: Response,
+    page: PageQuery = Depends(page_query),
+    db: Session = Depends(get_read_db),
+    identity: UserIdentity = Depends(get_current_identity),
+    fast_json: bool = Depends(fast_json_enabled)
 ) -> List[models.saving.Saving]:
     """
-    Retrieve savings for the currently authenticated user.
-    User ID is derived from the auth stub via email (temporary workaround).
+    Retrieve savings for the currently authenticated user, ordered by id.
+    Follow the X-Next-Cursor response header (as `cursor`) for the next page.
     """
-    user_email = current_user_stub.get("email")
-    if not user_email:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Could not validate credentials or extract user identifier from token stub"
-        )
-
-    db_user = crud.crud_user.get_user_by_email(db, email=user_email)
-    if not db_user:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Authenticated user not found in database."
-        )
-
-    savings = crud.crud_saving.get_savings_by_user(db, user_id=db_user.id, skip=skip, limit=limit)
+    # The version is read before the page: a write in between only makes the tag older than the
+    # page (a spurious full response later), never a stale page under a current tag.
+    etag = entity_tag(identity.id, current_data_version(db, identity), ("savings", page))
+    if if_none_match(request.headers.get(IF_NONE_MATCH_HEADER), etag):
+        return not_modified(etag)
+    savings = crud.crud_saving.get_savings_by_user(
+        db, user_id=identity.id, skip=page.skip, limit=page.limit, after_id=page.after_id
+    )
+    set_next_cursor(response, savings, page.limit)
+    set_entity_tag(response, etag)
+    if fast_json:
+        return fast_json_response(saving_rows(savings), response)
     return savings
+
+@router.get("/export", response_class=StreamingResponse)
+@query_budget(2)
+def export_savings_for_current_user(
+    format: str = Depends(export_format_query),
+    db: Session = Depends(get_read_db),
+    identity: UserIdentity = Depends(get_current_identity)
+) -> StreamingResponse:
+    """
+    Stream all of the user's savings as NDJSON or CSV. Rows are fetched and encoded in batches,
+    so memory stays flat regardless of how many rows the user has.
+    """
+    rows = crud.crud_saving.iter_saving_rows_by_user(db, user_id=identity.id, batch_size=EXPORT_CHUNK_ROWS)
+    return export_response(encode_rows(rows, crud.crud_saving.EXPORT_COLUMNS, format), format, "savings")
@@ -3,14 +3,18 @@ from sqlalchemy.orm import Session
 from typing import Any # For current_user type hint flexibility
 
 from ....app import schemas # Adjusted import path
+from ....app.api.instrumentation import InstrumentedRoute
+from ....app.core.identity_cache import identity_cache
+from ....app.core.query_budget import query_budget
 from ....app import crud # Adjusted import path
 from ....app import models # Adjusted import path
-from ....app.database import get_db # Adjusted import path
+from ....app.database import get_db, get_read_db # Adjusted import path
 from ....app.auth import get_current_active_user # Adjusted import path
 
-router = APIRouter()
+router = APIRouter(route_class=InstrumentedRoute)
 
 @router.post("/profile", response_model=schemas.user.User, status_code=status.HTTP_201_CREATED)
+@query_budget(5)
 def create_or_update_user_profile(
     user_in: schemas.user.UserCreate,
     db: Session = Depends(get_db)
@@ -39,11 +43,14 @@ def create_or_update_user_profile(
 
     # If no existing user, create new user
     created_user = crud.crud_user.create_user(db=db, user=user_in)
+    # Identities cached for this email belong to an earlier account (e.g. a recreated one)
+    identity_cache.invalidate_email(created_user.email)
     return created_user
 
 @router.get("/profile", response_model=schemas.user.User)
+@query_budget(1)
 def read_user_profile(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     # The `get_current_active_user` stub returns a dict: {"username": "fakeuser", "email": "fakeuser@example.com", ...}
     # We need to simulate fetching a user based on this.
     # For a real app, `get_current_active_user` would return a `models.user.User` instance
@@ -0,0 +1,9 @@
+# This file makes the 'endpoints_async' directory a Python package.
+# `async def` versions of the routers in app/api/endpoints, served on the async engine
+# (app/database_async.py) when settings.use_async_db is enabled. Paths and schemas are identical.
+from .user import router as user_router
+from .expense import router as expense_router
+from .saving import router as saving_router
+from .assumption import router as assumption_router
+from .projection import router as projection_router
+from .projection_jobs import router as projection_jobs_router
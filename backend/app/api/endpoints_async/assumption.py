@@ -0,0 +1,40 @@
+from typing import Any
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ....app import models, schemas
+from ....app.api.instrumentation import InstrumentedRoute
+from ....app.core.query_budget import query_budget
+from ....app.crud import async_crud
+from ....app.database_async import get_async_db
+from ....app.api.deps_async import get_current_identity_async, get_current_user_context_async
+from ....app.core.identity_cache import UserIdentity
+
+router = APIRouter(route_class=InstrumentedRoute)
+
+@router.get("/", response_model=schemas.assumption.Assumption)
+@query_budget(1)
+async def read_user_assumptions(
+    db_user: models.user.User = Depends(get_current_user_context_async)
+) -> Any:
+    """
+    Retrieve the assumptions for the currently authenticated user (loaded with the user: 1 query).
+    """
+    if not db_user.assumption:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Assumptions not found for this user. Please create them first."
+        )
+    return db_user.assumption
+
+@router.post("/", response_model=schemas.assumption.Assumption, status_code=status.HTTP_200_OK)
+@query_budget(5)
+async def create_or_update_user_assumptions_endpoint(
+    assumption_in: schemas.assumption.AssumptionCreate,
+    db: AsyncSession = Depends(get_async_db),
+    identity: UserIdentity = Depends(get_current_identity_async)
+) -> models.assumption.Assumption:
+    """
+    Create or update assumptions for the currently authenticated user.
+    """
+    return await async_crud.create_or_update_user_assumption(db=db, assumption_in=assumption_in, user_id=identity.id)
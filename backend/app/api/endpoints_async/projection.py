@@ -0,0 +1,138 @@
+from typing import Union
+
+from fastapi import APIRouter, Depends, Request, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ....app import models, schemas
+from ....app.api.instrumentation import InstrumentedRoute
+from ....app.core.query_budget import query_budget
+from ....app.database_async import get_async_db
+from ....app.api.conditional import IF_NONE_MATCH_HEADER, if_none_match, not_modified, set_entity_tag
+from ....app.api.deps_async import (
+    current_data_version_async,
+    get_current_identity_async,
+    get_current_user_context_async,
+    load_user_context_async
+)
+from ....app.api.endpoints.projection import ( # Query parsing and response building are shared with the sync router
+    GoalSeekQuery,
+    ProjectionQuery,
+    SensitivityQuery,
+    TimelineQuery,
+    build_goal_seek_response,
+    build_timeline_response,
+    cache_projection_response,
+    goal_seek_query,
+    load_projection_inputs,
+    projection_cache_key,
+    projection_etag,
+    projection_job,
+    projection_query,
+    projection_response,
+    projection_variant,
+    run_projection_job_async,
+    sensitivity_content,
+    sensitivity_job,
+    sensitivity_query,
+    sensitivity_response,
+    timeline_query,
+)
+from ....app.core.cache import projection_cache
+from ....app.core.identity_cache import UserIdentity
+from ....app.core.projections import ProjectionInputs
+from ....app.api.fast_json import fast_json_enabled, fast_json_response
+from ....app.api.export import encode_rows, export_format_query, export_response
+
+router = APIRouter(route_class=InstrumentedRoute)
+
+# Deterministic projections and goal seeks take well under a millisecond and run on the event
+# loop. Monte Carlo simulations and sensitivity grids go through the projection executor, which
+# sends the CPU-heavy ones to its pool so they never stall other requests.
+
+@router.get("/", response_model=schemas.projection.ProjectionResponse)
+@query_budget(3)
+async def get_retirement_projections(
+    request: Request,
+    response: Response,
+    query: ProjectionQuery = Depends(projection_query),
+    db: AsyncSession = Depends(get_async_db),
+    identity: UserIdentity = Depends(get_current_identity_async)
+) -> schemas.projection.ProjectionResponse:
+    """
+    Calculate and return retirement projections for different lifestyles.
+    """
+    variant = projection_variant(identity.age, query)
+    if variant is not None:
+        data_version = await current_data_version_async(db, identity)
+        etag = projection_etag(identity.id, data_version, variant)
+        if IF_NONE_MATCH_HEADER in request.headers and if_none_match(request.headers[IF_NONE_MATCH_HEADER], etag):
+            return not_modified(etag)
+        cached_response = projection_cache.get(projection_cache_key(identity.id, data_version, variant))
+        if cached_response is not None:
+            set_entity_tag(response, etag)
+            return cached_response
+
+    db_user = await load_user_context_async(db, identity)
+    inputs = await db.run_sync(load_projection_inputs, db_user)
+    projections = projection_response(query, await run_projection_job_async(projection_job(inputs, query)))
+    if variant is not None:
+        cache_projection_response(response, db_user, query, projections)
+    return projections
+
+@router.get("/goal", response_model=schemas.projection.GoalSeekResponse)
+@query_budget(1)
+async def get_goal_seek_projection(
+    query: GoalSeekQuery = Depends(goal_seek_query),
+    db: AsyncSession = Depends(get_async_db),
+    db_user: models.user.User = Depends(get_current_user_context_async)
+) -> schemas.projection.GoalSeekResponse:
+    """
+    How much more does the user need to save to retire at `target_age`?
+    """
+    inputs = await db.run_sync(load_projection_inputs, db_user)
+    return build_goal_seek_response(inputs, query)
+
+@router.get("/sensitivity", response_model=schemas.projection.SensitivityResponse)
+@query_budget(1)
+async def get_sensitivity_grid(
+    query: SensitivityQuery = Depends(sensitivity_query),
+    db: AsyncSession = Depends(get_async_db),
+    db_user: models.user.User = Depends(get_current_user_context_async),
+    fast_json: bool = Depends(fast_json_enabled)
+) -> schemas.projection.SensitivityResponse:
+    """
+    Retirement age per lifestyle over a return-rate x inflation-rate surface.
+    """
+    inputs = await db.run_sync(load_projection_inputs, db_user)
+    grid = await run_projection_job_async(sensitivity_job(inputs, query))
+    if fast_json:
+        return fast_json_response(sensitivity_content(grid))
+    return sensitivity_response(grid)
+
+@router.get("/inputs", response_class=StreamingResponse)
+@query_budget(1)
+async def export_projection_inputs(
+    format: str = Depends(export_format_query),
+    db: AsyncSession = Depends(get_async_db),
+    db_user: models.user.User = Depends(get_current_user_context_async)
+) -> StreamingResponse:
+    """
+    The numbers the projection engines run on as one NDJSON or CSV record.
+    """
+    inputs = await db.run_sync(load_projection_inputs, db_user)
+    return export_response(encode_rows([tuple(inputs)], ProjectionInputs._fields, format), format, "projection_inputs")
+
+@router.get("/timeline", response_model=schemas.projection.TimelinePage)
+@query_budget(1)
+async def get_projection_timeline(
+    query: TimelineQuery = Depends(timeline_query),
+    db: AsyncSession = Depends(get_async_db),
+    db_user: models.user.User = Depends(get_current_user_context_async),
+    fast_json: bool = Depends(fast_json_enabled)
+) -> Union[schemas.projection.TimelinePage, StreamingResponse]:
+    """
+    Year-by-year balance, contribution and expenses for one lifestyle, paginated or streamed.
+    """
+    inputs = await db.run_sync(load_projection_inputs, db_user)
+    return build_timeline_response(inputs, query, fast_json)
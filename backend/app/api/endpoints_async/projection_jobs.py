@@ -0,0 +1,52 @@
+from fastapi import APIRouter, Body, Depends, Request, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ....app import models, schemas
+from ....app.api.instrumentation import InstrumentedRoute
+from ....app.core.query_budget import query_budget
+from ....app.database_async import get_async_db
+from ....app.api.deps_async import get_current_identity_async, get_current_user_context_async
+from ....app.api.endpoints.projection import load_projection_inputs
+from ....app.api.endpoints.projection_jobs import ( # Job functions and bookkeeping are shared with the sync router
+    JobResult,
+    find_job,
+    job_result,
+    job_status,
+    submit_projection_job
+)
+from ....app.core.identity_cache import UserIdentity
+
+router = APIRouter(route_class=InstrumentedRoute)
+
+@router.post("", response_model=schemas.projection.ProjectionJobStatus, status_code=status.HTTP_202_ACCEPTED)
+@query_budget(1)
+async def create_projection_job(
+    request: Request,
+    response: Response,
+    job_in: schemas.projection.ProjectionJobCreate = Body(..., discriminator="kind"),
+    db: AsyncSession = Depends(get_async_db),
+    db_user: models.user.User = Depends(get_current_user_context_async)
+) -> schemas.projection.ProjectionJobStatus:
+    """
+    Queue a large sensitivity sweep or Monte Carlo run on the background workers.
+    """
+    inputs = await db.run_sync(load_projection_inputs, db_user)
+    return submit_projection_job(db_user.id, inputs, job_in, request, response)
+
+@router.get("/{job_id}", response_model=schemas.projection.ProjectionJobStatus)
+@query_budget(1)
+async def get_projection_job(
+    job_id: str,
+    identity: UserIdentity = Depends(get_current_identity_async)
+) -> schemas.projection.ProjectionJobStatus:
+    """Status and progress of one of the user's projection jobs."""
+    return job_status(find_job(job_id, identity.id))
+
+@router.get("/{job_id}/result", response_model=JobResult)
+@query_budget(1)
+async def get_projection_job_result(
+    job_id: str,
+    identity: UserIdentity = Depends(get_current_identity_async)
+) -> JobResult:
+    """The result of a succeeded job (409 while it is queued or running, or if it failed)."""
+    return job_result(find_job(job_id, identity.id))
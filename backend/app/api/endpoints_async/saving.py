@@ -0,0 +1,93 @@
+from typing import List
+from fastapi import APIRouter, Depends, Request, Response, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ....app import crud, models, schemas
+from ....app.api.instrumentation import InstrumentedRoute
+from ....app.core.query_budget import query_budget
+from ....app.crud import async_crud
+from ....app.database_async import get_async_db
+from ....app.api.endpoints.saving import saving_rows
+from ....app.api.deps_async import current_data_version_async, get_current_identity_async
+from ....app.core.identity_cache import UserIdentity
+from ....app.api.bulk_import import (
+    BulkBody, bulk_import_summary, bulk_openapi_extra, iter_bulk_rows, read_bulk_body, validate_bulk_rows
+)
+from ....app.api.fast_json import fast_json_enabled, fast_json_response
+from ....app.api.conditional import IF_NONE_MATCH_HEADER, entity_tag, if_none_match, not_modified, set_entity_tag
+from ....app.api.pagination import PageQuery, page_query, set_next_cursor
+from ....app.api.export import EXPORT_CHUNK_ROWS, encode_rows_async, export_format_query, export_response
+
+router = APIRouter(route_class=InstrumentedRoute)
+
+@router.post("/", response_model=schemas.saving.Saving, status_code=status.HTTP_201_CREATED)
+@query_budget(5)
+async def create_saving_for_current_user(
+    saving_in: schemas.saving.SavingCreate,
+    db: AsyncSession = Depends(get_async_db),
+    identity: UserIdentity = Depends(get_current_identity_async)
+) -> models.saving.Saving:
+    """
+    Create a new saving entry for the currently authenticated user.
+    """
+    return await async_crud.create_user_saving(db=db, saving=saving_in, user_id=identity.id)
+
+@router.post(
+    "/bulk",
+    response_model=schemas.bulk.BulkImportSummary,
+    status_code=status.HTTP_201_CREATED,
+    openapi_extra=bulk_openapi_extra("SavingCreate")
+)
+@query_budget(5)
+async def bulk_create_savings_for_current_user(
+    body: BulkBody = Depends(read_bulk_body),
+    db: AsyncSession = Depends(get_async_db),
+    identity: UserIdentity = Depends(get_current_identity_async)
+) -> schemas.bulk.BulkImportSummary:
+    """
+    Import many saving entries at once, from a JSON array or CSV, in one transaction.
+    """
+    # Parsing and validating thousands of rows is CPU work: keep it off the event loop
+    savings = await run_in_threadpool(validate_bulk_rows, iter_bulk_rows(body), schemas.saving.SavingCreate)
+    inserted = await async_crud.create_user_savings_bulk(db, savings, user_id=identity.id)
+    return bulk_import_summary(inserted, await async_crud.get_projection_totals(db, user_id=identity.id))
+
+@router.get("/", response_model=List[schemas.saving.Saving])
+@query_budget(3)
+async def read_savings_for_current_user(
+    request: Request,
+    response: Response,
+    page: PageQuery = Depends(page_query),
+    db: AsyncSession = Depends(get_async_db),
+    identity: UserIdentity = Depends(get_current_identity_async),
+    fast_json: bool = Depends(fast_json_enabled)
+) -> List[models.saving.Saving]:
+    """
+    Retrieve savings for the currently authenticated user, one keyset page at a time.
+    """
+    etag = entity_tag(identity.id, await current_data_version_async(db, identity), ("savings", page))
+    if if_none_match(request.headers.get(IF_NONE_MATCH_HEADER), etag):
+        return not_modified(etag)
+    savings = await async_crud.get_savings_by_user(
+        db, user_id=identity.id, skip=page.skip, limit=page.limit, after_id=page.after_id
+    )
+    set_next_cursor(response, savings, page.limit)
+    set_entity_tag(response, etag)
+    if fast_json:
+        return fast_json_response(saving_rows(savings), response)
+    return savings
+
+@router.get("/export", response_class=StreamingResponse)
+@query_budget(2)
+async def export_savings_for_current_user(
+    format: str = Depends(export_format_query),
+    db: AsyncSession = Depends(get_async_db),
+    identity: UserIdentity = Depends(get_current_identity_async)
+) -> StreamingResponse:
+    """
+    Stream all of the user's savings as NDJSON or CSV, in batches.
+    """
+    rows = await async_crud.stream_saving_rows_by_user(db, user_id=identity.id, batch_size=EXPORT_CHUNK_ROWS)
+    return export_response(encode_rows_async(rows, crud.crud_saving.EXPORT_COLUMNS, format), format, "savings")
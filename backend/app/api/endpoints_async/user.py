@@ -0,0 +1,50 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Any
+
+from ....app import models, schemas
+from ....app.api.instrumentation import InstrumentedRoute
+from ....app.core.identity_cache import identity_cache
+from ....app.core.query_budget import query_budget
+from ....app.crud import async_crud
+from ....app.database_async import get_async_db
+from ....app.auth import get_current_active_user
+from ....app.api.deps import email_from_user_stub
+
+router = APIRouter(route_class=InstrumentedRoute)
+
+@router.post("/profile", response_model=schemas.user.User, status_code=status.HTTP_201_CREATED)
+@query_budget(5)
+async def create_or_update_user_profile(
+    user_in: schemas.user.UserCreate,
+    db: AsyncSession = Depends(get_async_db)
+) -> models.user.User:
+    """
+    Create a new user profile, or return the existing one matching the Google ID or email.
+    """
+    db_user_by_google_id = await async_crud.get_user_by_google_id(db, google_id=user_in.google_id)
+    if db_user_by_google_id:
+        return db_user_by_google_id
+
+    db_user_by_email = await async_crud.get_user_by_email(db, email=user_in.email)
+    if db_user_by_email:
+        return db_user_by_email
+
+    created_user = await async_crud.create_user(db=db, user=user_in)
+    identity_cache.invalidate_email(created_user.email)
+    return created_user
+
+@router.get("/profile", response_model=schemas.user.User)
+@query_budget(1)
+async def read_user_profile(
+    db: AsyncSession = Depends(get_async_db),
+    current_user_stub: Any = Depends(get_current_active_user)
+) -> models.user.User:
+    """
+    Get current user's profile (resolved from the auth stub's email).
+    """
+    user_email = email_from_user_stub(current_user_stub)
+    db_user = await async_crud.get_user_by_email(db, email=user_email)
+    if db_user is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User profile not found for authenticated user.")
+    return db_user
@@ -0,0 +1,88 @@
+import csv
+import io
+import json
+from typing import Any, AsyncIterator, Iterable, Iterator, Literal, Sequence
+
+from fastapi import Query
+from fastapi.responses import StreamingResponse
+
+# Streaming encoders shared by the export endpoints (GET /user/expenses/export, ...).
+# Rows are encoded and sent EXPORT_CHUNK_ROWS at a time, so memory does not grow with the
+# number of rows exported.
+
+EXPORT_CHUNK_ROWS = 1000 # Rows per yielded chunk and per database fetch (yield_per)
+
+ExportFormat = Literal["ndjson", "csv"]
+EXPORT_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+def export_format_query(
+    format: ExportFormat = Query("ndjson", description="'ndjson' (one JSON object per line) or 'csv'")
+) -> str:
+    return format
+
+class _LineBuffer:
+    """Collects encoded rows and hands them out as one string per chunk."""
+    def __init__(self, columns: Sequence[str], format: str):
+        self.columns = columns
+        self.format = format
+        self._buffer = io.StringIO()
+        self._csv_writer = csv.writer(self._buffer, lineterminator="\n") if format == "csv" else None
+
+    def header(self) -> None:
+        if self._csv_writer is not None:
+            self._csv_writer.writerow(self.columns)
+
+    def add(self, row: Sequence[Any]) -> None:
+        if self._csv_writer is not None:
+            self._csv_writer.writerow(row)
+        else:
+            self._buffer.write(json.dumps(dict(zip(self.columns, row))))
+            self._buffer.write("\n")
+
+    def take(self) -> str:
+        chunk = self._buffer.getvalue()
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        return chunk
+
+def encode_rows(rows: Iterable[Sequence[Any]], columns: Sequence[str], format: str) -> Iterator[str]:
+    """Lazily encodes `rows` (tuples in `columns` order) as NDJSON or CSV (with a header line)."""
+    buffer = _LineBuffer(columns, format)
+    buffer.header()
+    pending = 0
+    for row in rows:
+        buffer.add(row)
+        pending += 1
+        if pending == EXPORT_CHUNK_ROWS:
+            yield buffer.take()
+            pending = 0
+    chunk = buffer.take()
+    if chunk:
+        yield chunk
+
+async def encode_rows_async(rows: AsyncIterator[Sequence[Any]], columns: Sequence[str], format: str) -> AsyncIterator[str]:
+    """encode_rows for an async row source (e.g. `AsyncSession.stream`)."""
+    buffer = _LineBuffer(columns, format)
+    buffer.header()
+    pending = 0
+    async for row in rows:
+        buffer.add(row)
+        pending += 1
+        if pending == EXPORT_CHUNK_ROWS:
+            yield buffer.take()
+            pending = 0
+    chunk = buffer.take()
+    if chunk:
+        yield chunk
+
+def export_response(chunks: Any, format: str, filename: str) -> StreamingResponse:
+    """
+    A StreamingResponse over `chunks` (a sync or async iterator of str).
+    The database session the rows come from stays open while the body is sent: dependencies
+    with `yield` are closed only after the response has been sent.
+    """
+    return StreamingResponse(
+        chunks,
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{format}"'}
+    )
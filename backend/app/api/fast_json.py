@@ -0,0 +1,58 @@
+import json
+from operator import attrgetter
+from typing import Any, Dict, Iterable, List, Optional, Type
+
+from fastapi import Request, Response
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError: # Optional: the json module is used instead
+    orjson = None
+
+# Opt-in fast path for the large JSON responses (ledger listings, sensitivity grids, timeline
+# pages), enabled with FAST_JSON=true. FastAPI normally validates an endpoint's return value
+# against its response_model, converts it with jsonable_encoder and dumps it with the json
+# module; for a 1000-row page that costs several times the query. On the fast path those
+# endpoints build plain dicts from data they produced themselves (ORM rows, engine results)
+# and return a FastJSONResponse, skipping both passes. The JSON is the same either way.
+
+def dumps(content: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson when it is installed."""
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+class RowSerializer:
+    """
+    Turns trusted ORM objects into the dicts `schema` (an orm_mode schema) would produce, reading
+    the schema's fields straight off each object: no validation, no jsonable_encoder.
+    Only for objects whose columns already have the schema's types.
+    """
+    def __init__(self, schema: Type[BaseModel]):
+        self.fields = tuple(schema.__fields__)
+        if len(self.fields) < 2:
+            raise ValueError("RowSerializer needs a schema with at least two fields")
+        self._values = attrgetter(*self.fields)
+
+    def __call__(self, rows: Iterable[Any]) -> List[Dict[str, Any]]:
+        fields, values = self.fields, self._values
+        return [dict(zip(fields, values(row))) for row in rows]
+
+async def fast_json_enabled(request: Request) -> bool:
+    """Dependency: whether this app serves the fast path (create_app's `fast_json`)."""
+    return getattr(request.app.state, "fast_json", False)
+
+def fast_json_response(content: Any, response: Optional[Response] = None) -> FastJSONResponse:
+    """FastJSONResponse of `content`, carrying the headers the endpoint set on its injected `response`."""
+    fast_response = FastJSONResponse(content)
+    if response is not None:
+        for name, value in response.headers.items():
+            if name != "content-length":
+                fast_response.headers[name] = value
+    return fast_response
@@ -0,0 +1,120 @@
+import asyncio
+import functools
+import time
+from typing import Any, Callable
+
+from fastapi.routing import APIRoute
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ..core.metrics import current_timings, observe_request, start_request_timings
+from ..core.query_budget import budget_of, report_queries
+
+# Request instrumentation: TimingMiddleware times every request and reports it; InstrumentedRoute
+# splits the time spent inside a route into compute (the endpoint function) and serialization
+# (validating and encoding its return value). Database time comes from the cursor hooks
+# registered in app/database.py. See app/core/metrics.py for where the numbers end up.
+
+SERVER_TIMING_HEADER = "Server-Timing"
+
+
+class TimingMiddleware:
+    """
+    Pure ASGI middleware (no BaseHTTPMiddleware task hop, streaming bodies pass through untouched).
+    Adds a Server-Timing header to every HTTP response and observes the request into the
+    latency histograms once the last body chunk has been sent. The header can only cover the time
+    up to the start of the response; for streamed bodies the histograms also include the streaming.
+    With `record_statements` (query debug mode) the request's statements are checked against the
+    route's query budget and for repeats once it completes.
+    """
+
+    def __init__(self, app: ASGIApp, record_statements: bool = False, excluded_paths: tuple = ("/metrics",)):
+        self.app = app
+        self.record_statements = record_statements
+        self.excluded_paths = excluded_paths
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in self.excluded_paths:
+            await self.app(scope, receive, send)
+            return
+
+        timings = start_request_timings(self.record_statements)
+        status_code = 500
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                MutableHeaders(scope=message).append(SERVER_TIMING_HEADER, timings.server_timing())
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            # The matched route is recorded in the scope by the router; label by its template
+            # (/user/expenses/{id}, not the concrete path) to keep the series count bounded.
+            route = scope.get("route")
+            route_path = getattr(route, "path", "unmatched")
+            observe_request(timings, scope["method"], route_path, status_code)
+            if timings.statements is not None:
+                budget = budget_of(route.endpoint) if isinstance(route, APIRoute) else None
+                report_queries(f"{scope['method']} {route_path}", budget, timings.statements)
+
+
+class InstrumentedRoute(APIRoute):
+    """
+    APIRoute that times its endpoint function. FastAPI runs the endpoint and then serializes the
+    result inside the same request handler, so everything from the endpoint's return to the
+    handler's return is serialization (response model validation, jsonable_encoder, JSON rendering).
+    """
+
+    def get_route_handler(self) -> Callable:
+        self.dependant.call = _timed_endpoint(self.dependant.call)
+        handler = super().get_route_handler()
+
+        @functools.wraps(handler)
+        async def timed_handler(request: Any) -> Any:
+            response = await handler(request)
+            timings = current_timings()
+            if timings is not None and timings.endpoint_returned is not None:
+                timings.serialization += time.perf_counter() - timings.endpoint_returned
+            return response
+
+        return timed_handler
+
+
+def _timed_endpoint(endpoint: Callable) -> Callable:
+    if getattr(endpoint, "__instrumented__", False):
+        return endpoint
+
+    def start():
+        timings = current_timings()
+        if timings is not None:
+            return timings, time.perf_counter(), timings.db
+        return None
+
+    def stop(started):
+        if started is not None:
+            timings, started_at, db_before = started
+            timings.endpoint_returned = time.perf_counter()
+            timings.compute += (timings.endpoint_returned - started_at) - (timings.db - db_before)
+
+    # Keep the coroutine / plain function distinction: FastAPI runs plain functions on the threadpool
+    if asyncio.iscoroutinefunction(endpoint):
+        @functools.wraps(endpoint)
+        async def timed(*args, **kwargs):
+            started = start()
+            try:
+                return await endpoint(*args, **kwargs)
+            finally:
+                stop(started)
+    else:
+        @functools.wraps(endpoint)
+        def timed(*args, **kwargs):
+            started = start()
+            try:
+                return endpoint(*args, **kwargs)
+            finally:
+                stop(started)
+    timed.__instrumented__ = True
+    return timed
@@ -0,0 +1,49 @@
+import base64
+import binascii
+import json
+from typing import Any, NamedTuple, Optional, Sequence
+
+from fastapi import HTTPException, Query, Response, status
+
+# Keyset (cursor) pagination for the ledger listings (GET /user/expenses/, GET /user/savings/).
+# A page is "the next `limit` rows after id X"; X travels as an opaque cursor so clients do not
+# build it themselves and the encoding can change later. The cursor for the next page is sent
+# in the X-Next-Cursor response header, and is absent on the last page.
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+class PageQuery(NamedTuple):
+    after_id: Optional[int]
+    skip: int
+    limit: int
+
+def encode_cursor(last_id: int) -> str:
+    payload = json.dumps({"after_id": last_id}, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+def decode_cursor(cursor: str) -> int:
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        after_id = payload["after_id"]
+    except (binascii.Error, ValueError, TypeError, KeyError):
+        after_id = None
+    if not isinstance(after_id, int) or isinstance(after_id, bool):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid pagination cursor.")
+    return after_id
+
+def page_query(
+    cursor: Optional[str] = Query(None, description=f"Opaque cursor from the {NEXT_CURSOR_HEADER} header of the previous page"),
+    skip: int = Query(
+        0, ge=0, deprecated=True,
+        description="Offset pagination: slower on deep pages. Applied after the cursor, if both are given"
+    ),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE)
+) -> PageQuery:
+    return PageQuery(None if cursor is None else decode_cursor(cursor), skip, limit)
+
+def set_next_cursor(response: Response, items: Sequence[Any], limit: int) -> None:
+    """Adds the cursor of the page after `items` (ordered by id) unless this page was the last one."""
+    if len(items) == limit:
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(items[-1].id)
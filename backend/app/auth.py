@@ -20,7 +20,6 @@ async def get_current_active_user(token: str = Depends(oauth2_scheme)):
     # For now, this is a stub. It doesn't validate the token or fetch a real user.
     # It merely simulates that a user is "authenticated" if a token is provided.
     # In a real scenario, you'd return a user model instance here.
-    print(f"Token received: {token}") # Temporary print for observation
     # Replace with actual user object/model instance later
     return {"username": "fakeuser", "email": "fakeuser@example.com", "is_active": True}
 
@@ -0,0 +1,119 @@
+import pickle
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, NamedTuple, Optional, Set, Tuple
+
+
+DEFAULT_PROJECTION_CACHE_ENTRIES = 4096
+DEFAULT_PROJECTION_CACHE_BYTES = 32 * 1024 * 1024 # 32 MiB
+
+# (user_id, data_version, variant): the variant distinguishes request parameters
+# (mode, seed, ...) that produce different results for the same data.
+ProjectionCacheKey = Tuple[int, int, Hashable]
+
+
+class CacheStats(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    size_bytes: int
+
+
+def _estimate_size(value: Any) -> int:
+    """Approximate memory footprint of a cached value (its pickled size)."""
+    return len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+class ProjectionCache:
+    """
+    Thread-safe LRU cache of computed projection results.
+
+    Keys carry the user's data version, which the CRUD write paths bump, so a write
+    never needs to touch the cache: the next read simply looks up a new key. Storing a
+    newer version for a user drops that user's older entries right away. Entries are
+    evicted least-recently-used first once either the entry count or the estimated
+    memory cap is exceeded.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_PROJECTION_CACHE_ENTRIES,
+        max_bytes: int = DEFAULT_PROJECTION_CACHE_BYTES,
+        sizeof: Callable[[Any], int] = _estimate_size
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._sizeof = sizeof
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[ProjectionCacheKey, Tuple[Any, int]]" = OrderedDict()
+        self._keys_by_user: Dict[int, Set[ProjectionCacheKey]] = {}
+        self._size_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: ProjectionCacheKey) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[0]
+
+    def put(self, key: ProjectionCacheKey, value: Any) -> None:
+        size = self._sizeof(value)
+        if size > self.max_bytes:
+            return # Would evict everything else and still not fit
+        user_id, data_version, _ = key
+        with self._lock:
+            # Older versions of this user's data can never be requested again.
+            for stale_key in [k for k in self._keys_by_user.get(user_id, ()) if k[1] < data_version]:
+                self._remove(stale_key)
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (value, size)
+            self._keys_by_user.setdefault(user_id, set()).add(key)
+            self._size_bytes += size
+            while len(self._entries) > self.max_entries or self._size_bytes > self.max_bytes:
+                oldest_key = next(iter(self._entries))
+                self._remove(oldest_key)
+                self._evictions += 1
+
+    def invalidate_user(self, user_id: int) -> None:
+        with self._lock:
+            for key in list(self._keys_by_user.get(user_id, ())):
+                self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_user.clear()
+            self._size_bytes = 0
+            self._hits = self._misses = self._evictions = 0
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                size_bytes=self._size_bytes
+            )
+
+    def _remove(self, key: ProjectionCacheKey) -> None:
+        # Caller holds the lock.
+        _, size = self._entries.pop(key)
+        self._size_bytes -= size
+        user_keys = self._keys_by_user.get(key[0])
+        if user_keys is not None:
+            user_keys.discard(key)
+            if not user_keys:
+                del self._keys_by_user[key[0]]
+
+
+# Process-wide cache used by the projection router.
+projection_cache = ProjectionCache()
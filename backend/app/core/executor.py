@@ -0,0 +1,150 @@
+import asyncio
+import os
+import threading
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Literal, NamedTuple, Optional
+
+
+ExecutorBackend = Literal["inline", "thread", "process"]
+
+# Work is estimated in simulated year-steps (years x lifestyle tiers x paths or grid cells).
+# The engines manage roughly 50-60 million per second, so the default threshold keeps inline
+# jobs at around 2 ms: deterministic projections and small sensitivity grids stay on the
+# request's own thread while Monte Carlo runs and large grids go to the pool.
+DEFAULT_INLINE_COST = 100_000
+# Offloaded jobs queued or running at once; further offloads are rejected (ExecutorSaturated).
+DEFAULT_MAX_QUEUE_DEPTH = 64
+
+
+class ProjectionJob(NamedTuple):
+    """
+    A unit of projection work. `fn` must be a module-level function and `kwargs` plain values,
+    NamedTuples or numpy arrays, so the job (and its result) can be pickled to a worker process.
+    """
+    fn: Callable[..., Any]
+    kwargs: Dict[str, Any]
+    cost: int
+
+
+class ExecutorStats(NamedTuple):
+    backend: str
+    in_flight: int
+    inline: int
+    offloaded: int
+    rejected: int
+
+
+class ExecutorSaturated(RuntimeError):
+    """Raised instead of queueing an offloaded job beyond `max_queue_depth`."""
+
+
+def _run_job(job: ProjectionJob) -> Any:
+    return job.fn(**job.kwargs)
+
+
+class ProjectionExecutor:
+    """
+    Runs projection jobs inline, on a thread pool or on a process pool.
+
+    Jobs cheaper than `inline_cost` always run inline: handing them to a pool would cost more
+    than computing them. The rest are submitted to the backend's pool, which is created on
+    first use with `workers` workers (default: one per CPU). The process pool sidesteps the
+    GIL, so heavy jobs never compete with request handling for the interpreter; the thread
+    pool only bounds how many of them run at once (numpy releases the GIL in its kernels).
+    Once `max_queue_depth` offloaded jobs are queued or running, further ones are rejected
+    with ExecutorSaturated rather than growing the queue (and every caller's latency).
+    """
+
+    def __init__(
+        self,
+        backend: ExecutorBackend = "thread",
+        workers: Optional[int] = None,
+        inline_cost: int = DEFAULT_INLINE_COST,
+        max_queue_depth: int = DEFAULT_MAX_QUEUE_DEPTH
+    ):
+        self._lock = threading.Lock()
+        self._pool: Optional[Executor] = None
+        self._in_flight = 0
+        self._inline = self._offloaded = self._rejected = 0
+        self.configure(backend, workers, inline_cost, max_queue_depth)
+
+    def configure(
+        self,
+        backend: ExecutorBackend = "thread",
+        workers: Optional[int] = None,
+        inline_cost: int = DEFAULT_INLINE_COST,
+        max_queue_depth: int = DEFAULT_MAX_QUEUE_DEPTH
+    ) -> None:
+        """Changes the settings; a running pool is shut down and recreated on the next offload."""
+        if backend not in ("inline", "thread", "process"):
+            raise ValueError(f"Unknown projection executor backend '{backend}'")
+        self.shutdown()
+        self.backend = backend
+        self.workers = workers or os.cpu_count() or 1
+        self.inline_cost = inline_cost
+        self.max_queue_depth = max_queue_depth
+
+    def runs_inline(self, job: ProjectionJob) -> bool:
+        return self.backend == "inline" or job.cost < self.inline_cost
+
+    def submit(self, job: ProjectionJob) -> Future:
+        """Hands `job` to the pool (regardless of its cost)."""
+        with self._lock:
+            if self._in_flight >= self.max_queue_depth:
+                self._rejected += 1
+                raise ExecutorSaturated(f"{self._in_flight} projection jobs are already queued or running")
+            if self._pool is None:
+                self._pool = self._create_pool()
+            self._in_flight += 1
+            self._offloaded += 1
+            pool = self._pool
+        try:
+            future = pool.submit(_run_job, job)
+        except BaseException:
+            self._job_done(None)
+            raise
+        future.add_done_callback(self._job_done)
+        return future
+
+    def run(self, job: ProjectionJob) -> Any:
+        """Runs `job` and returns its result, blocking the calling thread until it is done."""
+        if self.runs_inline(job):
+            self._count_inline()
+            return _run_job(job)
+        return self.submit(job).result()
+
+    async def run_async(self, job: ProjectionJob) -> Any:
+        """As `run`, but offloaded jobs are awaited without blocking the event loop."""
+        if self.runs_inline(job):
+            self._count_inline()
+            return _run_job(job)
+        return await asyncio.wrap_future(self.submit(job))
+
+    def stats(self) -> ExecutorStats:
+        with self._lock:
+            return ExecutorStats(self.backend, self._in_flight, self._inline, self._offloaded, self._rejected)
+
+    def shutdown(self) -> None:
+        """Waits for running jobs and releases the pool's workers."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True)
+
+    def _create_pool(self) -> Executor:
+        # Caller holds the lock.
+        if self.backend == "process":
+            return ProcessPoolExecutor(max_workers=self.workers)
+        return ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="projection")
+
+    def _count_inline(self) -> None:
+        with self._lock:
+            self._inline += 1
+
+    def _job_done(self, future: Optional[Future]) -> None:
+        with self._lock:
+            self._in_flight -= 1
+
+
+# Process-wide executor used by the projection routers; create_app applies the settings.
+projection_executor = ProjectionExecutor()
@@ -0,0 +1,161 @@
+import math
+from typing import Literal, NamedTuple, Optional
+
+from .growth import growth_factors
+from .projections import (
+    MAX_PROJECTION_YEARS,
+    _required_capital_curve,
+    _savings_trajectory,
+    calculate_retirement_projection,
+)
+
+
+# What the extra amount is added to:
+# - "annual_contribution": extra yearly saving, in today's dollars (inflates like other contributions)
+# - "lump_sum": extra amount added to current savings today
+GOAL_SEEK_MODES = Literal["annual_contribution", "lump_sum"]
+
+# Amounts are solved to the cent and always rounded up, so the answer is sufficient.
+GOAL_SEEK_RESOLUTION = 0.01
+MAX_BRACKET_EXPANSIONS = 40
+MAX_SECANT_STEPS = 20
+
+
+class GoalSeekResult(NamedTuple):
+    required_amount: Optional[float]          # Minimum extra amount; None if the target cannot be reached
+    projected_retirement_age: Optional[int]   # Retirement age once the extra amount is added
+    engine_evaluations: int                   # Projection engine passes used by the solver
+
+
+def solve_additional_savings(
+    current_age: int,
+    current_savings_total: float,
+    annual_savings_contribution: float,
+    base_annual_expenses: float,
+    investment_return_rate: float,
+    inflation_rate: float,
+    life_expectancy: int,
+    expense_multiplier: float,
+    target_retirement_age: int,
+    mode: GOAL_SEEK_MODES = "annual_contribution"
+) -> GoalSeekResult:
+    """
+    Finds the minimum extra saving needed to retire at or before `target_retirement_age`.
+
+    Savings at every candidate age are affine in the extra amount, so the feasibility margin
+    (best surplus of savings over required capital up to the target age) is a piecewise-linear,
+    non-decreasing function of it. The solver brackets the root by doubling, then applies
+    Illinois-style secant steps, which are exact as soon as both bracket ends lie on the same
+    linear piece; in practice this takes a handful of engine passes. The answer is rounded up
+    to the cent and confirmed with `calculate_retirement_projection`.
+
+    Args:
+        current_age .. expense_multiplier: As for `calculate_retirement_projection`.
+        target_retirement_age: Age by which the user wants to be able to retire.
+        mode: Whether the extra amount is an annual contribution or a one-off lump sum.
+
+    Returns:
+        A GoalSeekResult. `required_amount` is 0.0 if the user is already on track, and None if
+        the target is unreachable (e.g. an annual contribution cannot help when retiring today).
+
+    Raises:
+        ValueError: If the target age is outside the projection window, or the inputs fall
+            outside the range where the required-capital curve is valid.
+    """
+    if mode not in ("annual_contribution", "lump_sum"):
+        raise ValueError(f"Invalid mode: {mode}. Expected 'annual_contribution' or 'lump_sum'.")
+    horizon = life_expectancy - current_age
+    target_year = target_retirement_age - current_age
+    if target_year < 0 or target_year >= min(horizon, MAX_PROJECTION_YEARS):
+        raise ValueError(
+            f"Target retirement age must be between {current_age} and "
+            f"{current_age + min(horizon, MAX_PROJECTION_YEARS) - 1}."
+        )
+    desired_annual_expenses_today = base_annual_expenses * expense_multiplier
+    if (1 + investment_return_rate) <= 0 or desired_annual_expenses_today < 0:
+        raise ValueError("Goal seek requires investment_return_rate > -1 and non-negative expenses.")
+
+    inflation_growth = growth_factors(inflation_rate, horizon)
+    required_capital = _required_capital_curve(
+        desired_annual_expenses_today, inflation_growth, investment_return_rate
+    )
+    evaluations = 0
+
+    def margin(extra_amount: float) -> float:
+        # One forward pass of the engine up to the target year.
+        nonlocal evaluations
+        evaluations += 1
+        trajectory = _savings_trajectory(
+            current_savings_total + (extra_amount if mode == "lump_sum" else 0.0),
+            annual_savings_contribution + (extra_amount if mode == "annual_contribution" else 0.0),
+            inflation_growth,
+            investment_return_rate,
+            target_year + 1
+        )
+        return max(savings - required for savings, required in zip(trajectory, required_capital))
+
+    def projected_age(extra_amount: float) -> Optional[int]:
+        nonlocal evaluations
+        evaluations += 1
+        return calculate_retirement_projection(
+            current_age=current_age,
+            current_savings_total=current_savings_total + (extra_amount if mode == "lump_sum" else 0.0),
+            annual_savings_contribution=annual_savings_contribution + (extra_amount if mode == "annual_contribution" else 0.0),
+            base_annual_expenses=base_annual_expenses,
+            investment_return_rate=investment_return_rate,
+            inflation_rate=inflation_rate,
+            life_expectancy=life_expectancy,
+            expense_multiplier=expense_multiplier
+        )
+
+    baseline_age = projected_age(0.0)
+    if baseline_age is not None and baseline_age <= target_retirement_age:
+        return GoalSeekResult(0.0, baseline_age, evaluations)
+
+    # Bracket: low end is infeasible, high end feasible. Start from the target-year requirement.
+    low, low_margin = 0.0, margin(0.0)
+    high = max(required_capital[target_year], 1.0)
+    high_margin = margin(high)
+    expansions = 0
+    while high_margin < 0:
+        expansions += 1
+        if expansions > MAX_BRACKET_EXPANSIONS or high_margin <= low_margin:
+            # The extra amount does not move the margin (e.g. contributions when target is today).
+            return GoalSeekResult(None, baseline_age, evaluations)
+        low, low_margin = high, high_margin
+        high *= 2
+        high_margin = margin(high)
+
+    # Illinois secant steps on the piecewise-linear margin.
+    margin_tolerance = 1e-9 * max(required_capital[target_year], 1.0)
+    if low_margin >= 0:
+        high = low # Baseline sits exactly on the boundary; only the cent rounding is left.
+    retained_side = 0
+    for _ in range(MAX_SECANT_STEPS):
+        if high - low <= GOAL_SEEK_RESOLUTION:
+            break
+        candidate = high - high_margin * (high - low) / (high_margin - low_margin)
+        candidate = min(max(candidate, low), high)
+        candidate_margin = margin(candidate)
+        if abs(candidate_margin) <= margin_tolerance:
+            high = candidate # Root found; the cent rounding below absorbs the residual.
+            break
+        if candidate_margin > 0:
+            high, high_margin = candidate, candidate_margin
+            if retained_side == -1:
+                low_margin /= 2
+            retained_side = -1
+        else:
+            low, low_margin = candidate, candidate_margin
+            if retained_side == 1:
+                high_margin /= 2
+            retained_side = 1
+
+    required_amount = math.ceil(high / GOAL_SEEK_RESOLUTION) * GOAL_SEEK_RESOLUTION
+    # Confirm with the solver proper; step up by a cent if rounding left us on the boundary.
+    for _ in range(MAX_SECANT_STEPS):
+        age = projected_age(required_amount)
+        if age is not None and age <= target_retirement_age:
+            return GoalSeekResult(round(required_amount, 2), age, evaluations)
+        required_amount += GOAL_SEEK_RESOLUTION
+    return GoalSeekResult(None, baseline_age, evaluations)
@@ -0,0 +1,137 @@
+import math
+import threading
+from collections import OrderedDict
+from typing import NamedTuple, Tuple
+
+import numpy as np
+
+
+# Most users keep the default rates (AssumptionBase: 2% inflation, 7% return) and share a few
+# horizons (life expectancy - age), so the same growth factors are needed over and over.
+DEFAULT_GROWTH_TABLE_ENTRIES = 1024
+# Factors held across all tables; each costs about 40 bytes (a float object in the tuple, plus
+# 8 bytes in the array), so ~10 MiB
+DEFAULT_GROWTH_TABLE_FACTORS = 256 * 1024
+# Longest table kept: the longest horizon projections accept (schemas.assumption.MAX_LIFE_EXPECTANCY).
+# Longer tables are built for the caller but never cached.
+MAX_CACHED_PERIODS = 150
+
+GrowthTableKey = Tuple[float, int] # (rate, periods)
+
+
+class GrowthTable(NamedTuple):
+    """(1 + rate) ** k for k = 0 .. periods, as a tuple (for Python loops) and a read-only array."""
+    factors: Tuple[float, ...]
+    array: np.ndarray
+
+
+class GrowthTableStats(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    factors: int
+
+
+def growth_factor(rate: float, period: int) -> float:
+    """(1 + rate) ** period, infinite past the float range as in the tables."""
+    try:
+        return (1 + rate) ** period
+    except OverflowError:
+        return math.inf
+
+
+def _build_table(rate: float, periods: int) -> GrowthTable:
+    # Element by element with `**`, like the reference loop: the values are bit-identical to
+    # computing each factor where it is used (np.power and cumulative products can differ in
+    # the last bits).
+    growth_base = 1 + rate
+    factors = []
+    for k in range(periods + 1):
+        try:
+            factors.append(growth_base ** k)
+        except OverflowError:
+            # Past the float range the factors are infinite: no finite capital covers the expenses
+            factors += [math.inf] * (periods + 1 - k)
+            break
+    factors = tuple(factors)
+    array = np.array(factors, dtype=float)
+    array.flags.writeable = False
+    return GrowthTable(factors, array)
+
+
+class GrowthTableCache:
+    """
+    Thread-safe LRU cache of growth-factor tables keyed by (rate, periods), holding at most
+    `max_entries` tables and `max_factors` factors in total. Tables longer than
+    `max_cached_periods` are built for the caller but not cached. Tables are immutable, so
+    callers share them without copying. A table may be built twice by concurrent misses; both
+    copies hold the same values.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_GROWTH_TABLE_ENTRIES,
+        max_factors: int = DEFAULT_GROWTH_TABLE_FACTORS,
+        max_cached_periods: int = MAX_CACHED_PERIODS
+    ):
+        self.max_entries = max_entries
+        self.max_factors = max_factors
+        self.max_cached_periods = max_cached_periods
+        self._lock = threading.Lock()
+        self._tables: "OrderedDict[GrowthTableKey, GrowthTable]" = OrderedDict()
+        self._factors = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, rate: float, periods: int, store: bool = True) -> GrowthTable:
+        """
+        The table for `rate` over `periods`. With `store=False` a missing table is built but not
+        cached, for one-off rates (sensitivity sweeps) that would push the shared tables out.
+        """
+        key = (float(rate), periods)
+        with self._lock:
+            table = self._tables.get(key)
+            if table is not None:
+                self._tables.move_to_end(key)
+                self._hits += 1
+                return table
+            self._misses += 1
+        table = _build_table(*key)
+        if not store or periods > self.max_cached_periods:
+            return table
+        with self._lock:
+            if key not in self._tables:
+                self._tables[key] = table
+                self._factors += len(table.factors)
+            self._tables.move_to_end(key)
+            while len(self._tables) > self.max_entries or self._factors > self.max_factors:
+                _, evicted = self._tables.popitem(last=False)
+                self._factors -= len(evicted.factors)
+                self._evictions += 1
+        return table
+
+    def clear(self) -> None:
+        with self._lock:
+            self._tables.clear()
+            self._factors = 0
+            self._hits = self._misses = self._evictions = 0
+
+    def stats(self) -> GrowthTableStats:
+        with self._lock:
+            return GrowthTableStats(self._hits, self._misses, self._evictions, len(self._tables), self._factors)
+
+
+# Process-wide tables shared by the projection engines.
+growth_tables = GrowthTableCache()
+
+
+def growth_factors(rate: float, periods: int) -> Tuple[float, ...]:
+    """(1 + rate) ** k for k in range(periods + 1), from the shared tables."""
+    return growth_tables.get(rate, periods).factors
+
+
+def growth_array(rate: float, periods: int, store: bool = True) -> np.ndarray:
+    """growth_factors as a read-only float array."""
+    return growth_tables.get(rate, periods, store).array
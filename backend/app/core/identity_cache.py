@@ -0,0 +1,88 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, NamedTuple, Optional, Set, Tuple
+
+
+DEFAULT_IDENTITY_CACHE_ENTRIES = 10_000
+DEFAULT_IDENTITY_CACHE_TTL_SECONDS = 60.0
+
+
+class UserIdentity(NamedTuple):
+    """What most endpoints need to know about the authenticated user, without loading the User row."""
+    id: int
+    email: str
+    age: Optional[int]
+    is_active: bool
+
+
+class IdentityCache:
+    """
+    Thread-safe token -> UserIdentity cache, so that resolving the authenticated user costs
+    no query on a hit.
+
+    Entries expire `ttl_seconds` after they were stored (a deactivated user keeps access for
+    at most that long) and are evicted least-recently-used first beyond `max_entries`.
+    Profile writes drop every token of the affected email with `invalidate_email`.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_IDENTITY_CACHE_ENTRIES,
+        ttl_seconds: float = DEFAULT_IDENTITY_CACHE_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Tuple[UserIdentity, float]]" = OrderedDict()
+        self._tokens_by_email: Dict[str, Set[str]] = {}
+
+    def get(self, token: str) -> Optional[UserIdentity]:
+        with self._lock:
+            entry = self._entries.get(token)
+            if entry is None:
+                return None
+            identity, expires_at = entry
+            if self._clock() >= expires_at:
+                self._remove(token)
+                return None
+            self._entries.move_to_end(token)
+            return identity
+
+    def put(self, token: str, identity: UserIdentity) -> UserIdentity:
+        with self._lock:
+            if token in self._entries:
+                self._remove(token)
+            self._entries[token] = (identity, self._clock() + self.ttl_seconds)
+            self._tokens_by_email.setdefault(identity.email, set()).add(token)
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+        return identity
+
+    def invalidate_email(self, email: str) -> None:
+        with self._lock:
+            for token in list(self._tokens_by_email.get(email, ())):
+                self._remove(token)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._tokens_by_email.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remove(self, token: str) -> None:
+        # Caller holds the lock.
+        identity, _ = self._entries.pop(token)
+        tokens = self._tokens_by_email.get(identity.email)
+        if tokens is not None:
+            tokens.discard(token)
+            if not tokens:
+                del self._tokens_by_email[identity.email]
+
+
+# Process-wide cache used by the authentication dependencies (app/api/deps.py, deps_async.py).
+identity_cache = IdentityCache()
@@ -0,0 +1,235 @@
+import heapq
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List, Literal, NamedTuple, Optional, Tuple
+
+
+JobStatus = Literal["queued", "running", "succeeded", "failed"]
+
+DEFAULT_JOB_WORKERS = 2
+DEFAULT_MAX_PENDING_JOBS = 100
+DEFAULT_JOB_RESULT_TTL_SECONDS = 3600.0
+# Jobs (with their possibly large results) kept by InMemoryJobStore; the oldest finished ones
+# are dropped first, before their TTL, once there are more.
+DEFAULT_MAX_RETAINED_JOBS = 256
+
+# A job function receives a callback reporting its progress as a fraction in [0, 1]
+ProgressCallback = Callable[[float], None]
+JobFunction = Callable[[ProgressCallback], Any]
+
+
+class JobRecord(NamedTuple):
+    """Snapshot of a background job. Records are replaced, never mutated, so stores can persist them as values."""
+    id: str
+    user_id: int
+    kind: str
+    status: JobStatus
+    progress: float
+    created_at: float               # time.time()
+    finished_at: Optional[float] = None
+    expires_at: Optional[float] = None # Finished jobs (and their results) are dropped after this
+    result: Any = None
+    error: Optional[str] = None
+
+
+class JobQueueFull(RuntimeError):
+    """Raised instead of accepting a job beyond `max_pending` queued or running jobs."""
+
+
+class JobStore(ABC):
+    """
+    Where job records live. InMemoryJobStore keeps them in this process; a shared store (a
+    database table, a key-value store) implementing these methods lets several processes
+    serve the same jobs.
+    """
+
+    @abstractmethod
+    def put(self, record: JobRecord) -> None:
+        """Stores `record`, replacing any record with the same id."""
+
+    @abstractmethod
+    def get(self, job_id: str) -> Optional[JobRecord]:
+        """The record, or None if it is unknown or has expired."""
+
+    @abstractmethod
+    def delete(self, job_id: str) -> None:
+        """Drops the record, if any."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Drops every record."""
+
+
+class InMemoryJobStore(JobStore):
+    """
+    Thread-safe dict of records; expired records are dropped when read and whenever a record is
+    stored, found through a heap ordered by expiry so progress updates don't scan every record.
+    Beyond `max_records` the oldest finished records are dropped, expired or not.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.time, max_records: int = DEFAULT_MAX_RETAINED_JOBS):
+        self._clock = clock
+        self.max_records = max_records
+        self._lock = threading.Lock()
+        self._records: "OrderedDict[str, JobRecord]" = OrderedDict() # In submission order
+        # (expires_at, job_id) of stored records; entries of replaced or dropped records linger
+        # until popped or rebuilt away
+        self._expiry: List[Tuple[float, str]] = []
+
+    def put(self, record: JobRecord) -> None:
+        now = self._clock()
+        with self._lock:
+            self._records[record.id] = record
+            if record.expires_at is not None:
+                heapq.heappush(self._expiry, (record.expires_at, record.id))
+            self._drop_expired(now)
+            if len(self._records) > self.max_records:
+                self._drop_oldest_finished(len(self._records) - self.max_records)
+            if len(self._expiry) > 2 * max(len(self._records), self.max_records):
+                self._expiry = [(stored.expires_at, job_id) for job_id, stored in self._records.items() if stored.expires_at is not None]
+                heapq.heapify(self._expiry)
+
+    def get(self, job_id: str) -> Optional[JobRecord]:
+        with self._lock:
+            record = self._records.get(job_id)
+            if record is not None and _expired(record, self._clock()):
+                del self._records[job_id]
+                return None
+            return record
+
+    def delete(self, job_id: str) -> None:
+        with self._lock:
+            self._records.pop(job_id, None) # Its expiry entry, if any, is skipped when popped
+
+    def clear(self) -> None:
+        with self._lock:
+            self._records.clear()
+            self._expiry.clear()
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def _drop_expired(self, now: float) -> None:
+        # Caller holds the lock
+        while self._expiry and self._expiry[0][0] <= now:
+            expires_at, job_id = heapq.heappop(self._expiry)
+            stored = self._records.get(job_id)
+            if stored is not None and stored.expires_at == expires_at:
+                del self._records[job_id]
+
+    def _drop_oldest_finished(self, count: int) -> None:
+        # Caller holds the lock. Queued and running jobs are kept: JobManager's max_pending bounds them.
+        finished = []
+        for job_id, stored in self._records.items():
+            if len(finished) == count:
+                break
+            if stored.finished_at is not None:
+                finished.append(job_id)
+        for job_id in finished:
+            del self._records[job_id]
+
+
+def _expired(record: JobRecord, now: float) -> bool:
+    return record.expires_at is not None and now >= record.expires_at
+
+
+class JobManager:
+    """
+    Runs submitted job functions on a local thread pool (created on first use) and tracks them
+    in `store`: queued -> running -> succeeded / failed, with progress reported by the job.
+    Finished jobs keep their result (or error) for `result_ttl_seconds`, or until the in-memory
+    store holds more than `max_retained` jobs. At most `max_pending` jobs may be queued or
+    running at once; further submissions raise JobQueueFull.
+    """
+
+    def __init__(
+        self,
+        store: Optional[JobStore] = None,
+        workers: int = DEFAULT_JOB_WORKERS,
+        max_pending: int = DEFAULT_MAX_PENDING_JOBS,
+        result_ttl_seconds: float = DEFAULT_JOB_RESULT_TTL_SECONDS,
+        max_retained: int = DEFAULT_MAX_RETAINED_JOBS,
+        clock: Callable[[], float] = time.time
+    ):
+        self._lock = threading.Lock()
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._pending = 0
+        self._clock = clock
+        self.store = store if store is not None else InMemoryJobStore(clock)
+        self.configure(workers, max_pending, result_ttl_seconds, max_retained)
+
+    def configure(
+        self,
+        workers: int = DEFAULT_JOB_WORKERS,
+        max_pending: int = DEFAULT_MAX_PENDING_JOBS,
+        result_ttl_seconds: float = DEFAULT_JOB_RESULT_TTL_SECONDS,
+        max_retained: int = DEFAULT_MAX_RETAINED_JOBS
+    ) -> None:
+        """
+        Changes the settings; a running pool finishes its jobs and is recreated on the next
+        submission. `max_retained` applies to the default in-memory store.
+        """
+        self.shutdown()
+        self.workers = workers
+        self.max_pending = max_pending
+        self.result_ttl_seconds = result_ttl_seconds
+        if isinstance(self.store, InMemoryJobStore):
+            self.store.max_records = max_retained
+
+    def submit(self, user_id: int, kind: str, fn: JobFunction) -> JobRecord:
+        with self._lock:
+            if self._pending >= self.max_pending:
+                raise JobQueueFull(f"{self._pending} jobs are already queued or running")
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="job")
+            self._pending += 1
+            record = JobRecord(uuid.uuid4().hex, user_id, kind, "queued", 0.0, self._clock())
+            self.store.put(record)
+            try:
+                self._pool.submit(self._run, record, fn)
+            except BaseException:
+                # E.g. a pool shut down concurrently: the job never runs, so it must not count as pending
+                self._pending -= 1
+                self.store.delete(record.id)
+                raise
+        return record
+
+    def get(self, job_id: str, user_id: int) -> Optional[JobRecord]:
+        """The job, if it exists, has not expired and belongs to `user_id`."""
+        record = self.store.get(job_id)
+        return record if record is not None and record.user_id == user_id else None
+
+    def shutdown(self) -> None:
+        """Waits for queued and running jobs and releases the workers."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True)
+
+    def _run(self, record: JobRecord, fn: JobFunction) -> None:
+        record = record._replace(status="running")
+        self.store.put(record)
+
+        def report_progress(fraction: float) -> None:
+            nonlocal record
+            record = record._replace(progress=min(max(fraction, 0.0), 1.0))
+            self.store.put(record)
+
+        try:
+            result = fn(report_progress)
+        except Exception as e:
+            finished = record._replace(status="failed", error=str(e) or type(e).__name__)
+        else:
+            finished = record._replace(status="succeeded", progress=1.0, result=result)
+        now = self._clock()
+        self.store.put(finished._replace(finished_at=now, expires_at=now + self.result_ttl_seconds))
+        with self._lock:
+            self._pending -= 1
+
+
+# Process-wide job manager used by the projection job routers; create_app applies the settings.
+job_manager = JobManager()
@@ -0,0 +1,204 @@
+import threading
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .cache import projection_cache
+from .executor import projection_executor
+from .growth import growth_tables
+from .query_budget import QueryRecord
+
+# Per-request timings and process-wide latency histograms.
+#
+# The instrumentation middleware (app/api/instrumentation.py) starts a RequestTimings for every
+# request and stores it in a context variable. The context is copied into the threadpool workers
+# running sync endpoints / dependencies and into SQLAlchemy's async greenlets, so the database
+# hooks (app/database.py) and the route class all add to the same object. When the request ends
+# its timings are reported in the Server-Timing header and observed into the histograms below,
+# which GET /metrics renders in the Prometheus text format.
+
+# Upper bounds (seconds) of the latency buckets; +Inf is implicit
+LATENCY_BUCKETS: Tuple[float, ...] = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS: Tuple[float, ...] = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+
+class RequestTimings:
+    """
+    Accumulated time (seconds) of one request, by where it was spent:
+    - db: executing SQL statements (cursor execute to cursor execute returning), db_queries of them;
+    - compute: inside the endpoint function, minus the database time spent there;
+    - serialization: validating and encoding the endpoint's return value into the response body.
+    With `record_statements` every statement is also kept with its call site (query debug mode).
+    """
+    __slots__ = ("started", "db", "db_queries", "compute", "serialization", "endpoint_returned", "statements")
+
+    def __init__(self, record_statements: bool = False) -> None:
+        self.started = time.perf_counter()
+        self.db = 0.0
+        self.db_queries = 0
+        self.compute = 0.0
+        self.serialization = 0.0
+        self.endpoint_returned: Optional[float] = None # perf_counter() when the endpoint function returned
+        self.statements: Optional[List[QueryRecord]] = [] if record_statements else None
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    def server_timing(self) -> str:
+        """Server-Timing header value; durations in milliseconds."""
+        return ", ".join([
+            f'db;dur={self.db * 1000:.2f};desc="{self.db_queries} queries"',
+            f"compute;dur={self.compute * 1000:.2f}",
+            f"serialize;dur={self.serialization * 1000:.2f}",
+            f"total;dur={self.elapsed() * 1000:.2f}",
+        ])
+
+
+_current_timings: ContextVar[Optional[RequestTimings]] = ContextVar("request_timings", default=None)
+
+
+def start_request_timings(record_statements: bool = False) -> RequestTimings:
+    timings = RequestTimings(record_statements)
+    _current_timings.set(timings)
+    return timings
+
+
+def current_timings() -> Optional[RequestTimings]:
+    """Timings of the request being served, or None outside a request (scripts, tests without the middleware)."""
+    return _current_timings.get()
+
+
+class Histogram:
+    """Thread-safe cumulative histogram with one series per label set, as Prometheus expects."""
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str], buckets: Sequence[float]):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        # labels -> (per-bucket counts incl. +Inf, sum)
+        self._series: Dict[Tuple[str, ...], Tuple[List[int], List[float]]] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        bucket = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = ([0] * (len(self.buckets) + 1), [0.0])
+            series[0][bucket] += 1
+            series[1][0] += value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._series.clear()
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            series = sorted((labels, list(counts), total[0]) for labels, (counts, total) in self._series.items())
+        for labels, counts, total in series:
+            label_text = ",".join(f'{name}="{_escape(value)}"' for name, value in zip(self.label_names, labels))
+            separator = "," if label_text else ""
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else _format_number(bound)
+                lines.append(f'{self.name}_bucket{{{label_text}{separator}le="{le}"}} {cumulative}')
+            lines.append(f"{self.name}_sum{{{label_text}}} {_format_number(total)}")
+            lines.append(f"{self.name}_count{{{label_text}}} {cumulative}")
+        return lines
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_number(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+def _render_sample(name: str, documentation: str, kind: str, value: float) -> List[str]:
+    return [f"# HELP {name} {documentation}", f"# TYPE {name} {kind}", f"{name} {_format_number(value)}"]
+
+
+REQUEST_LABELS = ("method", "route", "status")
+
+request_duration = Histogram(
+    "http_request_duration_seconds", "Time from receiving the request to sending the last body chunk.",
+    REQUEST_LABELS, LATENCY_BUCKETS
+)
+request_db_duration = Histogram(
+    "http_request_db_seconds", "Time spent executing SQL statements per request.", REQUEST_LABELS, LATENCY_BUCKETS
+)
+request_db_queries = Histogram(
+    "http_request_db_queries", "SQL statements executed per request.", REQUEST_LABELS, QUERY_COUNT_BUCKETS
+)
+request_compute_duration = Histogram(
+    "http_request_compute_seconds", "Time spent in the endpoint function, excluding SQL.", REQUEST_LABELS, LATENCY_BUCKETS
+)
+request_serialization_duration = Histogram(
+    "http_request_serialization_seconds", "Time spent validating and encoding the response body.",
+    REQUEST_LABELS, LATENCY_BUCKETS
+)
+REQUEST_HISTOGRAMS = (
+    request_duration, request_db_duration, request_db_queries, request_compute_duration, request_serialization_duration
+)
+
+
+def observe_request(timings: RequestTimings, method: str, route: str, status: int) -> None:
+    labels = (method, route, str(status))
+    request_duration.observe(timings.elapsed(), *labels)
+    request_db_duration.observe(timings.db, *labels)
+    request_db_queries.observe(timings.db_queries, *labels)
+    request_compute_duration.observe(timings.compute, *labels)
+    request_serialization_duration.observe(timings.serialization, *labels)
+
+
+def _render_cache_stats() -> List[str]:
+    stats = projection_cache.stats()
+    return (
+        _render_sample("projection_cache_hits_total", "Projection cache lookups that found a result.", "counter", stats.hits)
+        + _render_sample("projection_cache_misses_total", "Projection cache lookups that found nothing.", "counter", stats.misses)
+        + _render_sample("projection_cache_evictions_total", "Projection results evicted by the size limits.", "counter", stats.evictions)
+        + _render_sample("projection_cache_entries", "Projection results currently cached.", "gauge", stats.entries)
+        + _render_sample("projection_cache_size_bytes", "Estimated memory held by cached projection results.", "gauge", stats.size_bytes)
+    )
+
+
+def _render_growth_table_stats() -> List[str]:
+    stats = growth_tables.stats()
+    return (
+        _render_sample("growth_table_hits_total", "Growth-factor table lookups served from the cache.", "counter", stats.hits)
+        + _render_sample("growth_table_misses_total", "Growth-factor tables computed on a lookup.", "counter", stats.misses)
+        + _render_sample("growth_table_evictions_total", "Growth-factor tables evicted by the entry limit.", "counter", stats.evictions)
+        + _render_sample("growth_table_entries", "Growth-factor tables currently cached.", "gauge", stats.entries)
+        + _render_sample("growth_table_factors", "Growth factors held by the cached tables.", "gauge", stats.factors)
+    )
+
+
+def _render_executor_stats() -> List[str]:
+    stats = projection_executor.stats()
+    return (
+        _render_sample("projection_jobs_in_flight", "Offloaded projection jobs queued or running.", "gauge", stats.in_flight)
+        + _render_sample("projection_jobs_inline_total", "Projection jobs run on the request's own worker.", "counter", stats.inline)
+        + _render_sample("projection_jobs_offloaded_total", "Projection jobs handed to the executor pool.", "counter", stats.offloaded)
+        + _render_sample("projection_jobs_rejected_total", "Projection jobs refused because the queue was full.", "counter", stats.rejected)
+    )
+
+
+def render_metrics() -> str:
+    """All histograms, the projection cache, growth table and executor statistics in the Prometheus text format (version 0.0.4)."""
+    lines: List[str] = []
+    for histogram in REQUEST_HISTOGRAMS:
+        lines += histogram.render()
+    lines += _render_cache_stats()
+    lines += _render_growth_table_stats()
+    lines += _render_executor_stats()
+    return "\n".join(lines) + "\n"
+
+
+def reset_metrics() -> None:
+    for histogram in REQUEST_HISTOGRAMS:
+        histogram.clear()
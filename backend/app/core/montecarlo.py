@@ -0,0 +1,165 @@
+from typing import NamedTuple, Optional, Sequence
+
+import numpy as np
+
+from .projections import MAX_PROJECTION_YEARS, NO_RETIREMENT_AGE
+
+
+DEFAULT_SIMULATION_PATHS = 10_000
+MAX_SIMULATION_PATHS = 100_000
+DEFAULT_RETURN_VOLATILITY = 0.15     # Standard deviation of annual investment returns
+DEFAULT_INFLATION_VOLATILITY = 0.01  # Standard deviation of annual inflation
+DEFAULT_SUCCESS_PROBABILITY = 0.9    # A tier "can retire" at the first age reaching this probability
+
+# Sampled annual returns are clipped here so savings can never flip sign in a single year,
+# which keeps the required-capital recurrence valid on every path.
+MIN_SIMULATED_RETURN = -0.95
+
+# Paths are simulated in chunks to bound peak memory (each chunk holds a few
+# (paths x years) float64 matrices). A given seed reproduces the same results.
+SIMULATION_CHUNK_PATHS = 10_000
+
+
+class MonteCarloProjection(NamedTuple):
+    candidate_ages: np.ndarray         # (years,) ages at which retirement was evaluated
+    success_probabilities: np.ndarray  # (tiers, years) fraction of paths that never run out of money
+    retirement_ages: np.ndarray        # (tiers,) first age reaching the success threshold, or NO_RETIREMENT_AGE
+
+
+def _success_counts_for_chunk(
+    rng: np.random.Generator,
+    paths: int,
+    horizon: int,
+    candidate_years: int,
+    current_savings_total: float,
+    annual_savings_contribution: float,
+    base_annual_expenses: float,
+    investment_return_rate: float,
+    inflation_rate: float,
+    return_volatility: float,
+    inflation_volatility: float,
+    multipliers: np.ndarray
+) -> np.ndarray:
+    """
+    Simulates `paths` return/inflation paths and counts, per tier and candidate year,
+    how many paths can retire in that year and never run out of money.
+    """
+    # Matrices are stored year-major (years x paths) so each per-year slice is contiguous.
+    # Draw order is fixed (returns, then inflation) so a seed reproduces the same paths.
+    returns = rng.normal(investment_return_rate, return_volatility, size=(horizon + 1, paths))
+    np.maximum(returns, MIN_SIMULATED_RETURN, out=returns)
+    return_growth = 1 + returns
+    inflation = rng.normal(inflation_rate, inflation_volatility, size=(horizon, paths))
+
+    # Cumulative price index per path: price_index[t] = prod_{k < t} (1 + inflation[k])
+    price_index = np.empty((horizon + 1, paths))
+    price_index[0] = 1.0
+    np.cumprod(1 + inflation, axis=0, out=price_index[1:])
+
+    # Forward pass: savings at the start of each candidate year (same accrual order as the
+    # deterministic engine: grow, then add this year's inflated contribution).
+    savings = np.empty((candidate_years, paths))
+    savings[0] = current_savings_total
+    for year in range(candidate_years - 1):
+        savings[year + 1] = savings[year] * return_growth[year] + annual_savings_contribution * price_index[year]
+
+    # Backward pass: capital required at the start of each year to fund base expenses
+    # until life expectancy on that path (tiers scale it linearly).
+    required = np.empty((candidate_years, paths))
+    running_requirement = np.zeros(paths)
+    for year in range(horizon, -1, -1):
+        running_requirement = base_annual_expenses * price_index[year] + running_requirement / return_growth[year]
+        if year < candidate_years:
+            required[year] = running_requirement
+
+    counts = np.empty((multipliers.size, candidate_years), dtype=np.int64)
+    for tier, multiplier in enumerate(multipliers):
+        counts[tier] = np.count_nonzero(savings >= multiplier * required, axis=1)
+    return counts
+
+
+def simulate_retirement_projections(
+    current_age: int,
+    current_savings_total: float,
+    annual_savings_contribution: float,
+    base_annual_expenses: float,
+    investment_return_rate: float,
+    inflation_rate: float,
+    life_expectancy: int,
+    expense_multipliers: Sequence[float],
+    paths: int = DEFAULT_SIMULATION_PATHS,
+    return_volatility: float = DEFAULT_RETURN_VOLATILITY,
+    inflation_volatility: float = DEFAULT_INFLATION_VOLATILITY,
+    success_probability: float = DEFAULT_SUCCESS_PROBABILITY,
+    seed: Optional[int] = None,
+    max_paths: int = MAX_SIMULATION_PATHS
+) -> MonteCarloProjection:
+    """
+    Stochastic counterpart of `calculate_retirement_projections_batch`.
+
+    Annual investment returns and inflation are drawn independently from normal distributions
+    centred on `investment_return_rate` / `inflation_rate`, giving a (paths x years) matrix per
+    chunk. For each candidate age the engine reports the fraction of paths on which retiring at
+    that age never runs out of money before life expectancy. Each path is evaluated with one
+    vectorized forward (savings) and one backward (required capital) pass, so the cost is
+    O(paths x years) regardless of the number of candidate ages.
+
+    Args:
+        current_age .. life_expectancy: As for `calculate_retirement_projection`
+            (rates are the means of the sampled distributions).
+        expense_multipliers: Lifestyle multipliers, evaluated on the same simulated paths.
+        paths: Number of simulated paths (1 .. max_paths).
+        return_volatility: Standard deviation of annual returns.
+        inflation_volatility: Standard deviation of annual inflation.
+        success_probability: Threshold used to pick each tier's retirement age.
+        seed: Seed for reproducible results; None draws fresh entropy.
+        max_paths: Upper bound on `paths`; background jobs allow more than requests do.
+
+    Returns:
+        A MonteCarloProjection; arrays are empty if current_age >= life_expectancy.
+    """
+    if not 1 <= paths <= max_paths:
+        raise ValueError(f"paths must be between 1 and {max_paths}.")
+    if return_volatility < 0 or inflation_volatility < 0:
+        raise ValueError("Volatilities must be non-negative.")
+
+    multipliers = np.asarray(expense_multipliers, dtype=float)
+    horizon = life_expectancy - current_age
+    candidate_years = max(min(horizon, MAX_PROJECTION_YEARS), 0)
+    if candidate_years == 0:
+        return MonteCarloProjection(
+            candidate_ages=np.empty(0, dtype=np.int64),
+            success_probabilities=np.empty((multipliers.size, 0)),
+            retirement_ages=np.full(multipliers.shape, NO_RETIREMENT_AGE, dtype=np.int64)
+        )
+
+    rng = np.random.default_rng(seed)
+    success_counts = np.zeros((multipliers.size, candidate_years), dtype=np.int64)
+    for chunk_start in range(0, paths, SIMULATION_CHUNK_PATHS):
+        success_counts += _success_counts_for_chunk(
+            rng,
+            min(SIMULATION_CHUNK_PATHS, paths - chunk_start),
+            horizon,
+            candidate_years,
+            current_savings_total,
+            annual_savings_contribution,
+            base_annual_expenses,
+            investment_return_rate,
+            inflation_rate,
+            return_volatility,
+            inflation_volatility,
+            multipliers
+        )
+
+    probabilities = success_counts / paths
+    reaches_threshold = probabilities >= success_probability
+    retirement_ages = np.where(
+        reaches_threshold.any(axis=1),
+        current_age + reaches_threshold.argmax(axis=1),
+        NO_RETIREMENT_AGE
+    ).astype(np.int64)
+    return MonteCarloProjection(
+        candidate_ages=current_age + np.arange(candidate_years),
+        success_probabilities=probabilities,
+        retirement_ages=retirement_ages
+    )
@@ -1,4 +1,8 @@
-from typing import List, Union, Literal, Optional, Dict # Ensure Optional and Dict are imported
+from typing import List, Union, Literal, Optional, Dict, Sequence, NamedTuple, Tuple, Iterator # Ensure Optional and Dict are imported
+
+import math
+
+import numpy as np
 # It's better to import the specific models if they are type-hinted in function signatures
 # to avoid potential circular dependencies if models also import from core.
 # For now, we'll use string forward references or import them if direct usage is needed.
@@ -12,6 +16,7 @@ from typing import List, Union, Literal, Optional, Dict # Ensure Optional and Di
 # to be imported by the model files themselves.
 from ..models.expense import Expense
 from ..models.saving import Saving
+from .growth import growth_factor, growth_factors
 
 
 VALID_FREQUENCIES = Literal["monthly", "quarterly", "yearly", "one-time"] # Added "one-time"
@@ -61,6 +66,40 @@ def get_total_annual_amount(items: List[Union[Expense, Saving]]) -> float:
 # Helper to get arguments from Literal type, for runtime check if needed.
 from typing import get_args
 
+# Periods per year for each frequency; mirrors normalize_item_to_annual for SQL-side aggregation.
+ANNUALIZATION_FACTORS: Dict[str, int] = {
+    "monthly": 12,
+    "quarterly": 4,
+    "yearly": 1,
+    "one-time": 0,
+}
+
+# Name for the specific saving item that holds the current total lump sum
+# This is based on the assumption in the plan to avoid immediate Saving model changes.
+LUMP_SUM_SAVING_NAME = "Current Total Savings"
+
+def annualize_item(amount: float, frequency: str) -> float:
+    """
+    Annual recurring amount of a single expense or saving item.
+    Items with an unexpected frequency contribute nothing, as in get_total_annual_amount.
+    """
+    if frequency not in get_args(VALID_FREQUENCIES):
+        return 0.0
+    return normalize_item_to_annual(amount, frequency)
+
+def split_saving_amount(name: str, amount: float, frequency: str) -> Tuple[float, float]:
+    """
+    Classifies a saving item for projections.
+    Returns (annual_contribution, lump_sum): the LUMP_SUM_SAVING_NAME item counts towards the
+    current savings total at face value; every other item is an annualized recurring contribution
+    ('one-time' items contribute nothing).
+    """
+    if name == LUMP_SUM_SAVING_NAME:
+        return 0.0, amount
+    if frequency == "one-time":
+        return 0.0, 0.0
+    return annualize_item(amount, frequency), 0.0
+
 
 # Lifestyle multipliers
 LIFESTYLE_MULTIPLIERS: Dict[str, float] = {
@@ -71,7 +110,28 @@ LIFESTYLE_MULTIPLIERS: Dict[str, float] = {
 
 MAX_PROJECTION_YEARS = 100 # To prevent infinite loops in edge cases, e.g. never able to retire
 
-def calculate_retirement_projection(
+class ProjectionInputs(NamedTuple):
+    """
+    Per-user inputs shared by the projection engines, already reduced to plain numbers.
+    Field names match the keyword arguments of `calculate_retirement_projection`.
+    """
+    current_age: int
+    current_savings_total: float
+    annual_savings_contribution: float
+    base_annual_expenses: float
+    investment_return_rate: float
+    inflation_rate: float
+    life_expectancy: int
+
+# Relative tolerance used by the linear solver when comparing accumulated savings against
+# the required-capital curve. Candidates this close to the boundary are re-checked with the
+# exact year-by-year drawdown, so the solver returns the same ages as the reference loop.
+BOUNDARY_RELATIVE_TOLERANCE = 1e-9
+
+# Sentinel used by the array-returning kernels for "retirement not possible" (None in scalar APIs).
+NO_RETIREMENT_AGE = -1
+
+def calculate_retirement_projection_reference(
     current_age: int,
     current_savings_total: float,
     annual_savings_contribution: float, # Assumed to be in today's dollars, will be inflation-adjusted
@@ -82,7 +142,9 @@ def calculate_retirement_projection(
     expense_multiplier: float         # e.g., 1.0 for frugal, 1.5 for content
 ) -> Optional[int]:
     """
-    Calculates the earliest age at which retirement is possible.
+    Reference implementation: calculates the earliest age at which retirement is possible
+    by re-running a full drawdown simulation for every candidate age (O(N^2)).
+    Kept for differential testing of `calculate_retirement_projection`.
 
     Args:
         current_age: The current age of the individual.
@@ -160,3 +222,305 @@ def calculate_retirement_projection(
 
 
     return None # Retirement not possible within MAX_PROJECTION_YEARS
+
+
+def _required_capital_curve(
+    desired_annual_expenses_today: float,
+    inflation_growth: Sequence[float],
+    investment_return_rate: float
+) -> List[float]:
+    """
+    Backward pass over the projection horizon.
+    required[year] is the capital needed at the start of `year` (offset from current age)
+    to pay inflated expenses every year up to and including life expectancy:
+
+        required[last] = expenses[last]
+        required[year] = expenses[year] + required[year + 1] / (1 + investment_return_rate)
+
+    Valid when expenses are non-negative and (1 + investment_return_rate) > 0.
+    """
+    return_growth = 1 + investment_return_rate
+    required = [0.0] * len(inflation_growth)
+    running_requirement = 0.0
+    for year in range(len(inflation_growth) - 1, -1, -1):
+        expenses = desired_annual_expenses_today * inflation_growth[year]
+        running_requirement = expenses + running_requirement / return_growth
+        required[year] = running_requirement
+    return required
+
+def _drawdown_survives(
+    savings_at_retirement: float,
+    desired_annual_expenses_today: float,
+    inflation_growth: Sequence[float],
+    retirement_year: int,
+    investment_return_rate: float
+) -> bool:
+    """
+    Exact year-by-year drawdown from `retirement_year` to life expectancy.
+    Mirrors the inner loop of the reference implementation operation for operation;
+    used only for candidates that sit on the required-capital boundary.
+    """
+    remaining_savings = savings_at_retirement
+    for year in range(retirement_year, len(inflation_growth)):
+        expenses = desired_annual_expenses_today * inflation_growth[year]
+        if remaining_savings < expenses:
+            return False
+        remaining_savings -= expenses
+        remaining_savings *= (1 + investment_return_rate)
+    return True
+
+def calculate_retirement_projection(
+    current_age: int,
+    current_savings_total: float,
+    annual_savings_contribution: float, # Assumed to be in today's dollars, will be inflation-adjusted
+    base_annual_expenses: float,      # In today's dollars
+    investment_return_rate: float,    # Annual rate, e.g., 0.07
+    inflation_rate: float,            # Annual rate, e.g., 0.02
+    life_expectancy: int,
+    expense_multiplier: float         # e.g., 1.0 for frugal, 1.5 for content
+) -> Optional[int]:
+    """
+    Calculates the earliest age at which retirement is possible.
+
+    Linear-time solver: a single backward pass builds the required-capital curve
+    (capital needed at each candidate age to fund expenses until life expectancy),
+    then a single forward pass accumulates savings and returns the first age at which
+    savings cover that requirement. Inflation growth factors come from the shared tables
+    (core/growth.py), so a rate and horizon seen before costs nothing to set up.
+    Returns the same ages as `calculate_retirement_projection_reference`.
+
+    Args:
+        current_age: The current age of the individual.
+        current_savings_total: Total current accumulated savings.
+        annual_savings_contribution: Annual amount saved (in today's value, will inflate).
+        base_annual_expenses: Current annual expenses (in today's value).
+        investment_return_rate: Expected annual return on investments.
+        inflation_rate: Expected annual inflation rate.
+        life_expectancy: Age until which retirement funds must last.
+        expense_multiplier: Factor applied to base_annual_expenses for desired retirement lifestyle.
+
+    Returns:
+        The calculated retirement age, or None if retirement is not possible
+        within the projection window or by life expectancy.
+    """
+    if current_age >= life_expectancy:
+        return None # Already past life expectancy
+
+    desired_annual_expenses_today = base_annual_expenses * expense_multiplier
+    if (1 + investment_return_rate) <= 0 or desired_annual_expenses_today < 0:
+        # The required-capital recurrence does not hold here; fall back to the full simulation.
+        return calculate_retirement_projection_reference(
+            current_age=current_age,
+            current_savings_total=current_savings_total,
+            annual_savings_contribution=annual_savings_contribution,
+            base_annual_expenses=base_annual_expenses,
+            investment_return_rate=investment_return_rate,
+            inflation_rate=inflation_rate,
+            life_expectancy=life_expectancy,
+            expense_multiplier=expense_multiplier
+        )
+
+    horizon = life_expectancy - current_age
+    inflation_growth = growth_factors(inflation_rate, horizon)
+    if math.isinf(inflation_growth[-1]) and desired_annual_expenses_today > 0:
+        return None # Expenses outgrow the float range before life expectancy (absurd horizons)
+    required_capital = _required_capital_curve(
+        desired_annual_expenses_today, inflation_growth, investment_return_rate
+    )
+
+    accumulated_savings = current_savings_total
+    for year in range(min(horizon, MAX_PROJECTION_YEARS)):
+        margin = accumulated_savings - required_capital[year]
+        tolerance = BOUNDARY_RELATIVE_TOLERANCE * required_capital[year]
+        if margin > tolerance:
+            return current_age + year
+        if margin >= -tolerance and _drawdown_survives(
+            accumulated_savings, desired_annual_expenses_today, inflation_growth, year, investment_return_rate
+        ):
+            return current_age + year
+
+        # Same accrual order as the reference loop: grow, then add this year's inflated contribution.
+        accumulated_savings *= (1 + investment_return_rate)
+        accumulated_savings += annual_savings_contribution * inflation_growth[year]
+
+        if accumulated_savings < 0 and investment_return_rate < 0: # Avoid negative infinity due to high negative returns
+             if accumulated_savings < -1_000_000_000: # Arbitrary large negative number
+                 return None
+
+    return None # Retirement not possible within MAX_PROJECTION_YEARS
+
+def _savings_trajectory(
+    current_savings_total: float,
+    annual_savings_contribution: float,
+    inflation_growth: Sequence[float],
+    investment_return_rate: float,
+    candidate_years: int
+) -> List[float]:
+    """
+    Forward pass: accumulated savings at the start of each candidate year, using the same
+    accrual order as the reference loop. The trajectory stops early if savings diverge to
+    the reference loop's negative cut-off, since later candidate years are never evaluated.
+    """
+    trajectory: List[float] = []
+    accumulated_savings = current_savings_total
+    for year in range(candidate_years):
+        trajectory.append(accumulated_savings)
+        accumulated_savings *= (1 + investment_return_rate)
+        accumulated_savings += annual_savings_contribution * inflation_growth[year]
+        if accumulated_savings < 0 and investment_return_rate < 0:
+            if accumulated_savings < -1_000_000_000:
+                break
+    return trajectory
+
+def calculate_retirement_projections_batch(
+    current_age: int,
+    current_savings_total: float,
+    annual_savings_contribution: float,
+    base_annual_expenses: float,
+    investment_return_rate: float,
+    inflation_rate: float,
+    life_expectancy: int,
+    expense_multipliers: Sequence[float]
+) -> np.ndarray:
+    """
+    Calculates the earliest retirement age for several lifestyle multipliers at once.
+
+    The inflation growth factors, savings trajectory and required-capital curve are computed
+    once and shared by every tier; the required capital scales linearly with the multiplier,
+    so all tiers are checked against the trajectory in a single broadcasted comparison.
+    Returns the same ages as calling `calculate_retirement_projection` once per multiplier.
+
+    Args:
+        current_age .. life_expectancy: As for `calculate_retirement_projection`.
+        expense_multipliers: Lifestyle multipliers, e.g. list(LIFESTYLE_MULTIPLIERS.values()).
+
+    Returns:
+        Integer array aligned with `expense_multipliers`, holding the retirement age per tier,
+        or NO_RETIREMENT_AGE where retirement is not possible.
+    """
+    multipliers = np.asarray(expense_multipliers, dtype=float)
+    retirement_ages = np.full(multipliers.shape, NO_RETIREMENT_AGE, dtype=np.int64)
+    if current_age >= life_expectancy or multipliers.size == 0:
+        return retirement_ages
+
+    horizon = life_expectancy - current_age
+    inflation_growth = growth_factors(inflation_rate, horizon)
+    if (
+        (1 + investment_return_rate) <= 0 or np.any(base_annual_expenses * multipliers < 0)
+        or math.isinf(inflation_growth[-1])
+    ):
+        # Same fallback conditions as the scalar solver; evaluate tiers one by one.
+        for tier, multiplier in enumerate(multipliers):
+            retirement_age = calculate_retirement_projection(
+                current_age=current_age,
+                current_savings_total=current_savings_total,
+                annual_savings_contribution=annual_savings_contribution,
+                base_annual_expenses=base_annual_expenses,
+                investment_return_rate=investment_return_rate,
+                inflation_rate=inflation_rate,
+                life_expectancy=life_expectancy,
+                expense_multiplier=float(multiplier)
+            )
+            if retirement_age is not None:
+                retirement_ages[tier] = retirement_age
+        return retirement_ages
+
+    savings = np.asarray(_savings_trajectory(
+        current_savings_total,
+        annual_savings_contribution,
+        inflation_growth,
+        investment_return_rate,
+        min(horizon, MAX_PROJECTION_YEARS)
+    ))
+    base_required = np.asarray(
+        _required_capital_curve(base_annual_expenses, inflation_growth, investment_return_rate)
+    )[:savings.size]
+
+    # (tiers x candidate years) comparison of savings against each tier's requirement
+    required = np.outer(multipliers, base_required)
+    margin = savings - required
+    tolerance = BOUNDARY_RELATIVE_TOLERANCE * required
+    clearly_feasible = margin > tolerance
+    possibly_feasible = margin >= -tolerance
+
+    has_candidate = possibly_feasible.any(axis=1)
+    first_candidate = possibly_feasible.argmax(axis=1)
+    for tier in np.flatnonzero(has_candidate):
+        year = first_candidate[tier]
+        if clearly_feasible[tier, year]:
+            retirement_ages[tier] = current_age + year
+            continue
+        # Rare: the first candidate sits on the boundary. Walk forward with the exact drawdown.
+        desired_annual_expenses_today = base_annual_expenses * float(multipliers[tier])
+        for year in np.flatnonzero(possibly_feasible[tier]):
+            if clearly_feasible[tier, year] or _drawdown_survives(
+                float(savings[year]), desired_annual_expenses_today, inflation_growth, int(year), investment_return_rate
+            ):
+                retirement_ages[tier] = current_age + year
+                break
+    return retirement_ages
+
+TimelinePhase = Literal["accumulation", "retirement", "depleted"]
+
+class TimelineYear(NamedTuple):
+    """
+    One year of a projection timeline. Amounts are nominal (inflated to that year).
+    - balance: savings at the start of the year.
+    - contribution: saved at the end of the year (accumulation years only).
+    - expenses: withdrawn at the start of the year (retirement / depleted years only).
+    - phase: "depleted" once the balance no longer covers the year's expenses.
+    """
+    age: int
+    balance: float
+    contribution: float
+    expenses: float
+    phase: TimelinePhase
+
+def iter_projection_timeline(
+    current_age: int,
+    current_savings_total: float,
+    annual_savings_contribution: float,
+    base_annual_expenses: float,
+    investment_return_rate: float,
+    inflation_rate: float,
+    life_expectancy: int,
+    expense_multiplier: float,
+    retirement_age: Optional[int]
+) -> Iterator[TimelineYear]:
+    """
+    Lazily yields one TimelineYear per age from current_age to life_expectancy (inclusive),
+    retiring at `retirement_age` (None: never retires within the timeline). Accrual and drawdown
+    follow the same order as `calculate_retirement_projection_reference`, so the balance at the
+    retirement age computed there is the one the reference loop compared against.
+
+    Nothing is computed ahead of the consumer: slicing the generator (itertools.islice) only
+    simulates the years it returns.
+    """
+    # Factors from the shared tables for up to MAX_PROJECTION_YEARS; later years (of absurd
+    # life expectancies) are computed as they are consumed, with the same expression. Past the
+    # float range they are infinite, as in the solver, rather than raising mid-stream.
+    growth_table = growth_factors(inflation_rate, min(max(life_expectancy - current_age, 0), MAX_PROJECTION_YEARS))
+    desired_annual_expenses_today = base_annual_expenses * expense_multiplier
+    balance = current_savings_total
+
+    for year in range(life_expectancy - current_age + 1):
+        age = current_age + year
+        inflation_growth = growth_table[year] if year < len(growth_table) else growth_factor(inflation_rate, year)
+
+        if retirement_age is None or age < retirement_age:
+            # Nothing grows from nothing, even by an infinite factor (0 * inf is nan)
+            contribution = annual_savings_contribution * inflation_growth if annual_savings_contribution else 0.0
+            yield TimelineYear(age, balance, contribution, 0.0, "accumulation")
+            balance *= (1 + investment_return_rate)
+            balance += contribution
+            continue
+
+        expenses = desired_annual_expenses_today * inflation_growth if desired_annual_expenses_today else 0.0
+        if balance < expenses:
+            # Whatever is left is spent this year; later years stay unfunded.
+            yield TimelineYear(age, balance, 0.0, expenses, "depleted")
+            balance = 0.0
+            continue
+        yield TimelineYear(age, balance, 0.0, expenses, "retirement")
+        balance -= expenses
+        balance *= (1 + investment_return_rate)
@@ -0,0 +1,94 @@
+import logging
+import sys
+from collections import Counter
+from pathlib import Path
+from typing import Callable, List, NamedTuple, Optional, Sequence, Tuple, TypeVar
+
+# Per-endpoint SQL statement budgets and N+1 detection.
+#
+# Every endpoint declares how many statements it may execute with @query_budget(n). The budgets
+# are enforced by tests (tests/api/test_query_budgets.py); with QUERY_DEBUG=true the app also
+# records each statement with the application code that issued it, and logs requests that go
+# over budget or repeat a statement (the signature of an N+1 loop / lazy load).
+
+logger = logging.getLogger(__name__)
+
+EndpointT = TypeVar("EndpointT", bound=Callable)
+
+# A statement executed this many times in one request is reported as a possible N+1
+REPEATED_STATEMENT_THRESHOLD = 3
+# Application frames reported per call site, innermost first
+CALL_SITE_DEPTH = 3
+
+_APP_DIR = Path(__file__).resolve().parents[1]
+# Frames of the instrumentation itself are never the call site
+_SKIPPED_FILES = {str(_APP_DIR / "database.py"), str(Path(__file__).resolve())}
+
+
+class QueryRecord(NamedTuple):
+    statement: str
+    call_site: str # e.g. "crud/crud_user.py:20 in get_user_context <- api/deps.py:29 in _load_current_user"
+
+
+class RepeatedStatement(NamedTuple):
+    statement: str
+    count: int
+    call_sites: Tuple[str, ...]
+
+
+def query_budget(max_queries: int) -> Callable[[EndpointT], EndpointT]:
+    """Declares the most SQL statements one request to the decorated endpoint may execute."""
+    def declare(endpoint: EndpointT) -> EndpointT:
+        endpoint.__query_budget__ = max_queries
+        return endpoint
+    return declare
+
+
+def budget_of(endpoint: Callable) -> Optional[int]:
+    return getattr(endpoint, "__query_budget__", None)
+
+
+def capture_call_site() -> str:
+    """The innermost application frames (outside the instrumentation) on the current stack."""
+    frames = []
+    frame = sys._getframe(1)
+    while frame is not None and len(frames) < CALL_SITE_DEPTH:
+        filename = frame.f_code.co_filename
+        if filename.startswith(str(_APP_DIR)) and filename not in _SKIPPED_FILES:
+            relative = Path(filename).relative_to(_APP_DIR).as_posix()
+            frames.append(f"{relative}:{frame.f_lineno} in {frame.f_code.co_name}")
+        frame = frame.f_back
+    return " <- ".join(frames) or "<outside the application>"
+
+
+def find_repeated_statements(
+    records: Sequence[QueryRecord], threshold: int = REPEATED_STATEMENT_THRESHOLD
+) -> List[RepeatedStatement]:
+    counts = Counter(record.statement for record in records)
+    repeated = []
+    for statement, count in counts.most_common():
+        if count < threshold:
+            break
+        call_sites = tuple(dict.fromkeys(record.call_site for record in records if record.statement == statement))
+        repeated.append(RepeatedStatement(statement, count, call_sites))
+    return repeated
+
+
+def report_queries(endpoint_name: str, budget: Optional[int], records: Sequence[QueryRecord]) -> None:
+    """Logs a request that exceeded its budget (with every statement's call site) or repeated a statement."""
+    if budget is not None and len(records) > budget:
+        logger.warning(
+            "%s executed %d SQL statements (budget %d):\n%s",
+            endpoint_name, len(records), budget,
+            "\n".join(f"  {record.call_site}: {_shorten(record.statement)}" for record in records)
+        )
+    for repeated in find_repeated_statements(records):
+        logger.warning(
+            "%s executed the same statement %d times (possible N+1): %s\n  from %s",
+            endpoint_name, repeated.count, _shorten(repeated.statement), "\n  from ".join(repeated.call_sites)
+        )
+
+
+def _shorten(statement: str, limit: int = 200) -> str:
+    statement = " ".join(statement.split())
+    return statement if len(statement) <= limit else statement[:limit] + "..."
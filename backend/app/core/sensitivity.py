@@ -0,0 +1,125 @@
+from typing import NamedTuple, Sequence
+
+import numpy as np
+
+from .growth import growth_array
+from .projections import (
+    BOUNDARY_RELATIVE_TOLERANCE,
+    MAX_PROJECTION_YEARS,
+    NO_RETIREMENT_AGE,
+    calculate_retirement_projection,
+)
+
+
+MAX_SENSITIVITY_STEPS = 101 # Per axis; a full grid is at most 101 x 101 cells per lifestyle
+
+
+class SensitivityGrid(NamedTuple):
+    return_rates: np.ndarray     # (R,)
+    inflation_rates: np.ndarray  # (I,)
+    retirement_ages: np.ndarray  # (tiers, R, I) retirement age per cell, or NO_RETIREMENT_AGE
+
+
+def calculate_sensitivity_grid(
+    current_age: int,
+    current_savings_total: float,
+    annual_savings_contribution: float,
+    base_annual_expenses: float,
+    life_expectancy: int,
+    return_rates: Sequence[float],
+    inflation_rates: Sequence[float],
+    expense_multipliers: Sequence[float]
+) -> SensitivityGrid:
+    """
+    Retirement age for every (return rate, inflation rate, lifestyle) combination.
+
+    The (return x inflation) grid is flattened into cells and evaluated with the same
+    forward (savings) and backward (required capital) passes as the scalar solver, but
+    broadcast across all cells at once: each pass is a loop over years only. Lifestyles
+    scale the required capital linearly and reuse the same passes. Cells whose first
+    candidate age sits on the feasibility boundary, or whose inputs fall outside the
+    range where the recurrence holds, are re-solved with `calculate_retirement_projection`,
+    so every cell matches the scalar engine.
+
+    Args:
+        current_age .. base_annual_expenses, life_expectancy: As for `calculate_retirement_projection`.
+        return_rates: Investment return rates (grid rows).
+        inflation_rates: Inflation rates (grid columns).
+        expense_multipliers: Lifestyle multipliers.
+
+    Returns:
+        A SensitivityGrid with ages shaped (tiers, len(return_rates), len(inflation_rates)).
+    """
+    rates_of_return = np.asarray(return_rates, dtype=float)
+    rates_of_inflation = np.asarray(inflation_rates, dtype=float)
+    multipliers = np.asarray(expense_multipliers, dtype=float)
+    grid_shape = (rates_of_return.size, rates_of_inflation.size)
+    retirement_ages = np.full((multipliers.size,) + grid_shape, NO_RETIREMENT_AGE, dtype=np.int64)
+
+    horizon = life_expectancy - current_age
+    candidate_years = min(horizon, MAX_PROJECTION_YEARS)
+    if candidate_years <= 0 or retirement_ages.size == 0:
+        return SensitivityGrid(rates_of_return, rates_of_inflation, retirement_ages)
+
+    # Flatten the grid into cells; all arrays below are year-major (years x cells).
+    cell_returns = np.repeat(rates_of_return, rates_of_inflation.size)
+    cell_inflation = np.tile(rates_of_inflation, rates_of_return.size)
+    return_growth = 1 + cell_returns
+    # Growth factors per inflation rate, repeated for every return rate. The sweep's rates are
+    # mostly one-off: shared tables are used when present, but new ones are not cached.
+    inflation_growth = np.tile(
+        np.column_stack([growth_array(rate, horizon, store=False) for rate in rates_of_inflation]), rates_of_return.size
+    )
+
+    # Forward pass, including the scalar engine's cut-off for diverging negative savings.
+    savings = np.empty((candidate_years, cell_returns.size))
+    reachable = np.ones((candidate_years, cell_returns.size), dtype=bool)
+    savings[0] = current_savings_total
+    for year in range(candidate_years - 1):
+        savings[year + 1] = savings[year] * return_growth + annual_savings_contribution * inflation_growth[year]
+        diverged = (savings[year + 1] < -1_000_000_000) & (cell_returns < 0)
+        reachable[year + 1] = reachable[year] & ~diverged
+
+    # Backward pass: required capital for the base expenses (multiplier 1.0).
+    with np.errstate(divide="ignore", invalid="ignore"):
+        base_required = np.empty((horizon + 1, cell_returns.size))
+        running_requirement = np.zeros(cell_returns.size)
+        for year in range(horizon, -1, -1):
+            running_requirement = base_annual_expenses * inflation_growth[year] + running_requirement / return_growth
+            base_required[year] = running_requirement
+    base_required = base_required[:candidate_years]
+
+    kernel_valid = return_growth > 0
+    flat_ages = retirement_ages.reshape(multipliers.size, -1)
+    for tier, multiplier in enumerate(multipliers):
+        if base_annual_expenses * multiplier < 0:
+            unresolved = np.arange(cell_returns.size)
+        else:
+            required = multiplier * base_required
+            margin = savings - required
+            tolerance = BOUNDARY_RELATIVE_TOLERANCE * required
+            possibly_feasible = (margin >= -tolerance) & reachable
+            clearly_feasible = (margin > tolerance) & reachable
+
+            has_candidate = possibly_feasible.any(axis=0)
+            first_candidate = possibly_feasible.argmax(axis=0)
+            cells = np.arange(cell_returns.size)
+            resolved = kernel_valid & has_candidate & clearly_feasible[first_candidate, cells]
+            flat_ages[tier, resolved] = current_age + first_candidate[resolved]
+            unresolved = np.flatnonzero(~kernel_valid | (has_candidate & ~resolved))
+
+        for cell in unresolved:
+            retirement_age = calculate_retirement_projection(
+                current_age=current_age,
+                current_savings_total=current_savings_total,
+                annual_savings_contribution=annual_savings_contribution,
+                base_annual_expenses=base_annual_expenses,
+                investment_return_rate=float(cell_returns[cell]),
+                inflation_rate=float(cell_inflation[cell]),
+                life_expectancy=life_expectancy,
+                expense_multiplier=float(multiplier)
+            )
+            if retirement_age is not None:
+                flat_ages[tier, cell] = retirement_age
+
+    return SensitivityGrid(rates_of_return, rates_of_inflation, retirement_ages)
@@ -1,13 +1,24 @@
 # This file makes the 'crud' directory a Python package.
-from .crud_user import get_user, get_user_by_email, get_user_by_google_id, create_user
-from .crud_expense import create_user_expense, get_expenses_by_user
-from .crud_saving import create_user_saving, get_savings_by_user
+from .crud_user import (
+    get_user, get_user_by_email, get_user_identity, get_user_data_version, get_user_context, get_user_by_google_id,
+    create_user, bump_user_data_version
+)
+from .crud_expense import create_user_expense, create_user_expenses_bulk, get_expenses_by_user, iter_expense_rows_by_user
+from .crud_saving import create_user_saving, create_user_savings_bulk, get_savings_by_user, iter_saving_rows_by_user
 from .crud_assumption import get_assumption_by_user, create_or_update_user_assumption # Add this
+from .crud_ledger_totals import (
+    get_ledger_totals, get_projection_totals, aggregate_ledger_totals, apply_expense_to_totals, apply_saving_to_totals,
+    apply_expenses_to_totals, apply_savings_to_totals
+)
 
 # Optional: Define __all__
 # __all__ = [
-#     "get_user", "get_user_by_email", "get_user_by_google_id", "create_user",
-#     "create_user_expense", "get_expenses_by_user",
-#     "create_user_saving", "get_savings_by_user",
-#     "get_assumption_by_user", "create_or_update_user_assumption"
+#     "get_user", "get_user_by_email", "get_user_identity", "get_user_data_version", "get_user_context", "get_user_by_google_id", "create_user",
+#     "bump_user_data_version",
+#     "create_user_expense", "create_user_expenses_bulk", "get_expenses_by_user", "iter_expense_rows_by_user",
+#     "create_user_saving", "create_user_savings_bulk", "get_savings_by_user", "iter_saving_rows_by_user",
+#     "get_assumption_by_user", "create_or_update_user_assumption",
+#     "get_ledger_totals", "get_projection_totals", "aggregate_ledger_totals",
+#     "apply_expense_to_totals", "apply_saving_to_totals",
+#     "apply_expenses_to_totals", "apply_savings_to_totals"
 # ]
@@ -0,0 +1,100 @@
+from typing import AsyncIterator, List, Optional, Sequence
+from sqlalchemy import select
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, selectinload
+
+from .. import models # Access models like models.user.User
+from .. import schemas # Access schemas like schemas.user.UserCreate
+from . import crud_assumption, crud_expense, crud_ledger_totals, crud_saving, crud_user
+
+# Async counterparts of the CRUD functions used by the async endpoints (app/api/endpoints_async).
+# Reads are native async `select`s. Writes run the sync CRUD functions on the async session's
+# underlying Session through `AsyncSession.run_sync`, so the ledger totals and data version
+# bookkeeping lives in exactly one place.
+
+async def get_user_by_email(db: AsyncSession, email: str) -> Optional[models.user.User]:
+    result = await db.execute(select(models.user.User).where(models.user.User.email == email))
+    return result.scalars().first()
+
+async def get_user_identity(db: AsyncSession, email: str) -> Optional[Row]:
+    return (await db.execute(crud_user.user_identity_statement(email))).first()
+
+async def get_user_data_version(db: AsyncSession, user_id: int) -> Optional[int]:
+    return (await db.execute(crud_user.user_data_version_statement(user_id))).scalar()
+
+async def get_user_by_google_id(db: AsyncSession, google_id: str) -> Optional[models.user.User]:
+    result = await db.execute(select(models.user.User).where(models.user.User.google_id == google_id))
+    return result.scalars().first()
+
+async def get_user_context(db: AsyncSession, email: str, include_ledger: bool = False) -> Optional[models.user.User]:
+    """
+    Async version of crud_user.get_user_context: the same eager loads and query counts.
+    Relationships must be loaded eagerly here: a lazy load would need implicit IO,
+    which an AsyncSession does not allow.
+    """
+    User = models.user.User
+    options = [joinedload(User.assumption), joinedload(User.ledger_totals)]
+    if include_ledger:
+        options += [selectinload(User.expenses), selectinload(User.savings)]
+    result = await db.execute(select(User).options(*options).where(User.email == email))
+    return result.unique().scalars().first()
+
+async def create_user(db: AsyncSession, user: schemas.user.UserCreate) -> models.user.User:
+    return await db.run_sync(crud_user.create_user, user)
+
+async def get_expenses_by_user(
+    db: AsyncSession, user_id: int, skip: int = 0, limit: Optional[int] = 100, after_id: Optional[int] = None
+) -> List[models.expense.Expense]:
+    result = await db.execute(crud_expense.expenses_page_statement(user_id, skip=skip, limit=limit, after_id=after_id))
+    return result.scalars().all()
+
+async def create_user_expense(db: AsyncSession, expense: schemas.expense.ExpenseCreate, user_id: int) -> models.expense.Expense:
+    return await db.run_sync(crud_expense.create_user_expense, expense, user_id)
+
+async def create_user_expenses_bulk(db: AsyncSession, expenses: Sequence[schemas.expense.ExpenseCreate], user_id: int) -> int:
+    return await db.run_sync(crud_expense.create_user_expenses_bulk, expenses, user_id)
+
+async def stream_expense_rows_by_user(db: AsyncSession, user_id: int, batch_size: int = 1000) -> AsyncIterator[Row]:
+    return await db.stream(crud_expense.export_expense_rows_statement(user_id, batch_size))
+
+async def get_savings_by_user(
+    db: AsyncSession, user_id: int, skip: int = 0, limit: Optional[int] = 100, after_id: Optional[int] = None
+) -> List[models.saving.Saving]:
+    result = await db.execute(crud_saving.savings_page_statement(user_id, skip=skip, limit=limit, after_id=after_id))
+    return result.scalars().all()
+
+async def create_user_saving(db: AsyncSession, saving: schemas.saving.SavingCreate, user_id: int) -> models.saving.Saving:
+    return await db.run_sync(crud_saving.create_user_saving, saving, user_id)
+
+async def create_user_savings_bulk(db: AsyncSession, savings: Sequence[schemas.saving.SavingCreate], user_id: int) -> int:
+    return await db.run_sync(crud_saving.create_user_savings_bulk, savings, user_id)
+
+async def get_projection_totals(db: AsyncSession, user_id: int) -> crud_ledger_totals.LedgerTotalsValues:
+    """
+    Async version of crud_ledger_totals.get_projection_totals. The totals row is re-read even if
+    it is already in the session: the write paths update it with a bulk UPDATE, and async sessions
+    do not expire objects on commit.
+    """
+    LedgerTotals = models.ledger_totals.LedgerTotals
+    result = await db.execute(
+        select(LedgerTotals)
+        .where(LedgerTotals.user_id == user_id)
+        .execution_options(populate_existing=True)
+    )
+    totals = result.scalars().first()
+    if totals is None:
+        return await db.run_sync(crud_ledger_totals.aggregate_ledger_totals, user_id)
+    return crud_ledger_totals.LedgerTotalsValues(
+        totals.annual_expense_total, totals.annual_contribution_total, totals.lump_sum_total
+    )
+
+async def stream_saving_rows_by_user(db: AsyncSession, user_id: int, batch_size: int = 1000) -> AsyncIterator[Row]:
+    return await db.stream(crud_saving.export_saving_rows_statement(user_id, batch_size))
+
+async def create_or_update_user_assumption(
+    db: AsyncSession,
+    assumption_in: schemas.assumption.AssumptionCreate,
+    user_id: int
+) -> models.assumption.Assumption:
+    return await db.run_sync(crud_assumption.create_or_update_user_assumption, assumption_in, user_id)
@@ -3,6 +3,7 @@ from sqlalchemy.orm import Session
 
 from .. import models # To access models.assumption.Assumption
 from .. import schemas # To access schemas.assumption.AssumptionCreate/Update
+from .crud_user import bump_user_data_version
 
 def get_assumption_by_user(db: Session, user_id: int) -> Optional[models.assumption.Assumption]:
     """
@@ -39,6 +40,7 @@ def create_or_update_user_assumption(
         )
         db.add(db_assumption)
 
+    bump_user_data_version(db, user_id=user_id)
     db.commit()
     db.refresh(db_assumption)
     return db_assumption
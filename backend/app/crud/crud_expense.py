@@ -1,8 +1,12 @@
-from typing import List, Optional
+from typing import Iterator, List, Optional, Sequence
+from sqlalchemy import insert, select
+from sqlalchemy.engine import Row
 from sqlalchemy.orm import Session
 
 from .. import models # Access models like models.expense.Expense
 from .. import schemas # Access schemas like schemas.expense.ExpenseCreate
+from .crud_user import bump_user_data_version
+from .crud_ledger_totals import apply_expense_to_totals, apply_expenses_to_totals
 
 def create_user_expense(db: Session, expense: schemas.expense.ExpenseCreate, user_id: int) -> models.expense.Expense:
     """
@@ -13,15 +17,67 @@ def create_user_expense(db: Session, expense: schemas.expense.ExpenseCreate, use
         user_id=user_id
     )
     db.add(db_expense)
+    apply_expense_to_totals(db, user_id=user_id, amount=db_expense.amount, frequency=db_expense.frequency)
+    bump_user_data_version(db, user_id=user_id)
     db.commit()
     db.refresh(db_expense)
     return db_expense
 
-def get_expenses_by_user(db: Session, user_id: int, skip: int = 0, limit: int = 100) -> List[models.expense.Expense]:
+def create_user_expenses_bulk(db: Session, expenses: Sequence[schemas.expense.ExpenseCreate], user_id: int) -> int:
     """
-    Retrieve all expenses for a specific user, with pagination.
+    Insert many expenses for a user in a single transaction: one executemany INSERT, one ledger
+    totals UPDATE, one data version bump and one commit, without loading the rows back.
+    Returns the number of rows inserted.
     """
-    return db.query(models.expense.Expense)                 .filter(models.expense.Expense.user_id == user_id)                 .offset(skip)                 .limit(limit)                 .all()
+    if not expenses:
+        return 0
+    db.execute(
+        insert(models.expense.Expense),
+        [{**expense.dict(), "user_id": user_id} for expense in expenses]
+    )
+    apply_expenses_to_totals(db, user_id=user_id, items=((expense.amount, expense.frequency) for expense in expenses))
+    bump_user_data_version(db, user_id=user_id)
+    db.commit()
+    return len(expenses)
+
+def expenses_page_statement(user_id: int, skip: int = 0, limit: Optional[int] = 100, after_id: Optional[int] = None):
+    """
+    SELECT of one page of the user's expenses, ordered by id. With `after_id` (keyset pagination) the
+    page starts after that id: the (user_id, id) index seeks straight to it, so deep pages cost the
+    same as the first one. `skip` (OFFSET) still has to walk past every skipped row.
+    """
+    Expense = models.expense.Expense
+    statement = select(Expense).where(Expense.user_id == user_id)
+    if after_id is not None:
+        statement = statement.where(Expense.id > after_id)
+    return statement.order_by(Expense.id).offset(skip).limit(limit)
+
+def get_expenses_by_user(
+    db: Session, user_id: int, skip: int = 0, limit: Optional[int] = 100, after_id: Optional[int] = None
+) -> List[models.expense.Expense]:
+    """
+    Retrieve the expenses of a specific user, ordered by id, one page at a time.
+    Pass the last id of the previous page as `after_id` to fetch the next one.
+    """
+    return db.execute(expenses_page_statement(user_id, skip=skip, limit=limit, after_id=after_id)).scalars().all()
+
+# Columns of the streamed export, in order
+EXPORT_COLUMNS = ("id", "name", "amount", "frequency")
+
+def export_expense_rows_statement(user_id: int, batch_size: int):
+    """
+    SELECT of the user's expenses as plain EXPORT_COLUMNS tuples (no ORM objects), fetched
+    `batch_size` rows at a time (a server-side cursor on backends that support one).
+    """
+    Expense = models.expense.Expense
+    return select(Expense.id, Expense.name, Expense.amount, Expense.frequency)\
+        .where(Expense.user_id == user_id)\
+        .order_by(Expense.id)\
+        .execution_options(yield_per=batch_size)
+
+def iter_expense_rows_by_user(db: Session, user_id: int, batch_size: int = 1000) -> Iterator[Row]:
+    """Streams all of a user's expenses; memory use is bounded by `batch_size`, not the row count."""
+    return iter(db.execute(export_expense_rows_statement(user_id, batch_size)))
 
 # Optional placeholders for future CRUD operations:
 # def get_expense(db: Session, expense_id: int, user_id: int) -> Optional[models.expense.Expense]:
@@ -32,9 +88,12 @@ def get_expenses_by_user(db: Session, user_id: int, skip: int = 0, limit: int =
 #     """Update an existing expense. Ensure user owns the expense."""
 #     db_expense = get_expense(db, expense_id=expense_id, user_id=user_id)
 #     if db_expense:
+#         apply_expense_to_totals(db, user_id=user_id, amount=db_expense.amount, frequency=db_expense.frequency, sign=-1)
 #         update_data = expense_in.dict(exclude_unset=True)
 #         for key, value in update_data.items():
 #             setattr(db_expense, key, value)
+#         apply_expense_to_totals(db, user_id=user_id, amount=db_expense.amount, frequency=db_expense.frequency)
+#         bump_user_data_version(db, user_id=user_id)
 #         db.commit()
 #         db.refresh(db_expense)
 #     return db_expense
@@ -44,5 +103,7 @@ def get_expenses_by_user(db: Session, user_id: int, skip: int = 0, limit: int =
 #     db_expense = get_expense(db, expense_id=expense_id, user_id=user_id)
 #     if db_expense:
 #         db.delete(db_expense)
+#         apply_expense_to_totals(db, user_id=user_id, amount=db_expense.amount, frequency=db_expense.frequency, sign=-1)
+#         bump_user_data_version(db, user_id=user_id)
 #         db.commit()
 #     return db_expense
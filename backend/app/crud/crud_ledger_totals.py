@@ -0,0 +1,141 @@
+from typing import Iterable, NamedTuple, Optional, Tuple
+from sqlalchemy import case, func, literal, select, union_all
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from .. import models # Access models like models.ledger_totals.LedgerTotals
+from ..core.projections import ANNUALIZATION_FACTORS, LUMP_SUM_SAVING_NAME, annualize_item, split_saving_amount
+
+class LedgerTotalsValues(NamedTuple):
+    annual_expense_total: float
+    annual_contribution_total: float
+    lump_sum_total: float
+
+def get_ledger_totals(db: Session, user_id: int) -> Optional[models.ledger_totals.LedgerTotals]:
+    return db.query(models.ledger_totals.LedgerTotals)\
+        .filter(models.ledger_totals.LedgerTotals.user_id == user_id)\
+        .first()
+
+def compute_ledger_totals_from_rows(db: Session, user_id: int) -> LedgerTotalsValues:
+    """
+    Recomputes the totals by iterating every expense and saving row of the user in Python.
+    Reference implementation for aggregate_ledger_totals.
+    """
+    annual_expense_total = 0.0
+    for amount, frequency in db.query(models.expense.Expense.amount, models.expense.Expense.frequency)\
+            .filter(models.expense.Expense.user_id == user_id):
+        annual_expense_total += annualize_item(amount, frequency)
+
+    annual_contribution_total = 0.0
+    lump_sum_total = 0.0
+    for name, amount, frequency in db.query(models.saving.Saving.name, models.saving.Saving.amount, models.saving.Saving.frequency)\
+            .filter(models.saving.Saving.user_id == user_id):
+        contribution, lump_sum = split_saving_amount(name, amount, frequency)
+        annual_contribution_total += contribution
+        lump_sum_total += lump_sum
+
+    return LedgerTotalsValues(annual_expense_total, annual_contribution_total, lump_sum_total)
+
+def aggregate_ledger_totals(db: Session, user_id: int) -> LedgerTotalsValues:
+    """
+    SQL-side equivalent of compute_ledger_totals_from_rows: one round trip, no ORM hydration.
+
+    Expenses and savings are combined with UNION ALL and tagged with a category
+    ('expense', 'contribution' or 'lump_sum'), then summed per category with the frequency
+    normalization done in SQL:
+
+        SUM(CASE WHEN category = 'lump_sum' THEN amount
+                 ELSE CASE frequency WHEN 'monthly' THEN amount * 12 ... ELSE 0 END END)
+        GROUP BY category
+    """
+    Expense = models.expense.Expense
+    Saving = models.saving.Saving
+    expense_items = select(
+        literal("expense").label("category"), Expense.amount, Expense.frequency
+    ).where(Expense.user_id == user_id)
+    saving_items = select(
+        case((Saving.name == LUMP_SUM_SAVING_NAME, "lump_sum"), else_="contribution").label("category"),
+        Saving.amount,
+        Saving.frequency
+    ).where(Saving.user_id == user_id)
+    items = union_all(expense_items, saving_items).subquery()
+
+    annualized_amount = case(
+        *[(items.c.frequency == frequency, items.c.amount * factor) for frequency, factor in ANNUALIZATION_FACTORS.items()],
+        else_=0.0
+    )
+    item_total = case((items.c.category == "lump_sum", items.c.amount), else_=annualized_amount)
+    totals_by_category = dict(
+        db.execute(select(items.c.category, func.sum(item_total)).group_by(items.c.category)).all()
+    )
+    return LedgerTotalsValues(
+        annual_expense_total=float(totals_by_category.get("expense") or 0.0),
+        annual_contribution_total=float(totals_by_category.get("contribution") or 0.0),
+        lump_sum_total=float(totals_by_category.get("lump_sum") or 0.0)
+    )
+
+def get_projection_totals(db: Session, user_id: int) -> LedgerTotalsValues:
+    """
+    The three ledger numbers the projection needs: one single-row read for users with
+    a totals record, or one SQL aggregation over the rows for users without one.
+    """
+    totals = get_ledger_totals(db, user_id=user_id)
+    if totals is None:
+        return aggregate_ledger_totals(db, user_id=user_id)
+    return LedgerTotalsValues(totals.annual_expense_total, totals.annual_contribution_total, totals.lump_sum_total)
+
+def _apply_delta(
+    db: Session,
+    user_id: int,
+    annual_expense_delta: float = 0.0,
+    annual_contribution_delta: float = 0.0,
+    lump_sum_delta: float = 0.0
+) -> None:
+    """
+    Adds the deltas to the user's totals with a single UPDATE. Does not commit: callers run it
+    in the same transaction as the item write, after adding/deleting the item in the session.
+    Users without a totals record get one rebuilt from their (flushed) rows instead; if a
+    concurrent write created it first, the deltas are applied to that one.
+    """
+    LedgerTotals = models.ledger_totals.LedgerTotals
+
+    def update_totals() -> int:
+        return db.query(LedgerTotals)\
+            .filter(LedgerTotals.user_id == user_id)\
+            .update({
+                LedgerTotals.annual_expense_total: LedgerTotals.annual_expense_total + annual_expense_delta,
+                LedgerTotals.annual_contribution_total: LedgerTotals.annual_contribution_total + annual_contribution_delta,
+                LedgerTotals.lump_sum_total: LedgerTotals.lump_sum_total + lump_sum_delta,
+            }, synchronize_session=False)
+
+    if update_totals() == 0:
+        db.flush()
+        totals = aggregate_ledger_totals(db, user_id=user_id)
+        try:
+            with db.begin_nested(): # Only the insert is rolled back if it loses the race
+                db.add(LedgerTotals(user_id=user_id, **totals._asdict()))
+        except IntegrityError: # Unique user_id: the other write's record lacks this item, add the deltas to it
+            update_totals()
+
+def apply_expense_to_totals(db: Session, user_id: int, amount: float, frequency: str, sign: int = 1) -> None:
+    """Account for an expense item being added (sign=1) or removed (sign=-1). Does not commit."""
+    _apply_delta(db, user_id, annual_expense_delta=sign * annualize_item(amount, frequency))
+
+def apply_expenses_to_totals(db: Session, user_id: int, items: Iterable[Tuple[float, str]]) -> None:
+    """Bulk form of apply_expense_to_totals for added (amount, frequency) items: one UPDATE. Does not commit."""
+    _apply_delta(db, user_id, annual_expense_delta=sum(annualize_item(amount, frequency) for amount, frequency in items))
+
+def apply_saving_to_totals(db: Session, user_id: int, name: str, amount: float, frequency: str, sign: int = 1) -> None:
+    """Account for a saving item being added (sign=1) or removed (sign=-1). Does not commit."""
+    contribution, lump_sum = split_saving_amount(name, amount, frequency)
+    _apply_delta(db, user_id, annual_contribution_delta=sign * contribution, lump_sum_delta=sign * lump_sum)
+
+def apply_savings_to_totals(db: Session, user_id: int, items: Iterable[Tuple[str, float, str]]) -> None:
+    """Bulk form of apply_saving_to_totals for added (name, amount, frequency) items: one UPDATE. Does not commit."""
+    annual_contribution_delta = 0.0
+    lump_sum_delta = 0.0
+    for name, amount, frequency in items:
+        contribution, lump_sum = split_saving_amount(name, amount, frequency)
+        annual_contribution_delta += contribution
+        lump_sum_delta += lump_sum
+    _apply_delta(db, user_id, annual_contribution_delta=annual_contribution_delta, lump_sum_delta=lump_sum_delta)
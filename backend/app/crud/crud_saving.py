@@ -1,8 +1,12 @@
-from typing import List, Optional
+from typing import Iterator, List, Optional, Sequence
+from sqlalchemy import insert, select
+from sqlalchemy.engine import Row
 from sqlalchemy.orm import Session
 
 from .. import models # Access models like models.saving.Saving
 from .. import schemas # Access schemas like schemas.saving.SavingCreate
+from .crud_user import bump_user_data_version
+from .crud_ledger_totals import apply_saving_to_totals, apply_savings_to_totals
 
 def create_user_saving(db: Session, saving: schemas.saving.SavingCreate, user_id: int) -> models.saving.Saving:
     """
@@ -13,15 +17,66 @@ def create_user_saving(db: Session, saving: schemas.saving.SavingCreate, user_id
         user_id=user_id
     )
     db.add(db_saving)
+    apply_saving_to_totals(db, user_id=user_id, name=db_saving.name, amount=db_saving.amount, frequency=db_saving.frequency)
+    bump_user_data_version(db, user_id=user_id)
     db.commit()
     db.refresh(db_saving)
     return db_saving
 
-def get_savings_by_user(db: Session, user_id: int, skip: int = 0, limit: int = 100) -> List[models.saving.Saving]:
+def create_user_savings_bulk(db: Session, savings: Sequence[schemas.saving.SavingCreate], user_id: int) -> int:
     """
-    Retrieve all savings for a specific user, with pagination.
+    Insert many saving entries for a user in a single transaction: one executemany INSERT, one
+    ledger totals UPDATE, one data version bump and one commit. Returns the number of rows inserted.
     """
-    return db.query(models.saving.Saving)                 .filter(models.saving.Saving.user_id == user_id)                 .offset(skip)                 .limit(limit)                 .all()
+    if not savings:
+        return 0
+    db.execute(
+        insert(models.saving.Saving),
+        [{**saving.dict(), "user_id": user_id} for saving in savings]
+    )
+    apply_savings_to_totals(db, user_id=user_id, items=((saving.name, saving.amount, saving.frequency) for saving in savings))
+    bump_user_data_version(db, user_id=user_id)
+    db.commit()
+    return len(savings)
+
+def savings_page_statement(user_id: int, skip: int = 0, limit: Optional[int] = 100, after_id: Optional[int] = None):
+    """
+    SELECT of one page of the user's savings, ordered by id. With `after_id` (keyset pagination) the
+    page starts after that id: the (user_id, id) index seeks straight to it, so deep pages cost the
+    same as the first one. `skip` (OFFSET) still has to walk past every skipped row.
+    """
+    Saving = models.saving.Saving
+    statement = select(Saving).where(Saving.user_id == user_id)
+    if after_id is not None:
+        statement = statement.where(Saving.id > after_id)
+    return statement.order_by(Saving.id).offset(skip).limit(limit)
+
+def get_savings_by_user(
+    db: Session, user_id: int, skip: int = 0, limit: Optional[int] = 100, after_id: Optional[int] = None
+) -> List[models.saving.Saving]:
+    """
+    Retrieve the savings of a specific user, ordered by id, one page at a time.
+    Pass the last id of the previous page as `after_id` to fetch the next one.
+    """
+    return db.execute(savings_page_statement(user_id, skip=skip, limit=limit, after_id=after_id)).scalars().all()
+
+# Columns of the streamed export, in order
+EXPORT_COLUMNS = ("id", "name", "amount", "frequency")
+
+def export_saving_rows_statement(user_id: int, batch_size: int):
+    """
+    SELECT of the user's savings as plain EXPORT_COLUMNS tuples (no ORM objects), fetched
+    `batch_size` rows at a time (a server-side cursor on backends that support one).
+    """
+    Saving = models.saving.Saving
+    return select(Saving.id, Saving.name, Saving.amount, Saving.frequency)\
+        .where(Saving.user_id == user_id)\
+        .order_by(Saving.id)\
+        .execution_options(yield_per=batch_size)
+
+def iter_saving_rows_by_user(db: Session, user_id: int, batch_size: int = 1000) -> Iterator[Row]:
+    """Streams all of a user's savings; memory use is bounded by `batch_size`, not the row count."""
+    return iter(db.execute(export_saving_rows_statement(user_id, batch_size)))
 
 # Optional placeholders for future CRUD operations:
 # def get_saving(db: Session, saving_id: int, user_id: int) -> Optional[models.saving.Saving]:
@@ -30,10 +85,10 @@ def get_savings_by_user(db: Session, user_id: int, skip: int = 0, limit: int = 1
 
 # def update_saving(db: Session, saving_id: int, saving_in: schemas.saving.SavingUpdate, user_id: int) -> Optional[models.saving.Saving]:
 #     """Update an existing saving. Ensure user owns the saving."""
-#     # Similar logic to update_expense
+#     # Similar logic to update_expense: apply_saving_to_totals(..., sign=-1) before the change, sign=1 after
 #     pass
 
 # def delete_saving(db: Session, saving_id: int, user_id: int) -> Optional[models.saving.Saving]:
 #     """Delete a saving. Ensure user owns the saving."""
-#     # Similar logic to delete_expense
+#     # Similar logic to delete_expense, with apply_saving_to_totals(..., sign=-1)
 #     pass
@@ -1,5 +1,7 @@
 from typing import Optional
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session, joinedload, selectinload
 
 from .. import models # Assuming models is accessible like this
 from .. import schemas # Assuming schemas is accessible like this
@@ -10,6 +12,35 @@ def get_user(db: Session, user_id: int) -> Optional[models.user.User]:
 def get_user_by_email(db: Session, email: str) -> Optional[models.user.User]:
     return db.query(models.user.User).filter(models.user.User.email == email).first()
 
+def user_identity_statement(email: str):
+    """Only the columns of the authenticated user's identity (id, email, age, is_active): no joins."""
+    User = models.user.User
+    return select(User.id, User.email, User.age, User.is_active).where(User.email == email)
+
+def get_user_identity(db: Session, email: str) -> Optional[Row]:
+    return db.execute(user_identity_statement(email)).first()
+
+def user_data_version_statement(user_id: int):
+    User = models.user.User
+    return select(User.data_version).where(User.id == user_id)
+
+def get_user_data_version(db: Session, user_id: int) -> Optional[int]:
+    """The user's data version alone (a single integer column; no ORM objects)."""
+    return db.execute(user_data_version_statement(user_id)).scalar()
+
+def get_user_context(db: Session, email: str, include_ledger: bool = False) -> Optional[models.user.User]:
+    """
+    Loads the user together with the relationships endpoints need, in a bounded number of queries:
+    - `assumption` and `ledger_totals` (one-to-one) are joined into the user query: 1 query.
+    - with include_ledger=True, `expenses` and `savings` are loaded with one SELECT ... IN each: 3 queries.
+    Accessing the loaded relationships afterwards issues no further queries.
+    """
+    User = models.user.User
+    options = [joinedload(User.assumption), joinedload(User.ledger_totals)]
+    if include_ledger:
+        options += [selectinload(User.expenses), selectinload(User.savings)]
+    return db.query(User).options(*options).filter(User.email == email).first()
+
 def get_user_by_google_id(db: Session, google_id: str) -> Optional[models.user.User]:
     return db.query(models.user.User).filter(models.user.User.google_id == google_id).first()
 
@@ -25,11 +56,25 @@ def create_user(db: Session, user: schemas.user.UserCreate) -> models.user.User:
         start_year=user.start_year
         # is_active is True by default in the model
     )
+    # Start the running ledger totals at zero so item writes only ever need an UPDATE
+    db_user.ledger_totals = models.ledger_totals.LedgerTotals(
+        annual_expense_total=0.0, annual_contribution_total=0.0, lump_sum_total=0.0
+    )
     db.add(db_user)
     db.commit()
     db.refresh(db_user)
     return db_user
 
+def bump_user_data_version(db: Session, user_id: int) -> None:
+    """
+    Marks the user's financial data (expenses, savings, assumptions) as changed.
+    Does not commit: call it inside the write's transaction so the new version
+    becomes visible together with the data it describes.
+    """
+    db.query(models.user.User)\
+        .filter(models.user.User.id == user_id)\
+        .update({models.user.User.data_version: models.user.User.data_version + 1}, synchronize_session=False)
+
 # Placeholder for update_user, if needed later for the POST /profile endpoint
 # def update_user(db: Session, user_id: int, user_update: schemas.user.UserUpdate) -> Optional[models.user.User]:
 #     db_user = get_user(db, user_id)
@@ -0,0 +1,25 @@
+from typing import AsyncGenerator
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from .config import settings
+from .database import is_sqlite_url, is_sqlite_memory_url, engine_kwargs, register_sqlite_pragmas
+
+# Async engine for the async endpoints. Models are shared with the sync engine (database.Base).
+# The driver (aiosqlite / asyncpg) is only imported once this module is, i.e. in async mode.
+# Pool sizing and SQLite pragmas follow the same settings as the sync engine.
+async_engine = create_async_engine(
+    settings.async_database_url, **engine_kwargs(settings.async_database_url, is_async=True)
+)
+if is_sqlite_url(settings.async_database_url) and not is_sqlite_memory_url(settings.async_database_url):
+    register_sqlite_pragmas(async_engine.sync_engine)
+
+# expire_on_commit=False: attributes stay readable after commit without an implicit (sync) refresh
+AsyncSessionLocal = sessionmaker(
+    bind=async_engine, class_=AsyncSession, autocommit=False, autoflush=False, expire_on_commit=False
+)
+
+# Dependency to get an async DB session
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    async with AsyncSessionLocal() as db:
+        yield db
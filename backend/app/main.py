@@ -1,35 +1,120 @@
+from typing import Optional
+
 from fastapi import FastAPI
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import PlainTextResponse
 
 # Import for table creation
-from .database import engine, Base
-
-# Import routers from the endpoints package using their exported names
-
-from .api.endpoints import ( # Using parentheses for multi-line import
-    user_router,
-    expense_router,
-    saving_router,
-    assumption_router,
-    projection_router # Added projection_router
-)
+from .database import engine, create_tables
+from .config import Settings, settings
+from .api.instrumentation import TimingMiddleware
+from .core.executor import projection_executor
+from .core.jobs import job_manager
+from .core.metrics import render_metrics
 
 # Function to create database tables
 def create_db_and_tables():
-    Base.metadata.create_all(bind=engine)
+    with engine.begin() as connection:
+        create_tables(connection)
+
+async def create_db_and_tables_async():
+    # Imported here so the async driver is only required in async mode
+    from .database_async import async_engine
+    async with async_engine.begin() as connection:
+        await connection.run_sync(create_tables)
+
+def configure_projection_executor(config: Settings = settings) -> None:
+    projection_executor.configure(
+        backend=config.projection_executor,
+        workers=config.projection_workers,
+        inline_cost=config.projection_inline_cost,
+        max_queue_depth=config.projection_max_queue_depth
+    )
+
+def configure_job_manager(config: Settings = settings) -> None:
+    job_manager.configure(
+        workers=config.job_workers,
+        max_pending=config.job_max_pending,
+        result_ttl_seconds=config.job_result_ttl_seconds,
+        max_retained=config.job_max_retained
+    )
+
+def create_app(
+    use_async_db: bool = settings.use_async_db,
+    metrics_enabled: bool = settings.metrics_enabled,
+    query_debug: bool = settings.query_debug,
+    fast_json: bool = settings.fast_json,
+    gzip_minimum_size: Optional[int] = settings.gzip_minimum_size if settings.gzip_enabled else None
+) -> FastAPI:
+    """
+    Builds the application. With `use_async_db` (env `USE_ASYNC_DB=true`) the routers are the
+    `async def` versions in app/api/endpoints_async running on the async engine; otherwise the
+    sync routers in app/api/endpoints run on FastAPI's threadpool. Both serve the same API.
+    With `metrics_enabled` (env `METRICS_ENABLED=true`, off by default: /metrics is unauthenticated)
+    every response carries a Server-Timing header (db, compute, serialize, total) and GET /metrics
+    serves the latency histograms in the Prometheus text format.
+    `query_debug` (env `QUERY_DEBUG=true`) logs requests exceeding their endpoint's query budget.
+    With `fast_json` (env `FAST_JSON=true`) the large JSON responses are built without response
+    model validation (app/api/fast_json.py). Responses of at least `gzip_minimum_size` bytes are
+    gzip-compressed for clients that accept it (None: never).
+    Heavy projection work runs on the process-wide projection executor and background projection
+    jobs on the job manager, configured here from the PROJECTION_* / JOB_* settings and shut down
+    with the app.
+    """
+    if use_async_db:
+        from .api.endpoints_async import (
+            user_router,
+            expense_router,
+            saving_router,
+            assumption_router,
+            projection_router,
+            projection_jobs_router
+        )
+    else:
+        # Import routers from the endpoints package using their exported names
+        from .api.endpoints import ( # Using parentheses for multi-line import
+            user_router,
+            expense_router,
+            saving_router,
+            assumption_router,
+            projection_router, # Added projection_router
+            projection_jobs_router
+        )
+
+    app = FastAPI(title="Financial Retirement Planner API")
+    app.state.fast_json = fast_json
+
+    # Event handler for startup
+    app.add_event_handler("startup", create_db_and_tables_async if use_async_db else create_db_and_tables)
+    app.add_event_handler("shutdown", job_manager.shutdown)
+    app.add_event_handler("shutdown", projection_executor.shutdown)
+
+    configure_projection_executor()
+    configure_job_manager()
+
+    @app.get("/")
+    async def read_root():
+        return {"message": "Welcome to the Financial Retirement Planner API"}
 
-app = FastAPI(title="Financial Retirement Planner API")
+    if metrics_enabled or query_debug:
+        app.add_middleware(TimingMiddleware, record_statements=query_debug)
+    if gzip_minimum_size is not None:
+        # Added last, so outermost: Server-Timing's total leaves compression out
+        app.add_middleware(GZipMiddleware, minimum_size=gzip_minimum_size, compresslevel=settings.gzip_compress_level)
 
-# Event handler for startup
-app.add_event_handler("startup", create_db_and_tables)
+    if metrics_enabled:
+        @app.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+        async def read_metrics():
+            return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4")
 
-@app.get("/")
-async def read_root():
-    return {"message": "Welcome to the Financial Retirement Planner API"}
+    # Include the routers
+    app.include_router(user_router, prefix="/user", tags=["user"])
+    app.include_router(expense_router, prefix="/user/expenses", tags=["expenses"])
+    app.include_router(saving_router, prefix="/user/savings", tags=["savings"])
+    app.include_router(assumption_router, prefix="/user/assumptions", tags=["assumptions"])
+    app.include_router(projection_router, prefix="/user/projections", tags=["projections"]) # Added projection_router
+    app.include_router(projection_jobs_router, prefix="/user/projections/jobs", tags=["projections"])
 
-# Include the routers
-app.include_router(user_router, prefix="/user", tags=["user"])
-app.include_router(expense_router, prefix="/user/expenses", tags=["expenses"])
-app.include_router(saving_router, prefix="/user/savings", tags=["savings"])
-app.include_router(assumption_router, prefix="/user/assumptions", tags=["assumptions"])
-app.include_router(projection_router, prefix="/user/projections", tags=["projections"]) # Added projection_router
+    return app
 
+app = create_app()
@@ -3,6 +3,7 @@ from .user import User
 from .expense import Expense
 from .saving import Saving
 from .assumption import Assumption # Add this line
+from .ledger_totals import LedgerTotals
 
 # Optional: Define __all__ to control what `from .models import *` imports
-# __all__ = ["User", "Expense", "Saving", "Assumption"]
+# __all__ = ["User", "Expense", "Saving", "Assumption", "LedgerTotals"]
@@ -0,0 +1,19 @@
+from sqlalchemy import Column, Integer, Float, ForeignKey
+from sqlalchemy.orm import relationship
+
+from ..database import Base
+
+class LedgerTotals(Base):
+    """
+    Running per-user totals of the ledger, maintained by the expense/saving CRUD write paths
+    in the same transaction as the item itself, so projections read O(1) data.
+    """
+    __tablename__ = "ledger_totals"
+
+    id = Column(Integer, primary_key=True, index=True)
+    annual_expense_total = Column(Float, nullable=False, default=0.0)      # Sum of annualized expenses
+    annual_contribution_total = Column(Float, nullable=False, default=0.0) # Sum of annualized recurring savings
+    lump_sum_total = Column(Float, nullable=False, default=0.0)            # Sum of LUMP_SUM_SAVING_NAME items
+
+    user_id = Column(Integer, ForeignKey("users.id"), unique=True, nullable=False)
+    owner = relationship("User", back_populates="ledger_totals")
@@ -1,10 +1,12 @@
-from sqlalchemy import Column, Integer, String, Float, ForeignKey
+from sqlalchemy import Column, Integer, String, Float, ForeignKey, Index
 from sqlalchemy.orm import relationship
 
 from ..database import Base # Assuming database.py is one level up
 
 class Saving(Base):
     __tablename__ = "savings"
+    # Per-user listings and exports filter on user_id and page / order by id
+    __table_args__ = (Index("ix_savings_user_id_id", "user_id", "id"),)
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, index=True)
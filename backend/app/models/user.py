@@ -16,6 +16,9 @@ class User(Base):
 
     is_active = Column(Boolean, default=True)
 
+    # Bumped by every expense/saving/assumption write; keys cached projection results.
+    data_version = Column(Integer, nullable=False, default=0)
+
     # Add or update the expenses relationship
     expenses = relationship("Expense", back_populates="owner", cascade="all, delete-orphan")
 
@@ -24,3 +27,6 @@ class User(Base):
 
     # Update/Add the assumption relationship for one-to-one
     assumption = relationship("Assumption", back_populates="owner", uselist=False, cascade="all, delete-orphan")
+
+    # Running ledger totals used by projections (one-to-one)
+    ledger_totals = relationship("LedgerTotals", back_populates="owner", uselist=False, cascade="all, delete-orphan")
@@ -3,7 +3,8 @@ from .user import User, UserCreate # Assuming these are the primary ones exporte
 from .expense import Expense, ExpenseCreate
 from .saving import Saving, SavingCreate
 from .assumption import Assumption, AssumptionCreate, AssumptionUpdate, AssumptionBase
-from .projection import ProjectionResult, ProjectionResponse # Add this
+from .projection import ProjectionResult, ProjectionResponse, GoalSeekResponse, AgeSuccessProbability, SensitivityGridResult, SensitivityResponse, TimelineYearResult, TimelinePage, SensitivityJobCreate, MonteCarloJobCreate, ProjectionJobCreate, ProjectionJobStatus # Add this
+from .bulk import BulkImportSummary, LedgerTotals
 
 # Optional: Define __all__
 # __all__ = [
@@ -11,5 +12,8 @@ from .projection import ProjectionResult, ProjectionResponse # Add this
 #     "Expense", "ExpenseCreate",
 #     "Saving", "SavingCreate",
 #     "Assumption", "AssumptionCreate", "AssumptionUpdate", "AssumptionBase",
-#     "ProjectionResult", "ProjectionResponse"
+#     "ProjectionResult", "ProjectionResponse", "GoalSeekResponse", "AgeSuccessProbability",
+#     "SensitivityGridResult", "SensitivityResponse", "TimelineYearResult", "TimelinePage",
+#     "SensitivityJobCreate", "MonteCarloJobCreate", "ProjectionJobCreate", "ProjectionJobStatus",
+#     "BulkImportSummary", "LedgerTotals"
 # ]
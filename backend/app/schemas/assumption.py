@@ -1,6 +1,9 @@
 from pydantic import BaseModel, Field # Field can be used for more detailed validation if needed
 from typing import Optional
 
+# Projections run year by year up to the life expectancy; larger values are rejected on input
+MAX_LIFE_EXPECTANCY = 150
+
 class AssumptionBase(BaseModel):
     # Defaults are defined here as per the issue spec and previous setup
     return_rate: float = Field(default=0.07, gt=0, description="Annual rate of return on investments (e.g., 0.07 for 7%)")
@@ -9,14 +12,14 @@ class AssumptionBase(BaseModel):
 
 class AssumptionCreate(AssumptionBase):
     # This schema is used when creating/updating assumptions.
-    # It inherits all fields and defaults from AssumptionBase.
-    pass
+    # It inherits all fields and defaults from AssumptionBase; input is also capped at MAX_LIFE_EXPECTANCY.
+    life_expectancy: int = Field(default=95, gt=0, le=MAX_LIFE_EXPECTANCY, description="Expected life expectancy in years (e.g., 95)")
 
 class AssumptionUpdate(BaseModel):
     # This schema is used for partial updates. All fields are optional.
     return_rate: Optional[float] = Field(default=None, gt=0, description="Annual rate of return on investments (e.g., 0.07 for 7%)")
     inflation_rate: Optional[float] = Field(default=None, ge=0, description="Annual inflation rate (e.g., 0.02 for 2%)")
-    life_expectancy: Optional[int] = Field(default=None, gt=0, description="Expected life expectancy in years (e.g., 95)")
+    life_expectancy: Optional[int] = Field(default=None, gt=0, le=MAX_LIFE_EXPECTANCY, description="Expected life expectancy in years (e.g., 95)")
 
 class Assumption(AssumptionBase):
     # This is the schema for responses (data returned from API).
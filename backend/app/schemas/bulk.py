@@ -0,0 +1,10 @@
+from pydantic import BaseModel
+
+class LedgerTotals(BaseModel):
+    annual_expense_total: float
+    annual_contribution_total: float
+    lump_sum_total: float
+
+class BulkImportSummary(BaseModel):
+    inserted: int # Rows written, all in one transaction
+    ledger_totals: LedgerTotals # The user's totals after the import
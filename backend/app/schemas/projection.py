@@ -1,10 +1,16 @@
-from pydantic import BaseModel
-from typing import List, Optional
+from datetime import datetime
+from pydantic import BaseModel, Field
+from typing import List, Optional, Literal, Union
+
+class AgeSuccessProbability(BaseModel):
+    age: int
+    probability: float # Fraction of simulated paths that never run out of money when retiring at `age`
 
 class ProjectionResult(BaseModel):
     lifestyle: str  # e.g., "frugal", "content", "luxury"
     retirement_age: Optional[int]
     can_retire: bool # True if retirement_age is not None, False otherwise
+    success_probabilities: Optional[List[AgeSuccessProbability]] = None # Only set in Monte Carlo mode
 
     # Optional: Add a constructor or validator to set can_retire based on retirement_age
     # from pydantic import root_validator
@@ -16,3 +22,74 @@ class ProjectionResult(BaseModel):
 
 class ProjectionResponse(BaseModel):
     projections: List[ProjectionResult]
+    mode: Literal["deterministic", "montecarlo"] = "deterministic"
+
+class GoalSeekResponse(BaseModel):
+    lifestyle: str
+    target_retirement_age: int
+    mode: Literal["annual_contribution", "lump_sum"]
+    required_amount: Optional[float] # Extra amount needed; 0 if already on track, None if unreachable
+    projected_retirement_age: Optional[int] # Retirement age once the extra amount is added
+    achievable: bool
+
+class SensitivityGridResult(BaseModel):
+    lifestyle: str
+    # retirement_ages[i][j] is the age for return_rates[i] and inflation_rates[j]; None if not possible
+    retirement_ages: List[List[Optional[int]]]
+
+class SensitivityResponse(BaseModel):
+    return_rates: List[float]
+    inflation_rates: List[float]
+    grids: List[SensitivityGridResult]
+
+class TimelineYearResult(BaseModel):
+    age: int
+    balance: float      # Savings at the start of the year (nominal)
+    contribution: float # Saved at the end of the year; 0 once retired
+    expenses: float     # Withdrawn at the start of the year; 0 before retirement
+    phase: Literal["accumulation", "retirement", "depleted"]
+
+class TimelinePage(BaseModel):
+    lifestyle: str
+    retirement_age: Optional[int] # Age the timeline retires at; None if it never does
+    total: int                    # Years in the whole timeline (current age to life expectancy)
+    offset: int
+    next_offset: Optional[int]    # Offset of the next page; None on the last page
+    items: List[TimelineYearResult]
+
+# --- Background projection jobs (POST /user/projections/jobs) ---
+# Jobs accept larger workloads than the synchronous endpoints.
+MAX_JOB_SENSITIVITY_STEPS = 301
+MAX_JOB_SIMULATION_PATHS = 1_000_000
+
+class SensitivityJobCreate(BaseModel):
+    """A sensitivity sweep; the ranges default to the user's assumptions as in GET /sensitivity."""
+    kind: Literal["sensitivity"]
+    return_rate_min: Optional[float] = Field(None, gt=-1)
+    return_rate_max: Optional[float] = Field(None, gt=-1)
+    return_rate_steps: int = Field(7, ge=1, le=MAX_JOB_SENSITIVITY_STEPS)
+    inflation_rate_min: Optional[float] = Field(None, ge=0)
+    inflation_rate_max: Optional[float] = Field(None, ge=0)
+    inflation_rate_steps: int = Field(5, ge=1, le=MAX_JOB_SENSITIVITY_STEPS)
+
+class MonteCarloJobCreate(BaseModel):
+    """A Monte Carlo projection; unset parameters take the GET /?mode=montecarlo defaults."""
+    kind: Literal["montecarlo"]
+    seed: Optional[int] = None
+    paths: Optional[int] = Field(None, ge=1, le=MAX_JOB_SIMULATION_PATHS)
+    success_probability: Optional[float] = Field(None, gt=0, le=1)
+    return_volatility: Optional[float] = Field(None, ge=0)
+    inflation_volatility: Optional[float] = Field(None, ge=0)
+
+# Request bodies are told apart by `kind`: declare the parameter with Body(..., discriminator="kind")
+ProjectionJobCreate = Union[SensitivityJobCreate, MonteCarloJobCreate]
+
+class ProjectionJobStatus(BaseModel):
+    id: str
+    kind: Literal["sensitivity", "montecarlo"]
+    status: Literal["queued", "running", "succeeded", "failed"]
+    progress: float                  # Fraction of the work done, 0 to 1
+    created_at: datetime
+    finished_at: Optional[datetime]
+    expires_at: Optional[datetime]   # The job and its result are forgotten after this
+    error: Optional[str]             # Why a failed job failed
@@ -0,0 +1,4 @@
+# This file makes the 'benchmarks' directory a Python package.
+# Run the benchmarks from the repository root, e.g. `python -m backend.benchmarks.bench_async`.
+# `python -m backend.benchmarks.suite` runs the regression suite (bench_core, bench_endpoints)
+# and compares it against a stored JSON baseline.
@@ -0,0 +1,163 @@
+"""
+Load benchmark: sync endpoints (threadpool + sync engine) vs async endpoints (async engine).
+
+Both apps are driven in-process through httpx's ASGI transport against the same seeded SQLite
+file, so the numbers compare the two request stacks without network noise; `--db-latency-ms`
+adds a simulated database round trip to every statement. Each concurrency level issues
+`--requests` requests from that many concurrent clients, cycling through a mix of ledger,
+assumption and projection reads.
+
+    python -m backend.benchmarks.bench_async --requests 2000 --concurrency 1 16 64 256
+"""
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+import httpx
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+from sqlalchemy.util import await_only
+
+from ..app import models, schemas
+from ..app.crud import crud_expense, crud_saving, crud_user
+from ..app.database import Base, ReadSessionLocal, SessionLocal
+from ..app.database_async import AsyncSessionLocal
+from ..app.main import create_app
+
+AUTH_HEADERS = {"Authorization": "Bearer bench-token"}
+REQUEST_MIX = [
+    "/user/expenses/?limit=50",
+    "/user/assumptions/",
+    "/user/projections/",
+    "/user/savings/?limit=50",
+]
+LEDGER_ITEMS = 50
+
+
+def seed_database(database_path: Path) -> None:
+    engine = create_engine(f"sqlite:///{database_path}")
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    # The auth stub resolves every token to this email
+    user = crud_user.create_user(
+        db, schemas.user.UserCreate(email="fakeuser@example.com", google_id="bench-google-id", age=30)
+    )
+    db.add(models.assumption.Assumption(user_id=user.id, return_rate=0.06, inflation_rate=0.025, life_expectancy=90))
+    db.commit()
+    for i in range(LEDGER_ITEMS):
+        crud_expense.create_user_expense(
+            db, schemas.expense.ExpenseCreate(name=f"Expense {i}", amount=100 + i, frequency="monthly"), user.id
+        )
+        crud_saving.create_user_saving(
+            db, schemas.saving.SavingCreate(name=f"Saving {i}", amount=50 + i, frequency="monthly"), user.id
+        )
+    db.close()
+    engine.dispose()
+
+
+def add_simulated_latency(engine, latency_seconds: float, use_async_db: bool) -> None:
+    """
+    Delays every statement by `latency_seconds`, standing in for the network round trip to a
+    database server (SQLite answers in microseconds, which hides what the two stacks do while
+    waiting). The sync engine blocks its worker thread; the async engine yields to the event loop.
+    """
+    if latency_seconds <= 0:
+        return
+    if use_async_db:
+        def before_cursor_execute(*_):
+            await_only(asyncio.sleep(latency_seconds))
+        event.listen(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    else:
+        def before_cursor_execute(*_):
+            time.sleep(latency_seconds)
+        event.listen(engine, "before_cursor_execute", before_cursor_execute)
+
+
+def build_app(use_async_db: bool, database_path: Path, latency_seconds: float, pool_size: int):
+    """
+    The app in the given mode, with its session factory rebound to the benchmark database.
+    Rebinding (rather than dependency_overrides, which FastAPI re-analyses on every request)
+    keeps the request path identical to production.
+    """
+    if use_async_db:
+        engine = create_async_engine(
+            f"sqlite+aiosqlite:///{database_path}", poolclass=AsyncAdaptedQueuePool, pool_size=pool_size
+        )
+        AsyncSessionLocal.configure(bind=engine)
+    else:
+        engine = create_engine(
+            f"sqlite:///{database_path}", connect_args={"check_same_thread": False},
+            poolclass=QueuePool, pool_size=pool_size
+        )
+        SessionLocal.configure(bind=engine)
+        ReadSessionLocal.configure(bind=engine)
+    add_simulated_latency(engine, latency_seconds, use_async_db)
+    return create_app(use_async_db=use_async_db), engine
+
+
+async def run_load(app, total_requests: int, concurrency: int) -> Dict[str, float]:
+    latencies: List[float] = []
+    next_request = iter(range(total_requests))
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+        async def worker() -> None:
+            for i in next_request:
+                started = time.perf_counter()
+                response = await client.get(REQUEST_MIX[i % len(REQUEST_MIX)], headers=AUTH_HEADERS)
+                latencies.append(time.perf_counter() - started)
+                response.raise_for_status()
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "rps": total_requests / elapsed,
+        "p50_ms": 1000 * statistics.median(latencies),
+        "p95_ms": 1000 * latencies[int(0.95 * (len(latencies) - 1))],
+    }
+
+
+async def run_benchmark(args: argparse.Namespace, database_path: Path) -> None:
+    # One event loop for the whole run: pooled aiosqlite connections belong to the loop that opened them.
+    latency_seconds = args.db_latency_ms / 1000
+    pool_size = args.pool_size or max(args.concurrency)
+    sync_app, sync_engine = build_app(False, database_path, latency_seconds, pool_size)
+    async_app, async_engine = build_app(True, database_path, latency_seconds, pool_size)
+    try:
+        print(f"{'mode':<6} {'concurrency':>11} {'req/s':>9} {'p50 ms':>8} {'p95 ms':>8}")
+        for concurrency in args.concurrency:
+            for mode, app in (("sync", sync_app), ("async", async_app)):
+                result = await run_load(app, args.requests, concurrency)
+                print(f"{mode:<6} {concurrency:>11} {result['rps']:>9.0f} {result['p50_ms']:>8.2f} {result['p95_ms']:>8.2f}")
+    finally:
+        sync_engine.dispose()
+        await async_engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=2000, help="Requests per concurrency level")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 16, 64, 256])
+    parser.add_argument("--db-latency-ms", type=float, default=5.0, help="Simulated database round trip per statement")
+    # Defaults to the highest concurrency: a sync request keeps its pooled connection until its
+    # generator dependency is closed on the (shared, 40 thread) threadpool, so a pool smaller
+    # than the number of in-flight requests can deadlock the sync app.
+    parser.add_argument("--pool-size", type=int, default=None, help="Connections per engine")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        database_path = Path(directory) / "bench.db"
+        seed_database(database_path)
+        asyncio.run(run_benchmark(args, database_path))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Micro-benchmarks of the projection core, with no database or HTTP involved:
+- calculate_retirement_projection from current ages 18 to 90 (life expectancy 95), i.e. from
+  the longest horizon down to a handful of years;
+- get_total_annual_amount over 10 to 100k ledger items.
+
+    python -m backend.benchmarks.bench_core [--output core.json]
+
+Part of the suite (python -m backend.benchmarks.suite), which also compares against a baseline.
+"""
+import argparse
+import itertools
+from pathlib import Path
+from typing import List, NamedTuple
+
+from ..app.core.projections import calculate_retirement_projection, get_total_annual_amount
+from .harness import DEFAULT_REPEAT, BenchmarkResult, measure, print_results, write_results
+
+PROJECTION_AGES = (18, 30, 45, 60, 75, 90)
+ITEM_COUNTS = (10, 1_000, 10_000, 100_000)
+LIFE_EXPECTANCY = 95
+
+
+class LedgerItem(NamedTuple):
+    # Same attributes get_total_annual_amount reads from Expense / Saving rows
+    name: str
+    amount: float
+    frequency: str
+
+
+def ledger_items(count: int) -> List[LedgerItem]:
+    frequencies = itertools.cycle(["monthly", "quarterly", "yearly", "one-time"])
+    return [LedgerItem(f"Item {i}", 100.0 + i % 500, next(frequencies)) for i in range(count)]
+
+
+def collect(repeat: int = DEFAULT_REPEAT) -> List[BenchmarkResult]:
+    results = []
+    for age in PROJECTION_AGES:
+        inputs = dict(
+            current_age=age,
+            current_savings_total=50_000,
+            annual_savings_contribution=15_000,
+            base_annual_expenses=40_000,
+            investment_return_rate=0.06,
+            inflation_rate=0.025,
+            life_expectancy=LIFE_EXPECTANCY,
+            expense_multiplier=1.5
+        )
+        results.append(measure(
+            f"core.calculate_retirement_projection[age={age}]",
+            lambda inputs=inputs: calculate_retirement_projection(**inputs),
+            repeat
+        ))
+    for count in ITEM_COUNTS:
+        items = ledger_items(count)
+        results.append(measure(
+            f"core.get_total_annual_amount[items={count}]", lambda items=items: get_total_annual_amount(items), repeat
+        ))
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument("--output", type=Path, help="Write the results as JSON")
+    args = parser.parse_args()
+
+    results = collect(args.repeat)
+    print_results(results)
+    if args.output:
+        write_results(args.output, results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+Concurrent read/write benchmark of the database layer.
+
+Writer threads add expenses through the CRUD layer (item insert, ledger totals update, data
+version bump, commit) while reader threads load the user context and a page of expenses, the
+work behind most GET endpoints. Two configurations are compared on a fresh SQLite file each:
+
+- before: the previous engine (default rollback journal, a new connection per session).
+- after:  create_database_engine (WAL, synchronous=NORMAL, mmap, cache_size, busy_timeout,
+          pooled connections) with reads on the separate read-only engine.
+
+    python -m backend.benchmarks.bench_database --seconds 5 --readers 8 --writers 2
+"""
+import argparse
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict
+
+from sqlalchemy import create_engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+from ..app import schemas
+from ..app.crud import crud_expense, crud_user
+from ..app.database import Base, create_database_engine
+
+USER_EMAIL = "bench@example.com"
+SEED_EXPENSES = 200
+
+
+def build_engines(configuration: str, url: str):
+    """(write engine, read engine) for the given configuration."""
+    if configuration == "before":
+        engine = create_engine(url, connect_args={"check_same_thread": False})
+        return engine, engine
+    return create_database_engine(url), create_database_engine(url, read_only=True)
+
+
+def seed(engine) -> int:
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    user = crud_user.create_user(db, schemas.user.UserCreate(email=USER_EMAIL, google_id="bench-google-id", age=30))
+    for i in range(SEED_EXPENSES):
+        crud_expense.create_user_expense(
+            db, schemas.expense.ExpenseCreate(name=f"Expense {i}", amount=100 + i, frequency="monthly"), user.id
+        )
+    user_id = user.id
+    db.close()
+    return user_id
+
+
+def run_workers(
+    worker_counts: Dict[str, int], operations: Dict[str, Callable[[], None]], seconds: float
+) -> Dict[str, Dict[str, int]]:
+    deadline = time.perf_counter() + seconds
+    results = {kind: {"ops": 0, "errors": 0} for kind in worker_counts}
+    lock = threading.Lock()
+
+    def worker(kind: str) -> None:
+        ops = errors = 0
+        while time.perf_counter() < deadline:
+            try:
+                operations[kind]()
+                ops += 1
+            except OperationalError: # "database is locked"
+                errors += 1
+        with lock:
+            results[kind]["ops"] += ops
+            results[kind]["errors"] += errors
+
+    threads = [
+        threading.Thread(target=worker, args=(kind,))
+        for kind, count in worker_counts.items() for _ in range(count)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def benchmark(configuration: str, directory: Path, args: argparse.Namespace) -> Dict[str, Dict[str, int]]:
+    url = f"sqlite:///{directory / f'{configuration}.db'}"
+    engine, read_engine = build_engines(configuration, url)
+    user_id = seed(engine)
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=read_engine)
+    expense = schemas.expense.ExpenseCreate(name="Coffee", amount=4.5, frequency="monthly")
+
+    def write() -> None:
+        db = SessionLocal()
+        try:
+            crud_expense.create_user_expense(db, expense, user_id)
+        finally:
+            db.close()
+
+    def read() -> None:
+        db = ReadSessionLocal()
+        try:
+            crud_user.get_user_context(db, email=USER_EMAIL)
+            crud_expense.get_expenses_by_user(db, user_id=user_id, limit=50)
+        finally:
+            db.close()
+
+    results = run_workers({"read": args.readers, "write": args.writers}, {"read": read, "write": write}, args.seconds)
+    engine.dispose()
+    read_engine.dispose()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--writers", type=int, default=2)
+    args = parser.parse_args()
+
+    print(f"{'config':<7} {'reads/s':>9} {'writes/s':>9} {'errors':>7}")
+    with tempfile.TemporaryDirectory() as directory:
+        for configuration in ("before", "after"):
+            results = benchmark(configuration, Path(directory), args)
+            errors = results["read"]["errors"] + results["write"]["errors"]
+            print(
+                f"{configuration:<7} {results['read']['ops'] / args.seconds:>9.0f} "
+                f"{results['write']['ops'] / args.seconds:>9.0f} {errors:>7}"
+            )
+
+
+if __name__ == "__main__":
+    main()
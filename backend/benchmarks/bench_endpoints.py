@@ -0,0 +1,107 @@
+"""
+Endpoint benchmarks: the sync app driven through FastAPI's TestClient against a seeded SQLite
+file (one user with an assumption and LEDGER_ITEMS expenses and savings), so each case covers
+routing, dependencies, the database round trips and response serialization.
+
+    python -m backend.benchmarks.bench_endpoints [--ledger-items 200] [--output endpoints.json]
+
+Part of the suite (python -m backend.benchmarks.suite), which also compares against a baseline.
+"""
+import argparse
+import tempfile
+from pathlib import Path
+from typing import Callable, Dict, List
+
+from fastapi.testclient import TestClient
+
+from ..app import models, schemas
+from ..app.core.cache import projection_cache
+from ..app.core.identity_cache import identity_cache
+from ..app.crud import crud_expense, crud_saving, crud_user
+from ..app.database import Base, ReadSessionLocal, SessionLocal, create_database_engine
+from ..app.main import create_app
+from .harness import DEFAULT_REPEAT, BenchmarkResult, measure, print_results, write_results
+
+AUTH_HEADERS = {"Authorization": "Bearer bench-token"}
+LEDGER_ITEMS = 200
+
+
+def seed_database(db, ledger_items: int) -> None:
+    # The auth stub resolves every token to this email
+    user = crud_user.create_user(
+        db, schemas.user.UserCreate(email="fakeuser@example.com", google_id="bench-google-id", age=30)
+    )
+    db.add(models.assumption.Assumption(user_id=user.id, return_rate=0.06, inflation_rate=0.025, life_expectancy=90))
+    db.commit()
+    crud_expense.create_user_expenses_bulk(db, [
+        schemas.expense.ExpenseCreate(name=f"Expense {i}", amount=100 + i, frequency="monthly") for i in range(ledger_items)
+    ], user.id)
+    crud_saving.create_user_savings_bulk(db, [
+        schemas.saving.SavingCreate(name=f"Saving {i}", amount=50 + i, frequency="monthly") for i in range(ledger_items)
+    ] + [schemas.saving.SavingCreate(name="Current Total Savings", amount=100_000, frequency="yearly")], user.id)
+
+
+def cases(client: TestClient) -> Dict[str, Callable[[], object]]:
+    def get(path: str, **params) -> Callable[[], object]:
+        def request():
+            client.get(path, params=params, headers=AUTH_HEADERS).raise_for_status()
+        return request
+
+    def uncached_projection():
+        projection_cache.clear()
+        client.get("/user/projections/", headers=AUTH_HEADERS).raise_for_status()
+
+    def create_expense():
+        client.post(
+            "/user/expenses/", json={"name": "Coffee", "amount": 4.5, "frequency": "monthly"}, headers=AUTH_HEADERS
+        ).raise_for_status()
+
+    return {
+        "endpoint.GET /user/profile": get("/user/profile"),
+        "endpoint.GET /user/assumptions/": get("/user/assumptions/"),
+        "endpoint.GET /user/expenses/[limit=100]": get("/user/expenses/", limit=100),
+        "endpoint.GET /user/projections/[cached]": get("/user/projections/"),
+        "endpoint.GET /user/projections/[uncached]": uncached_projection,
+        "endpoint.GET /user/projections/goal": get("/user/projections/goal", target_age=55, lifestyle="content"),
+        "endpoint.GET /user/projections/timeline[limit=50]": get("/user/projections/timeline", limit=50),
+        "endpoint.POST /user/expenses/": create_expense,
+    }
+
+
+def collect(repeat: int = DEFAULT_REPEAT, ledger_items: int = LEDGER_ITEMS) -> List[BenchmarkResult]:
+    with tempfile.TemporaryDirectory() as directory:
+        url = f"sqlite:///{Path(directory) / 'bench.db'}"
+        engine = create_database_engine(url)
+        read_engine = create_database_engine(url, read_only=True)
+        Base.metadata.create_all(bind=engine)
+        # Rebind the app's session factories (as bench_async does) rather than overriding dependencies
+        SessionLocal.configure(bind=engine)
+        ReadSessionLocal.configure(bind=read_engine)
+        with SessionLocal() as db:
+            seed_database(db, ledger_items)
+
+        # No `with TestClient(...)`: the startup handler would create tables on the configured database
+        client = TestClient(create_app(use_async_db=False))
+        results = [measure(name, request, repeat) for name, request in cases(client).items()]
+        projection_cache.clear()
+        identity_cache.clear()
+        engine.dispose()
+        read_engine.dispose()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument("--ledger-items", type=int, default=LEDGER_ITEMS, help="Expenses and savings of the seeded user")
+    parser.add_argument("--output", type=Path, help="Write the results as JSON")
+    args = parser.parse_args()
+
+    results = collect(args.repeat, args.ledger_items)
+    print_results(results)
+    if args.output:
+        write_results(args.output, results)
+
+
+if __name__ == "__main__":
+    main()
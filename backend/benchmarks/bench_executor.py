@@ -0,0 +1,123 @@
+"""
+Tail latency of cheap requests while CPU-heavy projections run, per projection executor backend.
+
+Concurrent clients drive the app in-process (httpx ASGI transport, seeded SQLite file). Each
+request is a heavy unseeded Monte Carlo projection (never cached) with probability
+`--heavy-fraction`, otherwise a cheap ledger or cached projection read. Inline, heavy jobs
+occupy the request's worker (in async mode the event loop itself), so the cheap requests queue
+behind them. With a pool they only wait for the GIL-free parts of the simulation.
+Refused jobs (503, queue full) are counted separately.
+
+    python -m backend.benchmarks.bench_executor --backends inline thread process --mode async
+"""
+import argparse
+import asyncio
+import random
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, NamedTuple
+
+import httpx
+
+from ..app.core.executor import projection_executor
+from .bench_async import AUTH_HEADERS, build_app, seed_database
+from .load_test import percentile
+
+LIGHT_REQUESTS = ["/user/expenses/?limit=50", "/user/projections/", "/user/assumptions/"]
+HEAVY_PATHS = 20_000
+
+
+class LatencyStats(NamedTuple):
+    backend: str
+    light_p50_ms: float
+    light_p95_ms: float
+    light_p99_ms: float
+    heavy_p50_ms: float
+    heavy_p99_ms: float
+    rejected: int
+    rps: float
+
+
+async def run_mixed_load(app, total_requests: int, concurrency: int, heavy_fraction: float, seed: int) -> Dict[str, List]:
+    latencies: Dict[str, List] = {"light": [], "heavy": [], "rejected": []}
+    next_request = iter(range(total_requests))
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def worker(index: int) -> None:
+            rng = random.Random(seed * 100_003 + index)
+            for _ in next_request:
+                heavy = rng.random() < heavy_fraction
+                if heavy:
+                    path, params = "/user/projections/", {"mode": "montecarlo", "paths": HEAVY_PATHS}
+                else:
+                    path, params = rng.choice(LIGHT_REQUESTS), None
+                started = time.perf_counter()
+                response = await client.get(path, params=params, headers=AUTH_HEADERS)
+                elapsed = time.perf_counter() - started
+                if response.status_code == 503:
+                    latencies["rejected"].append(elapsed)
+                else:
+                    response.raise_for_status()
+                    latencies["heavy" if heavy else "light"].append(elapsed)
+
+        await asyncio.gather(*(worker(i) for i in range(concurrency)))
+    return latencies
+
+
+async def run_benchmark(args: argparse.Namespace, database_path: Path) -> List[LatencyStats]:
+    app, engine = build_app(args.mode == "async", database_path, 0.0, args.concurrency)
+    results = []
+    try:
+        for backend in args.backends:
+            projection_executor.configure(
+                backend=backend, workers=args.workers, max_queue_depth=args.max_queue_depth
+            )
+            started = time.perf_counter()
+            latencies = await run_mixed_load(app, args.requests, args.concurrency, args.heavy_fraction, args.seed)
+            elapsed = time.perf_counter() - started
+            light, heavy = sorted(latencies["light"]), sorted(latencies["heavy"])
+            results.append(LatencyStats(
+                backend,
+                1000 * percentile(light, 0.50), 1000 * percentile(light, 0.95), 1000 * percentile(light, 0.99),
+                1000 * percentile(heavy, 0.50), 1000 * percentile(heavy, 0.99),
+                len(latencies["rejected"]), args.requests / elapsed
+            ))
+    finally:
+        projection_executor.shutdown()
+        if args.mode == "async":
+            await engine.dispose()
+        else:
+            engine.dispose()
+    return results
+
+
+def print_stats(rows: List[LatencyStats]) -> None:
+    print(f"{'backend':<8} {'light p50':>10} {'light p95':>10} {'light p99':>10} {'heavy p50':>10} {'heavy p99':>10} {'503s':>5} {'req/s':>7}")
+    for row in rows:
+        print(
+            f"{row.backend:<8} {row.light_p50_ms:>10.2f} {row.light_p95_ms:>10.2f} {row.light_p99_ms:>10.2f} "
+            f"{row.heavy_p50_ms:>10.2f} {row.heavy_p99_ms:>10.2f} {row.rejected:>5} {row.rps:>7.0f}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--backends", nargs="+", default=["inline", "thread", "process"], choices=["inline", "thread", "process"])
+    parser.add_argument("--mode", choices=["async", "sync"], default="async", help="Which app (endpoint stack) to drive")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--heavy-fraction", type=float, default=0.05, help="Share of requests that are heavy projections")
+    parser.add_argument("--workers", type=int, default=None, help="Executor pool size (default: CPU count)")
+    parser.add_argument("--max-queue-depth", type=int, default=64)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        database_path = Path(directory) / "bench.db"
+        seed_database(database_path)
+        print_stats(asyncio.run(run_benchmark(args, database_path)))
+
+
+if __name__ == "__main__":
+    main()
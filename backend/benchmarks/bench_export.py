@@ -0,0 +1,85 @@
+"""
+Memory profile of the streaming ledger export.
+
+For each ledger size the user's expenses are exported twice on a SQLite file:
+- streamed: iter_expense_rows_by_user + encode_rows (what GET /user/expenses/export does).
+- list: get_expenses_by_user with no limit, serialized through the Expense schema (what a
+  non-streaming endpoint returning every row would do).
+Peak Python memory (tracemalloc) is reported for each; the streamed peak should stay flat.
+
+    python -m backend.benchmarks.bench_export --rows 50 50000 500000
+"""
+import argparse
+import json
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Tuple
+
+from sqlalchemy import insert
+from sqlalchemy.orm import sessionmaker
+
+from ..app import models, schemas
+from ..app.api.export import EXPORT_CHUNK_ROWS, encode_rows
+from ..app.crud import crud_expense, crud_user
+from ..app.database import Base, create_database_engine
+
+SEED_BATCH_ROWS = 50_000
+
+
+def seed(db, rows: int) -> int:
+    user = crud_user.create_user(db, schemas.user.UserCreate(email="bench@example.com", google_id="bench-google-id", age=30))
+    for start in range(0, rows, SEED_BATCH_ROWS):
+        db.execute(insert(models.expense.Expense), [
+            {"name": f"Expense {i}", "amount": float(i), "frequency": "monthly", "user_id": user.id}
+            for i in range(start, min(start + SEED_BATCH_ROWS, rows))
+        ])
+    db.commit()
+    return user.id
+
+
+def measure(export: Callable[[], int]) -> Tuple[float, float, int]:
+    """(peak MiB, seconds, bytes produced) of one export."""
+    tracemalloc.start()
+    started = time.perf_counter()
+    produced = export()
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / (1024 * 1024), elapsed, produced
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=[50, 50_000, 500_000])
+    args = parser.parse_args()
+
+    print(f"{'rows':>8} {'mode':<9} {'peak MiB':>9} {'seconds':>8} {'MiB out':>8}")
+    with tempfile.TemporaryDirectory() as directory:
+        for rows in args.rows:
+            engine = create_database_engine(f"sqlite:///{Path(directory) / f'export_{rows}.db'}")
+            Base.metadata.create_all(bind=engine)
+            SessionLocal = sessionmaker(bind=engine)
+            with SessionLocal() as db:
+                user_id = seed(db, rows)
+
+            def streamed() -> int:
+                with SessionLocal() as db:
+                    row_iter = crud_expense.iter_expense_rows_by_user(db, user_id, batch_size=EXPORT_CHUNK_ROWS)
+                    return sum(len(chunk) for chunk in encode_rows(row_iter, crud_expense.EXPORT_COLUMNS, "ndjson"))
+
+            def materialized() -> int:
+                with SessionLocal() as db:
+                    expenses = crud_expense.get_expenses_by_user(db, user_id, limit=None)
+                    body = json.dumps([schemas.expense.Expense.from_orm(expense).dict() for expense in expenses])
+                    return len(body)
+
+            for mode, export in (("streamed", streamed), ("list", materialized)):
+                peak, elapsed, produced = measure(export)
+                print(f"{rows:>8} {mode:<9} {peak:>9.1f} {elapsed:>8.2f} {produced / (1024 * 1024):>8.1f}")
+            engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
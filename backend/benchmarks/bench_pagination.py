@@ -0,0 +1,94 @@
+"""
+Page fetch latency of the ledger listing at increasing depths: OFFSET vs keyset (cursor).
+
+One user's expenses are interleaved with other users' rows on a SQLite file (as in a shared
+table), then a 100-row page is fetched at each depth with
+- offset: get_expenses_by_user(skip=depth), which walks past every skipped row;
+- keyset: get_expenses_by_user(after_id=<id at depth>), which seeks on the (user_id, id) index.
+Both are measured with and without the composite index (dropped for the "no index" runs).
+Keyset times should stay flat as the depth grows.
+
+    python -m backend.benchmarks.bench_pagination --rows 200000 --depths 0 1000 10000 100000 190000
+"""
+import argparse
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, List
+
+from sqlalchemy import insert, select, text
+from sqlalchemy.orm import sessionmaker
+
+from ..app import models, schemas
+from ..app.crud import crud_expense, crud_user
+from ..app.database import Base, create_database_engine
+
+SEED_BATCH_ROWS = 50_000
+PAGE_SIZE = 100
+OTHER_USERS = 3 # Rows of other users between each of the benchmarked user's rows
+
+
+def seed(db, rows: int) -> int:
+    users = [
+        crud_user.create_user(db, schemas.user.UserCreate(email=f"bench{i}@example.com", google_id=f"bench-{i}", age=30))
+        for i in range(OTHER_USERS + 1)
+    ]
+    user_ids = [user.id for user in users]
+    total_rows = rows * len(user_ids)
+    for start in range(0, total_rows, SEED_BATCH_ROWS):
+        db.execute(insert(models.expense.Expense), [
+            {"name": f"Expense {i}", "amount": float(i), "frequency": "monthly", "user_id": user_ids[i % len(user_ids)]}
+            for i in range(start, min(start + SEED_BATCH_ROWS, total_rows))
+        ])
+    db.commit()
+    return user_ids[0]
+
+
+def median_ms(fetch: Callable[[], List], repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        page = fetch()
+        timings.append((time.perf_counter() - started) * 1000)
+        assert len(page) == PAGE_SIZE
+    return statistics.median(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=200_000, help="Expenses of the benchmarked user")
+    parser.add_argument("--depths", type=int, nargs="+", default=[0, 1_000, 10_000, 100_000, 190_000])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_database_engine(f"sqlite:///{Path(directory) / 'pagination.db'}")
+        Base.metadata.create_all(bind=engine)
+        SessionLocal = sessionmaker(bind=engine)
+        with SessionLocal() as db:
+            user_id = seed(db, args.rows)
+            Expense = models.expense.Expense
+            ids = db.execute(select(Expense.id).where(Expense.user_id == user_id).order_by(Expense.id)).scalars().all()
+
+        print(f"{'index':<9} {'depth':>8} {'offset ms':>10} {'keyset ms':>10}")
+        for indexed in (True, False):
+            if not indexed:
+                with engine.begin() as connection:
+                    connection.execute(text("DROP INDEX ix_expenses_user_id_id"))
+            with SessionLocal() as db:
+                for depth in args.depths:
+                    # The keyset page after the row just before `depth` is the same page as OFFSET depth
+                    after_id = ids[depth - 1] if depth else None
+                    offset_ms = median_ms(
+                        lambda: crud_expense.get_expenses_by_user(db, user_id, skip=depth, limit=PAGE_SIZE), args.repeat
+                    )
+                    keyset_ms = median_ms(
+                        lambda: crud_expense.get_expenses_by_user(db, user_id, limit=PAGE_SIZE, after_id=after_id), args.repeat
+                    )
+                    print(f"{'user_id,id' if indexed else 'none':<9} {depth:>8} {offset_ms:>10.2f} {keyset_ms:>10.2f}")
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""
+Cost of serializing large ledger listings: response_model validation vs the fast JSON path.
+
+One user's expenses (default 10k) are stored in a SQLite file and measured two ways:
+- serialize: the rows already loaded, encoded as FastAPI's default path does (Expense.from_orm
+  for each row, jsonable_encoder, json.dumps) and as the fast path does (RowSerializer, then
+  orjson or the json module); plus what gzip costs and saves on the result at a few levels.
+- endpoint: the whole listing fetched through the app (GET /user/expenses/, following the
+  cursor in 1000-row pages) with fast_json off and on, and with gzip on top.
+
+    python -m backend.benchmarks.bench_serialization --rows 10000
+"""
+import argparse
+import asyncio
+import gzip
+import json
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+import httpx
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from ..app import models, schemas
+from ..app.api import fast_json
+from ..app.api.endpoints.expense import expense_rows
+from ..app.api.pagination import MAX_PAGE_SIZE, NEXT_CURSOR_HEADER
+from ..app.crud import crud_expense, crud_user
+from ..app.database import Base
+from ..app.main import create_app
+from .bench_async import AUTH_HEADERS, build_app
+
+
+def seed(database_path: Path, rows: int) -> int:
+    engine = create_engine(f"sqlite:///{database_path}")
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    # The auth stub resolves every token to this email
+    user = crud_user.create_user(db, schemas.user.UserCreate(email="fakeuser@example.com", google_id="bench-google-id", age=30))
+    db.execute(insert(models.expense.Expense), [
+        {"name": f"Expense {i}", "amount": 100 + i * 0.37, "frequency": "monthly", "user_id": user.id}
+        for i in range(rows)
+    ])
+    db.commit()
+    user_id = user.id
+    db.close()
+    engine.dispose()
+    return user_id
+
+
+def best_ms(run: Callable[[], object], repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - started)
+    return 1000 * min(timings)
+
+
+def default_path(rows) -> bytes:
+    content = jsonable_encoder([schemas.expense.Expense.from_orm(row) for row in rows])
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+
+
+def json_module_dumps(content) -> bytes:
+    orjson, fast_json.orjson = fast_json.orjson, None
+    try:
+        return fast_json.dumps(content)
+    finally:
+        fast_json.orjson = orjson
+
+
+def measure_serialization(database_path: Path, user_id: int, rows: int, repeat: int) -> None:
+    engine = create_engine(f"sqlite:///{database_path}")
+    db = sessionmaker(bind=engine)()
+    loaded = crud_expense.get_expenses_by_user(db, user_id=user_id, limit=rows)
+    body = default_path(loaded)
+    assert json.loads(fast_json.dumps(expense_rows(loaded))) == json.loads(body)
+
+    print(f"serialize {len(loaded)} rows ({len(body) / 1024:.0f} KiB of JSON)")
+    print(f"  {'path':<32} {'ms':>8}")
+    for name, run in [
+        ("response_model (default)", lambda: default_path(loaded)),
+        ("RowSerializer + json module", lambda: json_module_dumps(expense_rows(loaded))),
+        ("RowSerializer + orjson" if fast_json.orjson else "RowSerializer (orjson missing)",
+         lambda: fast_json.dumps(expense_rows(loaded))),
+    ]:
+        print(f"  {name:<32} {best_ms(run, repeat):>8.2f}")
+    for level in (1, 5, 9):
+        compressed = gzip.compress(body, compresslevel=level)
+        ms = best_ms(lambda: gzip.compress(body, compresslevel=level), repeat)
+        print(f"  {f'gzip level {level}':<32} {ms:>8.2f}   {len(compressed) / 1024:.0f} KiB ({len(compressed) / len(body):.0%})")
+    db.close()
+    engine.dispose()
+
+
+async def fetch_listing(client: httpx.AsyncClient, headers: Dict[str, str]) -> Tuple[int, int]:
+    """Follows the cursor through the whole listing: (rows, bytes on the wire)."""
+    rows = transferred = 0
+    params: Dict[str, object] = {"limit": MAX_PAGE_SIZE}
+    while True:
+        response = await client.get("/user/expenses/", params=params, headers=headers)
+        response.raise_for_status()
+        rows += len(response.json())
+        transferred += response.num_bytes_downloaded
+        cursor: Optional[str] = response.headers.get(NEXT_CURSOR_HEADER)
+        if cursor is None:
+            return rows, transferred
+        params = {"limit": MAX_PAGE_SIZE, "cursor": cursor}
+
+
+async def measure_endpoint(database_path: Path, repeat: int) -> None:
+    _, engine = build_app(False, database_path, 0.0, 4) # Binds the app's sessions to the benchmark database
+    print(f"\nendpoint: whole listing in {MAX_PAGE_SIZE}-row pages")
+    print(f"  {'app':<24} {'median ms':>10} {'KiB sent':>9}")
+    try:
+        for name, fast, gzip_minimum_size in [
+            ("response_model", False, None),
+            ("fast_json", True, None),
+            ("fast_json + gzip", True, 1000),
+        ]:
+            app = create_app(use_async_db=False, metrics_enabled=False, fast_json=fast, gzip_minimum_size=gzip_minimum_size)
+            headers = {**AUTH_HEADERS, "Accept-Encoding": "gzip" if gzip_minimum_size is not None else "identity"}
+            timings: List[float] = []
+            async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+                await fetch_listing(client, headers) # Warm-up (identity cache, connections)
+                for _ in range(repeat):
+                    started = time.perf_counter()
+                    _, transferred = await fetch_listing(client, headers)
+                    timings.append(time.perf_counter() - started)
+            print(f"  {name:<24} {1000 * statistics.median(timings):>10.1f} {transferred / 1024:>9.0f}")
+    finally:
+        engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        database_path = Path(directory) / "bench.db"
+        user_id = seed(database_path, args.rows)
+        measure_serialization(database_path, user_id, args.rows, args.repeat)
+        asyncio.run(measure_endpoint(database_path, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
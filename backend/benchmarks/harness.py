@@ -0,0 +1,117 @@
+"""
+Shared plumbing of the benchmark suite (bench_core, bench_endpoints, suite): timing,
+JSON result files and comparison against a stored baseline.
+
+A result file looks like:
+
+    {"metadata": {"python": "3.11.7", "platform": "...", "created": "..."},
+     "results": [{"name": "core.calculate_retirement_projection[age=30]",
+                  "median_s": 1.2e-05, "min_s": 1.1e-05, "loops": 20000, "repeat": 5}, ...]}
+
+Times are per call. Comparisons use the median; a case regresses when its median exceeds the
+baseline's by more than the threshold (a fraction, 0.25 = 25% slower).
+"""
+import json
+import platform
+import statistics
+import sys
+import timeit
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence
+
+DEFAULT_REPEAT = 5
+DEFAULT_THRESHOLD = 0.25
+
+
+class BenchmarkResult(NamedTuple):
+    name: str
+    median_s: float # Per call
+    min_s: float    # Per call
+    loops: int      # Calls per timed repeat
+    repeat: int
+
+
+class Comparison(NamedTuple):
+    name: str
+    baseline_s: Optional[float] # None: new case, not in the baseline
+    current_s: Optional[float]  # None: case missing from the current run
+    ratio: Optional[float]      # current / baseline
+    regressed: bool
+
+
+def measure(name: str, func: Callable[[], object], repeat: int = DEFAULT_REPEAT) -> BenchmarkResult:
+    """
+    Times `func` with timeit: the loop count is calibrated so one repeat takes at least 0.2 s,
+    then `repeat` repeats are timed.
+    """
+    timer = timeit.Timer(func)
+    loops, _ = timer.autorange()
+    per_call = [total / loops for total in timer.repeat(repeat=repeat, number=loops)]
+    return BenchmarkResult(name, statistics.median(per_call), min(per_call), loops, repeat)
+
+
+def write_results(path: Path, results: Sequence[BenchmarkResult]) -> None:
+    document = {
+        "metadata": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        },
+        "results": [result._asdict() for result in results],
+    }
+    path.write_text(json.dumps(document, indent=2) + "\n")
+
+
+def load_results(path: Path) -> List[BenchmarkResult]:
+    document = json.loads(path.read_text())
+    return [BenchmarkResult(**result) for result in document["results"]]
+
+
+def compare(
+    current: Sequence[BenchmarkResult], baseline: Sequence[BenchmarkResult], threshold: float = DEFAULT_THRESHOLD
+) -> List[Comparison]:
+    """One Comparison per case of either run, in current-run order followed by baseline-only cases."""
+    baseline_by_name: Dict[str, BenchmarkResult] = {result.name: result for result in baseline}
+    current_names = {result.name for result in current}
+    comparisons = []
+    for result in current:
+        reference = baseline_by_name.get(result.name)
+        if reference is None:
+            comparisons.append(Comparison(result.name, None, result.median_s, None, False))
+            continue
+        ratio = result.median_s / reference.median_s
+        comparisons.append(Comparison(result.name, reference.median_s, result.median_s, ratio, ratio > 1 + threshold))
+    for reference in baseline:
+        if reference.name not in current_names:
+            comparisons.append(Comparison(reference.name, reference.median_s, None, None, False))
+    return comparisons
+
+
+def _format_time(seconds: Optional[float]) -> str:
+    if seconds is None:
+        return "-"
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f} {unit}"
+    return f"{seconds / 1e-9:.0f} ns"
+
+
+def print_results(results: Sequence[BenchmarkResult], out=sys.stdout) -> None:
+    width = max((len(result.name) for result in results), default=4)
+    print(f"{'case':<{width}} {'median':>10} {'min':>10} {'loops':>8}", file=out)
+    for result in results:
+        print(f"{result.name:<{width}} {_format_time(result.median_s):>10} {_format_time(result.min_s):>10} {result.loops:>8}", file=out)
+
+
+def print_comparisons(comparisons: Sequence[Comparison], out=sys.stdout) -> None:
+    width = max((len(comparison.name) for comparison in comparisons), default=4)
+    print(f"{'case':<{width}} {'baseline':>10} {'current':>10} {'ratio':>7}", file=out)
+    for comparison in comparisons:
+        ratio = "-" if comparison.ratio is None else f"{comparison.ratio:.2f}x"
+        flag = "  REGRESSION" if comparison.regressed else ""
+        print(
+            f"{comparison.name:<{width}} {_format_time(comparison.baseline_s):>10} "
+            f"{_format_time(comparison.current_s):>10} {ratio:>7}{flag}",
+            file=out
+        )
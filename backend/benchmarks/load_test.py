@@ -0,0 +1,212 @@
+"""
+In-process load test over a synthetic population (see population.py).
+
+Virtual clients drive the app through httpx's ASGI transport (no server, no network): each
+request picks a random population user and an endpoint from a weighted mix of projection reads
+and ledger / assumption reads and writes. Latency percentiles and throughput are reported per
+endpoint. Bearer tokens are mapped to population users by overriding the auth dependency.
+
+    python -m backend.benchmarks.load_test --users 500 --requests 5000 --concurrency 32
+    python -m backend.benchmarks.load_test --database population.db --async-db --duration 30
+
+Without --database a population is generated (from --seed) into a temporary SQLite file.
+"""
+import argparse
+import asyncio
+import json
+import random
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+import httpx
+from fastapi import Depends, HTTPException, status
+from sqlalchemy import func, select
+from sqlalchemy.orm import sessionmaker
+
+from ..app import models
+from ..app.auth import get_current_active_user, oauth2_scheme
+from ..app.database import Base, create_database_engine
+from .bench_async import build_app
+from .population import email_for_token, generate_population, population_token
+
+# (name, weight, request builder) - builders return (method, path, params, json body)
+RequestSpec = Tuple[str, str, Optional[Dict[str, Any]], Optional[Dict[str, Any]]]
+ENDPOINT_MIX: List[Tuple[str, int, Callable[[random.Random], RequestSpec]]] = [
+    ("GET /user/projections/", 30, lambda rng: ("GET", "/user/projections/", None, None)),
+    # Population ages are 22-70 and life expectancies 80-100, so every user can be asked for 71-79
+    ("GET /user/projections/goal", 5, lambda rng: (
+        "GET", "/user/projections/goal", {"target_age": rng.randint(71, 79), "lifestyle": "content"}, None
+    )),
+    ("GET /user/profile", 10, lambda rng: ("GET", "/user/profile", None, None)),
+    ("GET /user/assumptions/", 10, lambda rng: ("GET", "/user/assumptions/", None, None)),
+    ("GET /user/expenses/", 15, lambda rng: ("GET", "/user/expenses/", {"limit": 50}, None)),
+    ("GET /user/savings/", 10, lambda rng: ("GET", "/user/savings/", {"limit": 50}, None)),
+    ("POST /user/expenses/", 10, lambda rng: (
+        "POST", "/user/expenses/", None, {"name": "Load test", "amount": rng.randint(5, 500), "frequency": "monthly"}
+    )),
+    ("POST /user/savings/", 5, lambda rng: (
+        "POST", "/user/savings/", None, {"name": "Load test", "amount": rng.randint(50, 1000), "frequency": "monthly"}
+    )),
+    ("POST /user/assumptions/", 5, lambda rng: (
+        "POST", "/user/assumptions/", None, {"return_rate": rng.choice([0.05, 0.06, 0.07]), "inflation_rate": 0.02}
+    )),
+]
+
+
+class EndpointStats(NamedTuple):
+    endpoint: str
+    requests: int
+    errors: int
+    rps: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+
+
+async def population_user(token: str = Depends(oauth2_scheme)) -> Dict[str, Any]:
+    """Stands in for the auth stub: population_token(i) authenticates population user i."""
+    email = email_for_token(token)
+    if email is None:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Unknown load test token")
+    return {"username": email.split("@")[0], "email": email, "is_active": True}
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(int(round(fraction * len(sorted_values) + 0.5)) - 1, 0)
+    return sorted_values[min(rank, len(sorted_values) - 1)]
+
+
+def summarize(latencies: Dict[str, List[float]], errors: Dict[str, int], elapsed: float) -> List[EndpointStats]:
+    rows = []
+    every_latency: List[float] = []
+    for endpoint, _, _ in ENDPOINT_MIX:
+        values = sorted(latencies.get(endpoint, []))
+        every_latency += values
+        rows.append(EndpointStats(
+            endpoint, len(values), errors.get(endpoint, 0), len(values) / elapsed,
+            1000 * percentile(values, 0.50), 1000 * percentile(values, 0.95), 1000 * percentile(values, 0.99)
+        ))
+    every_latency.sort()
+    rows.append(EndpointStats(
+        "all", len(every_latency), sum(errors.values()), len(every_latency) / elapsed,
+        1000 * percentile(every_latency, 0.50), 1000 * percentile(every_latency, 0.95), 1000 * percentile(every_latency, 0.99)
+    ))
+    return rows
+
+
+async def run_load(
+    app, users: int, concurrency: int, total_requests: Optional[int], duration: Optional[float], seed: int
+) -> List[EndpointStats]:
+    latencies: Dict[str, List[float]] = {}
+    errors: Dict[str, int] = {}
+    issued = 0
+    names = [name for name, _, _ in ENDPOINT_MIX]
+    weights = [weight for _, weight, _ in ENDPOINT_MIX]
+    builders = {name: builder for name, _, builder in ENDPOINT_MIX}
+
+    # Unhandled server errors come back as 500 responses and are counted, instead of aborting the run
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+    async with httpx.AsyncClient(transport=transport, base_url="http://load-test") as client:
+        async def virtual_client(client_index: int, deadline: Optional[float]) -> None:
+            nonlocal issued
+            rng = random.Random(seed * 100_003 + client_index)
+            while True:
+                if total_requests is not None and issued >= total_requests:
+                    return
+                if deadline is not None and time.perf_counter() >= deadline:
+                    return
+                issued += 1
+                endpoint = rng.choices(names, weights=weights)[0]
+                method, path, params, body = builders[endpoint](rng)
+                headers = {"Authorization": f"Bearer {population_token(rng.randrange(users))}"}
+                started = time.perf_counter()
+                response = await client.request(method, path, params=params, json=body, headers=headers)
+                latencies.setdefault(endpoint, []).append(time.perf_counter() - started)
+                if response.status_code >= 400:
+                    errors[endpoint] = errors.get(endpoint, 0) + 1
+
+        started = time.perf_counter()
+        deadline = started + duration if duration is not None else None
+        await asyncio.gather(*(virtual_client(i, deadline) for i in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    return summarize(latencies, errors, elapsed)
+
+
+def count_population_users(database_path: Path) -> int:
+    engine = create_database_engine(f"sqlite:///{database_path}")
+    with engine.connect() as connection:
+        users = connection.execute(
+            select(func.count()).select_from(models.user.User).where(models.user.User.email.like("%@population.example"))
+        ).scalar()
+    engine.dispose()
+    return users
+
+
+async def run(args: argparse.Namespace, database_path: Path, users: int) -> List[EndpointStats]:
+    # One event loop for the whole run: pooled aiosqlite connections belong to the loop that opened them.
+    # The pool is sized to the concurrency (see bench_async for why the sync app needs that).
+    app, engine = build_app(args.async_db, database_path, latency_seconds=0.0, pool_size=args.concurrency)
+    app.dependency_overrides[get_current_active_user] = population_user
+    try:
+        return await run_load(app, users, args.concurrency, args.requests, args.duration, args.seed)
+    finally:
+        if args.async_db:
+            await engine.dispose()
+        else:
+            engine.dispose()
+
+
+def print_stats(rows: List[EndpointStats]) -> None:
+    print(f"{'endpoint':<28} {'requests':>8} {'errors':>6} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+    for row in rows:
+        print(
+            f"{row.endpoint:<28} {row.requests:>8} {row.errors:>6} {row.rps:>8.1f} "
+            f"{row.p50_ms:>8.2f} {row.p95_ms:>8.2f} {row.p99_ms:>8.2f}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database", type=Path, help="SQLite file seeded by population.py; default: generate one")
+    parser.add_argument("--users", type=int, default=500, help="Population size when generating")
+    parser.add_argument("--min-items", type=int, default=10)
+    parser.add_argument("--max-items", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0, help="Seeds the population and the request mix")
+    parser.add_argument("--concurrency", type=int, default=32, help="Virtual clients")
+    parser.add_argument("--requests", type=int, default=None, help="Total requests (default 2000 unless --duration)")
+    parser.add_argument("--duration", type=float, default=None, help="Seconds to run instead of a request count")
+    parser.add_argument("--async-db", action="store_true", help="Serve the async endpoints (USE_ASYNC_DB)")
+    parser.add_argument("--json", type=Path, help="Also write the per-endpoint stats as JSON")
+    args = parser.parse_args()
+    if args.requests is None and args.duration is None:
+        args.requests = 2000
+
+    with tempfile.TemporaryDirectory() as directory:
+        database_path = args.database
+        if database_path is None:
+            database_path = Path(directory) / "population.db"
+            engine = create_database_engine(f"sqlite:///{database_path}")
+            Base.metadata.create_all(bind=engine)
+            with sessionmaker(bind=engine)() as db:
+                summary = generate_population(db, args.users, args.min_items, args.max_items, args.seed)
+            engine.dispose()
+            print(f"Generated {summary.users} users, {summary.expenses} expenses, {summary.savings} savings")
+        users = count_population_users(database_path)
+        if users == 0:
+            parser.error(f"{database_path} has no population users; seed it with population.py")
+
+        rows = asyncio.run(run(args, database_path, users))
+
+    print_stats(rows)
+    if args.json:
+        args.json.write_text(json.dumps([row._asdict() for row in rows], indent=2) + "\n")
+
+
+if __name__ == "__main__":
+    main()
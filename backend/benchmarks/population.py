@@ -0,0 +1,187 @@
+"""
+Deterministic synthetic population for load tests and capacity planning.
+
+Generates `--users` users, each with an assumption, a log-uniform number of expenses between
+`--min-items` and `--max-items` (plus about a quarter as many savings, one of them the
+"Current Total Savings" lump sum) and matching ledger totals. The same seed always produces
+the same rows. Rows are written with executemany INSERTs in batches, bypassing the per-item
+CRUD path.
+
+User `i` (0-based) has the email population_email(i) and authenticates with the bearer token
+population_token(i); see load_test for the token -> user mapping.
+
+    python -m backend.benchmarks.population --database population.db --users 2000 --seed 7
+"""
+import argparse
+import math
+import random
+import time
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional
+
+from sqlalchemy import func, insert, select
+from sqlalchemy.orm import Session, sessionmaker
+
+from ..app import models
+from ..app.core.projections import LUMP_SUM_SAVING_NAME, annualize_item, split_saving_amount
+from ..app.database import Base, create_database_engine
+
+POPULATION_EMAIL_DOMAIN = "population.example"
+POPULATION_TOKEN_PREFIX = "population-"
+INSERT_BATCH_ROWS = 20_000
+
+EXPENSE_NAMES = ["Rent", "Groceries", "Utilities", "Insurance", "Transport", "Phone", "Dining", "Travel", "Gym", "Subscriptions"]
+SAVING_NAMES = ["401k", "IRA", "Brokerage", "HSA", "College fund", "Emergency fund"]
+# (frequency, weight, typical amount per period)
+EXPENSE_FREQUENCIES = [("monthly", 75, 150.0), ("quarterly", 15, 400.0), ("yearly", 10, 1500.0)]
+SAVING_FREQUENCIES = [("monthly", 80, 300.0), ("quarterly", 10, 900.0), ("yearly", 10, 3000.0)]
+
+
+class PopulationSummary(NamedTuple):
+    users: int
+    expenses: int
+    savings: int
+
+
+def population_email(index: int) -> str:
+    return f"user{index}@{POPULATION_EMAIL_DOMAIN}"
+
+
+def population_token(index: int) -> str:
+    return f"{POPULATION_TOKEN_PREFIX}{index}"
+
+
+def email_for_token(token: str) -> Optional[str]:
+    """The email of the population user a bearer token stands for; None for other tokens."""
+    if not token.startswith(POPULATION_TOKEN_PREFIX):
+        return None
+    index = token[len(POPULATION_TOKEN_PREFIX):]
+    return population_email(int(index)) if index.isdigit() else None
+
+
+def _item_count(rng: random.Random, min_items: int, max_items: int) -> int:
+    # Log-uniform: most users have a few dozen items, a long tail has thousands
+    return int(round(math.exp(rng.uniform(math.log(max(min_items, 1)), math.log(max(max_items, 1))))))
+
+
+def _pick(rng: random.Random, choices) -> tuple:
+    return rng.choices(choices, weights=[weight for _, weight, _ in choices])[0]
+
+
+class _BatchWriter:
+    """Buffers rows per model and writes them with one executemany INSERT per batch."""
+    def __init__(self, db: Session):
+        self.db = db
+        self.pending: Dict[type, List[dict]] = {}
+        self.written: Dict[type, int] = {}
+
+    def add(self, model: type, row: dict) -> None:
+        rows = self.pending.setdefault(model, [])
+        rows.append(row)
+        if len(rows) >= INSERT_BATCH_ROWS:
+            self._write(model)
+
+    def flush(self) -> None:
+        # Users first: every other table references them
+        for model in sorted(self.pending, key=lambda model: model is not models.user.User):
+            self._write(model)
+
+    def _write(self, model: type) -> None:
+        rows = self.pending.pop(model, [])
+        if model is not models.user.User and models.user.User in self.pending:
+            self._write(models.user.User)
+        if rows:
+            self.db.execute(insert(model), rows)
+            self.written[model] = self.written.get(model, 0) + len(rows)
+
+
+def generate_population(
+    db: Session, users: int = 1000, min_items: int = 10, max_items: int = 1000, seed: int = 0
+) -> PopulationSummary:
+    """
+    Inserts the population into `db` and commits. User ids continue after the highest existing id,
+    so the tool can add a population to a database that already has users (with other emails).
+    """
+    rng = random.Random(seed)
+    first_user_id = (db.execute(select(func.max(models.user.User.id))).scalar() or 0) + 1
+    writer = _BatchWriter(db)
+
+    for index in range(users):
+        user_id = first_user_id + index
+        writer.add(models.user.User, {
+            "id": user_id,
+            "email": population_email(index),
+            "google_id": f"population-google-{index}",
+            "age": rng.randint(22, 70),
+            "is_active": True,
+            "data_version": 0,
+        })
+        writer.add(models.assumption.Assumption, {
+            "user_id": user_id,
+            "return_rate": round(rng.uniform(0.03, 0.09), 4),
+            "inflation_rate": round(rng.uniform(0.01, 0.04), 4),
+            "life_expectancy": rng.randint(80, 100),
+        })
+
+        annual_expense_total = 0.0
+        for _ in range(_item_count(rng, min_items, max_items)):
+            frequency, _, typical_amount = _pick(rng, EXPENSE_FREQUENCIES)
+            amount = round(rng.lognormvariate(math.log(typical_amount), 0.6), 2)
+            writer.add(models.expense.Expense, {
+                "user_id": user_id, "name": rng.choice(EXPENSE_NAMES), "amount": amount, "frequency": frequency
+            })
+            annual_expense_total += annualize_item(amount, frequency)
+
+        lump_sum = round(rng.lognormvariate(math.log(50_000), 1.2), 2)
+        savings = [(LUMP_SUM_SAVING_NAME, lump_sum, "yearly")]
+        for _ in range(max(_item_count(rng, min_items, max_items) // 4, 1)):
+            frequency, _, typical_amount = _pick(rng, SAVING_FREQUENCIES)
+            savings.append((rng.choice(SAVING_NAMES), round(rng.lognormvariate(math.log(typical_amount), 0.5), 2), frequency))
+
+        annual_contribution_total = 0.0
+        lump_sum_total = 0.0
+        for name, amount, frequency in savings:
+            writer.add(models.saving.Saving, {"user_id": user_id, "name": name, "amount": amount, "frequency": frequency})
+            contribution, lump_sum_part = split_saving_amount(name, amount, frequency)
+            annual_contribution_total += contribution
+            lump_sum_total += lump_sum_part
+
+        writer.add(models.ledger_totals.LedgerTotals, {
+            "user_id": user_id,
+            "annual_expense_total": annual_expense_total,
+            "annual_contribution_total": annual_contribution_total,
+            "lump_sum_total": lump_sum_total,
+        })
+
+    writer.flush()
+    db.commit()
+    return PopulationSummary(
+        users=users,
+        expenses=writer.written.get(models.expense.Expense, 0),
+        savings=writer.written.get(models.saving.Saving, 0)
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database", type=Path, required=True, help="SQLite file to create or extend")
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--min-items", type=int, default=10, help="Fewest expenses per user")
+    parser.add_argument("--max-items", type=int, default=1000, help="Most expenses per user")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    engine = create_database_engine(f"sqlite:///{args.database}")
+    Base.metadata.create_all(bind=engine)
+    started = time.perf_counter()
+    with sessionmaker(bind=engine)() as db:
+        summary = generate_population(db, args.users, args.min_items, args.max_items, args.seed)
+    engine.dispose()
+    print(
+        f"{summary.users} users, {summary.expenses} expenses, {summary.savings} savings "
+        f"in {time.perf_counter() - started:.1f} s -> {args.database}"
+    )
+
+
+if __name__ == "__main__":
+    main()
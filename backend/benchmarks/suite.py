@@ -0,0 +1,65 @@
+"""
+Runs the benchmark suite (bench_core, bench_endpoints), writes the results as JSON and
+optionally compares them against a stored baseline.
+
+    # Record a baseline
+    python -m backend.benchmarks.suite --output baseline.json
+    # Later: exits with status 1 if any case got more than 25% slower
+    python -m backend.benchmarks.suite --output current.json --compare baseline.json --threshold 0.25
+
+Compare baselines recorded on the same machine; absolute timings do not transfer between hosts.
+"""
+import argparse
+import sys
+from pathlib import Path
+
+from . import bench_core, bench_endpoints
+from .harness import (
+    DEFAULT_REPEAT,
+    DEFAULT_THRESHOLD,
+    compare,
+    load_results,
+    print_comparisons,
+    print_results,
+    write_results,
+)
+
+GROUPS = {
+    "core": bench_core.collect,
+    "endpoints": bench_endpoints.collect,
+}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--only", nargs="+", choices=sorted(GROUPS), default=list(GROUPS), help="Benchmark groups to run")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument("--output", type=Path, help="Write the results as JSON")
+    parser.add_argument("--compare", type=Path, metavar="BASELINE", help="Baseline JSON to compare against")
+    parser.add_argument(
+        "--threshold", type=float, default=DEFAULT_THRESHOLD,
+        help="Allowed slowdown before a case is flagged, as a fraction of the baseline median"
+    )
+    args = parser.parse_args()
+
+    results = []
+    for group in args.only:
+        results += GROUPS[group](repeat=args.repeat)
+    if args.output:
+        write_results(args.output, results)
+
+    if args.compare is None:
+        print_results(results)
+        return 0
+
+    comparisons = compare(results, load_results(args.compare), args.threshold)
+    print_comparisons(comparisons)
+    regressions = [comparison.name for comparison in comparisons if comparison.regressed]
+    if regressions:
+        print(f"\n{len(regressions)} case(s) regressed by more than {args.threshold:.0%}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
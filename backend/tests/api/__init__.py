@@ -0,0 +1 @@
+# This file makes the 'api' directory within 'tests' a Python package.
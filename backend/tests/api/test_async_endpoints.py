@@ -0,0 +1,87 @@
+import pytest
+
+pytest.importorskip("aiosqlite")
+
+from ...app.main import create_app
+from ...app.core.jobs import job_manager
+from .test_projection import _seed_ledger
+
+def test_async_routes_are_coroutines():
+    async_app = create_app(use_async_db=True)
+    endpoints = [route.endpoint for route in async_app.routes if getattr(route, "path", "").startswith("/user")]
+    assert endpoints
+    assert all(getattr(endpoint, "__code__").co_flags & 0x80 for endpoint in endpoints) # CO_COROUTINE
+
+def test_async_mode_matches_sync_mode(client, test_user, async_client, auth_headers):
+    profile = {"email": test_user["email"], "google_id": "test-google-id", "age": 30}
+    assert async_client.post("/user/profile", json=profile).status_code == 201
+    assert async_client.get("/user/profile", headers=auth_headers).json()["email"] == test_user["email"]
+
+    for test_client in (client, async_client):
+        _seed_ledger(test_client, auth_headers)
+        response = test_client.post("/user/assumptions/", json={"return_rate": 0.06}, headers=auth_headers)
+        assert response.status_code == 200
+
+    for path in ("/user/expenses/", "/user/savings/", "/user/assumptions/"):
+        sync_body = client.get(path, headers=auth_headers).json()
+        async_body = async_client.get(path, headers=auth_headers).json()
+        assert async_body == sync_body
+
+    for path, params in (
+        ("/user/projections/", {}),
+        ("/user/projections/", {"mode": "montecarlo", "seed": 7, "paths": 500}),
+        ("/user/projections/goal", {"target_age": 55, "lifestyle": "content"}),
+        ("/user/projections/sensitivity", {"return_rate_steps": 3, "inflation_rate_steps": 3}),
+        ("/user/projections/timeline", {"lifestyle": "luxury", "offset": 10, "limit": 5}),
+    ):
+        sync_response = client.get(path, params=params, headers=auth_headers)
+        async_response = async_client.get(path, params=params, headers=auth_headers)
+        assert sync_response.status_code == async_response.status_code == 200
+        assert async_response.json() == sync_response.json()
+
+def test_async_mode_requires_profile(async_client, auth_headers):
+    assert async_client.get("/user/projections/", headers=auth_headers).status_code == 404
+
+def test_async_mode_server_timing(async_client, auth_headers):
+    profile = {"email": "fakeuser@example.com", "google_id": "test-google-id", "age": 30}
+    assert async_client.post("/user/profile", json=profile).status_code == 201
+    response = async_client.get("/user/projections/", headers=auth_headers)
+    assert response.status_code == 200
+    # Statements run on aiosqlite's greenlets are attributed to the request too
+    assert 'desc="0 queries"' not in response.headers["server-timing"]
+
+def test_async_bulk_import(async_client, auth_headers):
+    profile = {"email": "fakeuser@example.com", "google_id": "test-google-id", "age": 30}
+    assert async_client.post("/user/profile", json=profile).status_code == 201
+    response = async_client.post(
+        "/user/expenses/bulk",
+        content="name,amount,frequency\nRent,2000,monthly\nHolidays,4000,yearly\n",
+        headers={**auth_headers, "Content-Type": "text/csv"}
+    )
+    assert response.status_code == 201
+    assert response.json()["inserted"] == 2
+    assert response.json()["ledger_totals"]["annual_expense_total"] == 28000
+    assert len(async_client.get("/user/expenses/", headers=auth_headers).json()) == 2
+
+    exported = async_client.get("/user/expenses/export", params={"format": "csv"}, headers=auth_headers)
+    assert exported.status_code == 200
+    assert exported.text.splitlines()[1:] == ["1,Rent,2000.0,monthly", "2,Holidays,4000.0,yearly"]
+
+def test_async_projection_job(async_client, auth_headers):
+    profile = {"email": "fakeuser@example.com", "google_id": "test-google-id", "age": 30}
+    assert async_client.post("/user/profile", json=profile).status_code == 201
+    response = async_client.post("/user/projections/jobs", json={"kind": "montecarlo", "seed": 3, "paths": 200}, headers=auth_headers)
+    assert response.status_code == 202
+    job_manager.shutdown() # Waits for the job to finish
+    result = async_client.get(f"/user/projections/jobs/{response.json()['id']}/result", headers=auth_headers)
+    assert result.status_code == 200
+    assert result.json()["mode"] == "montecarlo"
+
+def test_async_conditional_get(async_client, auth_headers):
+    profile = {"email": "fakeuser@example.com", "google_id": "test-google-id", "age": 30}
+    assert async_client.post("/user/profile", json=profile).status_code == 201
+    for path in ("/user/projections/", "/user/savings/"):
+        etag = async_client.get(path, headers=auth_headers).headers["ETag"]
+        revalidated = async_client.get(path, headers={**auth_headers, "If-None-Match": etag})
+        assert revalidated.status_code == 304
+        assert revalidated.headers["ETag"] == etag
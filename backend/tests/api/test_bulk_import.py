@@ -0,0 +1,85 @@
+import csv
+import pytest
+
+from ...app.api.bulk_import import MAX_BULK_ROWS, MAX_REPORTED_ROW_ERRORS
+
+EXPENSES = [
+    {"name": "Rent", "amount": 2000, "frequency": "monthly"},
+    {"name": "Insurance", "amount": 300, "frequency": "quarterly"},
+    {"name": "Holidays", "amount": 4000, "frequency": "yearly"},
+]
+
+def test_bulk_import_expenses_json(client, test_user, auth_headers, count_queries):
+    with count_queries() as statements:
+        response = client.post("/user/expenses/bulk", json=EXPENSES, headers=auth_headers)
+    assert response.status_code == 201
+    body = response.json()
+    assert body["inserted"] == 3
+    assert body["ledger_totals"]["annual_expense_total"] == pytest.approx(2000 * 12 + 300 * 4 + 4000)
+
+    # One executemany INSERT for all rows
+    assert sum(statement.startswith("INSERT INTO expenses") for statement in statements) == 1
+
+    listed = client.get("/user/expenses/", headers=auth_headers).json()
+    assert [expense["name"] for expense in listed] == ["Rent", "Insurance", "Holidays"]
+
+def test_bulk_import_savings_csv(client, test_user, auth_headers):
+    csv_body = "name,amount,frequency\nCurrent Total Savings,50000,yearly\n401k,500,monthly\n\"Brokerage, taxable\",1000,quarterly\n"
+    response = client.post(
+        "/user/savings/bulk",
+        content=csv_body,
+        headers={**auth_headers, "Content-Type": "text/csv"}
+    )
+    assert response.status_code == 201
+    body = response.json()
+    assert body["inserted"] == 3
+    assert body["ledger_totals"]["lump_sum_total"] == pytest.approx(50000)
+    assert body["ledger_totals"]["annual_contribution_total"] == pytest.approx(500 * 12 + 1000 * 4)
+    names = [saving["name"] for saving in client.get("/user/savings/", headers=auth_headers).json()]
+    assert "Brokerage, taxable" in names
+
+def test_bulk_import_invalidates_projections(client, test_user, auth_headers):
+    client.post("/user/savings/bulk", json=[{"name": "Current Total Savings", "amount": 100000, "frequency": "yearly"}], headers=auth_headers)
+    before = client.get("/user/projections/", headers=auth_headers).json()
+    client.post("/user/expenses/bulk", json=EXPENSES, headers=auth_headers)
+    after = client.get("/user/projections/", headers=auth_headers).json()
+    assert after != before
+
+def test_bulk_import_is_all_or_nothing(client, test_user, auth_headers):
+    rows = EXPENSES + [{"name": "Bad", "amount": "lots", "frequency": "monthly"}, {"name": "Worse", "frequency": "weekly"}]
+    response = client.post("/user/expenses/bulk", json=rows, headers=auth_headers)
+    assert response.status_code == 422
+    detail = response.json()["detail"]
+    assert detail["invalid_rows"] == 2
+    assert [error["row"] for error in detail["errors"]] == [4, 5]
+    assert client.get("/user/expenses/", headers=auth_headers).json() == []
+
+def test_bulk_import_reports_a_bounded_number_of_errors(client, test_user, auth_headers):
+    rows = [{"name": "Bad", "amount": 1, "frequency": "daily"}] * (MAX_REPORTED_ROW_ERRORS + 5)
+    response = client.post("/user/expenses/bulk", json=rows, headers=auth_headers)
+    assert response.status_code == 422
+    detail = response.json()["detail"]
+    assert detail["invalid_rows"] == MAX_REPORTED_ROW_ERRORS + 5
+    assert len(detail["errors"]) == MAX_REPORTED_ROW_ERRORS
+
+@pytest.mark.parametrize("content, content_type, expected_status", [
+    ("{\"name\": \"Rent\"}", "application/json", 400), # Not an array
+    ("[", "application/json", 400),
+    ("[{\"name\": \"Rent\"} {\"name\": \"Food\"}]", "application/json", 400), # Missing comma
+    ("[] []", "application/json", 400), # Trailing data
+    ("name,amount,frequency\n" + "x" * (csv.field_size_limit() + 1) + ",1,monthly\n", "text/csv", 400), # Field too large
+    ("name;amount", "text/plain", 415),
+])
+def test_bulk_import_rejects_malformed_bodies(client, test_user, auth_headers, content, content_type, expected_status):
+    response = client.post(
+        "/user/expenses/bulk", content=content, headers={**auth_headers, "Content-Type": content_type}
+    )
+    assert response.status_code == expected_status
+
+def test_bulk_import_stops_parsing_json_at_the_row_limit(client, test_user, auth_headers):
+    row = '{"name": "Rent", "amount": 1, "frequency": "monthly"}'
+    content = "[" + ",".join([row] * (MAX_BULK_ROWS + 1)) + ", not json"
+    response = client.post(
+        "/user/expenses/bulk", content=content, headers={**auth_headers, "Content-Type": "application/json"}
+    )
+    assert response.status_code == 413 # Refused at the extra row, before the malformed tail is reached
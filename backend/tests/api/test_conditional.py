@@ -0,0 +1,51 @@
+from ...app.api.conditional import entity_tag, if_none_match
+from ...app.api.endpoints import projection
+
+def _seed_ledger(client, auth_headers):
+    client.post("/user/expenses/", json={"name": "Rent", "amount": 2000, "frequency": "monthly"}, headers=auth_headers)
+    client.post("/user/savings/", json={"name": "Current Total Savings", "amount": 100000, "frequency": "yearly"}, headers=auth_headers)
+
+def test_if_none_match_comparison():
+    etag = entity_tag(1, 7, ("expenses", 100))
+    assert etag != entity_tag(1, 8, ("expenses", 100)) and etag != entity_tag(1, 7, ("expenses", 50))
+    assert if_none_match(f'"other", W/{etag}', etag)
+    assert if_none_match("*", etag)
+    assert not if_none_match('"other"', etag)
+    assert not if_none_match(None, etag)
+
+def test_projection_revalidation_skips_computation(client, test_user, auth_headers, count_queries, monkeypatch):
+    _seed_ledger(client, auth_headers)
+    first = client.get("/user/projections/", headers=auth_headers)
+    etag = first.headers["ETag"]
+    assert first.headers["Cache-Control"] == "private, no-cache"
+
+    calls = []
+    monkeypatch.setattr(projection, "load_projection_inputs", lambda *args: calls.append(args))
+    with count_queries() as statements:
+        response = client.get("/user/projections/", headers={**auth_headers, "If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+    assert response.content == b""
+    assert calls == []
+    assert len(statements) == 1 # The data version alone
+
+def test_write_changes_entity_tag(client, test_user, auth_headers):
+    _seed_ledger(client, auth_headers)
+    etag = client.get("/user/projections/", headers=auth_headers).headers["ETag"]
+    client.post("/user/savings/", json={"name": "401k", "amount": 1000, "frequency": "monthly"}, headers=auth_headers)
+
+    response = client.get("/user/projections/", headers={**auth_headers, "If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+    # Unseeded Monte Carlo runs differ on every request and are never tagged
+    assert "ETag" not in client.get("/user/projections/", params={"mode": "montecarlo", "paths": 50}, headers=auth_headers).headers
+
+def test_list_revalidation_per_page(client, test_user, auth_headers):
+    _seed_ledger(client, auth_headers)
+    first = client.get("/user/expenses/", params={"limit": 1}, headers=auth_headers)
+    etag = first.headers["ETag"]
+
+    assert client.get("/user/expenses/", params={"limit": 1}, headers={**auth_headers, "If-None-Match": etag}).status_code == 304
+    assert client.get("/user/expenses/", params={"limit": 2}, headers={**auth_headers, "If-None-Match": etag}).status_code == 200
+    assert client.get("/user/savings/", params={"limit": 1}, headers={**auth_headers, "If-None-Match": etag}).status_code == 200
@@ -0,0 +1,48 @@
+import csv
+import io
+import itertools
+import json
+
+from ...app.api.export import EXPORT_CHUNK_ROWS, encode_rows
+from ...app.core.projections import ProjectionInputs
+
+def test_export_expenses_ndjson(client, test_user, auth_headers):
+    rows = [{"name": f"Expense {i}", "amount": i, "frequency": "monthly"} for i in range(EXPORT_CHUNK_ROWS + 10)]
+    assert client.post("/user/expenses/bulk", json=rows, headers=auth_headers).status_code == 201
+
+    response = client.get("/user/expenses/export", headers=auth_headers)
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    exported = [json.loads(line) for line in response.text.splitlines()]
+    assert len(exported) == len(rows)
+    assert [item["name"] for item in exported] == [row["name"] for row in rows]
+    assert set(exported[0]) == {"id", "name", "amount", "frequency"}
+
+def test_export_savings_csv(client, test_user, auth_headers):
+    client.post("/user/savings/", json={"name": "Brokerage, taxable", "amount": 1000, "frequency": "quarterly"}, headers=auth_headers)
+    client.post("/user/savings/", json={"name": "401k", "amount": 500, "frequency": "monthly"}, headers=auth_headers)
+
+    response = client.get("/user/savings/export", params={"format": "csv"}, headers=auth_headers)
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    assert 'filename="savings.csv"' in response.headers["content-disposition"]
+    exported = list(csv.DictReader(io.StringIO(response.text)))
+    assert [(row["name"], float(row["amount"])) for row in exported] == [("Brokerage, taxable", 1000.0), ("401k", 500.0)]
+
+def test_export_empty_ledger(client, test_user, auth_headers):
+    assert client.get("/user/expenses/export", headers=auth_headers).text == ""
+    assert client.get("/user/expenses/export", params={"format": "csv"}, headers=auth_headers).text == "id,name,amount,frequency\n"
+
+def test_export_projection_inputs(client, test_user, auth_headers):
+    client.post("/user/expenses/", json={"name": "Rent", "amount": 2000, "frequency": "monthly"}, headers=auth_headers)
+    response = client.get("/user/projections/inputs", headers=auth_headers)
+    assert response.status_code == 200
+    (record,) = [json.loads(line) for line in response.text.splitlines()]
+    assert set(record) == set(ProjectionInputs._fields)
+    assert record["current_age"] == 30
+    assert record["base_annual_expenses"] == 24000
+
+def test_encode_rows_is_lazy():
+    endless_rows = ((i, f"row {i}") for i in itertools.count())
+    first_chunk = next(encode_rows(endless_rows, ("id", "name"), "ndjson"))
+    assert first_chunk.count("\n") == EXPORT_CHUNK_ROWS
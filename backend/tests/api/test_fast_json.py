@@ -0,0 +1,55 @@
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from ...app.main import app, create_app
+from ...app.api import fast_json
+from ...app.api.endpoints.expense import expense_rows
+from ...app.api.pagination import NEXT_CURSOR_HEADER
+from .test_projection import _seed_ledger
+
+@pytest.fixture
+def fast_client(client):
+    fast_app = create_app(use_async_db=False, metrics_enabled=False, fast_json=True)
+    fast_app.dependency_overrides = app.dependency_overrides
+    with TestClient(fast_app) as fast_client:
+        yield fast_client
+
+def test_fast_json_matches_response_models(client, fast_client, test_user, auth_headers):
+    _seed_ledger(client, auth_headers)
+    rows = [{"name": f"Expense {i}", "amount": i + 0.25, "frequency": "yearly"} for i in range(30)]
+    client.post("/user/expenses/bulk", json=rows, headers=auth_headers)
+
+    for path, params in [
+        ("/user/expenses/", {"limit": 10}),
+        ("/user/savings/", {}),
+        ("/user/projections/sensitivity", {"return_rate_steps": 4, "inflation_rate_steps": 3}),
+        ("/user/projections/timeline", {"lifestyle": "luxury", "offset": 5, "limit": 20}),
+    ]:
+        expected = client.get(path, params=params, headers=auth_headers)
+        response = fast_client.get(path, params=params, headers=auth_headers)
+        assert response.status_code == 200
+        assert response.json() == expected.json()
+        for header in ("ETag", NEXT_CURSOR_HEADER):
+            assert response.headers.get(header) == expected.headers.get(header)
+
+def test_large_responses_are_compressed(client, test_user, auth_headers):
+    rows = [{"name": f"Expense {i}", "amount": i, "frequency": "monthly"} for i in range(100)]
+    client.post("/user/expenses/bulk", json=rows, headers=auth_headers)
+    headers = {**auth_headers, "Accept-Encoding": "gzip"}
+
+    response = client.get("/user/expenses/", headers=headers)
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert len(response.json()) == 100
+    assert "Content-Encoding" not in client.get("/user/expenses/", params={"limit": 1}, headers=headers).headers
+
+def test_json_fallback_without_orjson(monkeypatch):
+    content = {"rates": [0.07, 1e-05], "name": "Épargne", "age": None}
+    monkeypatch.setattr(fast_json, "orjson", None)
+    assert json.loads(fast_json.dumps(content)) == content
+
+def test_row_serializer_reads_schema_fields():
+    class Row:
+        id, user_id, name, amount, frequency, extra = 1, 2, "Rent", 2000.0, "monthly", "ignored"
+    assert expense_rows([Row()]) == [{"name": "Rent", "amount": 2000.0, "frequency": "monthly", "id": 1, "user_id": 2}]
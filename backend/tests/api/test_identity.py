@@ -0,0 +1,32 @@
+from ...app.core.identity_cache import identity_cache
+
+def test_cached_identity_skips_user_lookup(client, test_user, auth_headers, count_queries):
+    with count_queries() as statements:
+        assert client.get("/user/expenses/", headers=auth_headers).status_code == 200
+    assert len(statements) == 3 # Identity columns, data version, then the page
+
+    with count_queries() as statements:
+        assert client.get("/user/expenses/", headers=auth_headers).status_code == 200
+    assert len(statements) == 2
+    assert not any("users.email" in statement for statement in statements)
+
+def test_profile_creation_invalidates_cached_identity(client, test_user, auth_headers, db_session):
+    assert client.get("/user/savings/", headers=auth_headers).status_code == 200
+    assert identity_cache.get("test-token").id == test_user["id"]
+
+    # The account is recreated under a new id: the cached identity must not outlive it
+    db_session.execute("DELETE FROM ledger_totals")
+    db_session.execute("DELETE FROM users")
+    db_session.commit()
+    profile = {"email": test_user["email"], "google_id": "other-google-id", "age": 45}
+    recreated = client.post("/user/profile", json=profile).json()
+    assert identity_cache.get("test-token") is None
+
+    response = client.post("/user/savings/", json={"name": "IRA", "amount": 100, "frequency": "monthly"}, headers=auth_headers)
+    assert response.status_code == 201
+    assert response.json()["user_id"] == recreated["id"]
+
+def test_inactive_user_is_rejected(client, test_user, auth_headers, db_session):
+    db_session.execute("UPDATE users SET is_active = 0")
+    db_session.commit()
+    assert client.get("/user/expenses/", headers=auth_headers).status_code == 403
@@ -0,0 +1,51 @@
+import re
+
+import pytest
+from fastapi.testclient import TestClient
+
+from ...app.main import app, create_app
+
+@pytest.fixture
+def metrics_client(client):
+    metrics_app = create_app(use_async_db=False, metrics_enabled=True)
+    metrics_app.dependency_overrides = app.dependency_overrides
+    with TestClient(metrics_app) as metrics_client:
+        yield metrics_client
+
+def _server_timing(response) -> dict:
+    return {
+        metric.split(";")[0]: float(re.search(r"dur=([0-9.]+)", metric).group(1))
+        for metric in response.headers["server-timing"].split(", ")
+    }
+
+def test_metrics_are_off_by_default(client):
+    assert client.get("/metrics").status_code == 404
+    assert "server-timing" not in client.get("/user/profile").headers
+
+def test_server_timing_header(client, metrics_client, test_user, auth_headers, count_queries):
+    client.post("/user/expenses/", json={"name": "Rent", "amount": 2000, "frequency": "monthly"}, headers=auth_headers)
+    with count_queries() as statements:
+        response = metrics_client.get("/user/projections/", headers=auth_headers)
+    assert response.status_code == 200
+
+    timing = _server_timing(response)
+    assert set(timing) == {"db", "compute", "serialize", "total"}
+    assert f'desc="{len(statements)} queries"' in response.headers["server-timing"]
+    assert timing["db"] + timing["compute"] + timing["serialize"] <= timing["total"]
+
+def test_metrics_endpoint(metrics_client, test_user, auth_headers):
+    metrics_client.get("/user/projections/", headers=auth_headers)
+    metrics_client.get("/user/projections/", headers=auth_headers)
+    metrics_client.get("/user/assumptions/", headers=auth_headers)
+
+    response = metrics_client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert "server-timing" not in response.headers
+    body = response.text
+    labels = 'method="GET",route="/user/projections/",status="200"'
+    count = int(re.search(rf"http_request_duration_seconds_count\{{{labels}\}} (\d+)", body).group(1))
+    assert count >= 2
+    assert f"http_request_db_queries_bucket{{{labels},le=\"+Inf\"}}" in body
+    assert "# TYPE http_request_serialization_seconds histogram" in body
+    assert "projection_cache_hits_total 1" in body
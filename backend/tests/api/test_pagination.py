@@ -0,0 +1,50 @@
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import text
+
+from ...app.api.pagination import NEXT_CURSOR_HEADER, decode_cursor, encode_cursor
+from ...app.crud import crud_expense
+
+def _bulk_expenses(client, auth_headers, count):
+    rows = [{"name": f"Expense {i}", "amount": i, "frequency": "monthly"} for i in range(count)]
+    assert client.post("/user/expenses/bulk", json=rows, headers=auth_headers).status_code == 201
+
+def test_cursor_round_trip_and_rejects_garbage():
+    assert decode_cursor(encode_cursor(12345)) == 12345
+    for cursor in ("not-a-cursor", encode_cursor(1)[:-2] + "!!", "eyJhZnRlcl9pZCI6IngifQ"): # {"after_id":"x"}
+        with pytest.raises(HTTPException) as error:
+            decode_cursor(cursor)
+        assert error.value.status_code == 400
+
+def test_list_expenses_follows_cursor(client, test_user, auth_headers):
+    _bulk_expenses(client, auth_headers, 25)
+
+    names, params, pages = [], {"limit": 10}, 0
+    while True:
+        response = client.get("/user/expenses/", params=params, headers=auth_headers)
+        assert response.status_code == 200
+        names += [item["name"] for item in response.json()]
+        pages += 1
+        if NEXT_CURSOR_HEADER not in response.headers:
+            break
+        params = {"limit": 10, "cursor": response.headers[NEXT_CURSOR_HEADER]}
+
+    assert pages == 3
+    assert names == [f"Expense {i}" for i in range(25)]
+
+def test_list_savings_offset_still_supported(client, test_user, auth_headers):
+    for i in range(3):
+        client.post("/user/savings/", json={"name": f"Saving {i}", "amount": 100, "frequency": "monthly"}, headers=auth_headers)
+    response = client.get("/user/savings/", params={"skip": 1, "limit": 5}, headers=auth_headers)
+    assert [item["name"] for item in response.json()] == ["Saving 1", "Saving 2"]
+    assert NEXT_CURSOR_HEADER not in response.headers
+
+def test_list_expenses_invalid_paging(client, test_user, auth_headers):
+    assert client.get("/user/expenses/", params={"cursor": "garbage"}, headers=auth_headers).status_code == 400
+    assert client.get("/user/expenses/", params={"limit": 0}, headers=auth_headers).status_code == 422
+
+def test_keyset_page_uses_user_id_index(db_session):
+    statement = crud_expense.expenses_page_statement(user_id=1, limit=10, after_id=500)
+    compiled = statement.compile(db_session.get_bind(), compile_kwargs={"literal_binds": True})
+    plan = db_session.execute(text(f"EXPLAIN QUERY PLAN {compiled}")).all()
+    assert any("ix_expenses_user_id_id" in row[-1] for row in plan)
@@ -0,0 +1,173 @@
+import pytest
+
+from ...app.main import configure_projection_executor
+from ...app.core.cache import projection_cache
+from ...app.core.executor import projection_executor
+from ...app.core.projections import LIFESTYLE_MULTIPLIERS
+
+def _seed_ledger(client, auth_headers):
+    client.post("/user/expenses/", json={"name": "Rent", "amount": 2000, "frequency": "monthly"}, headers=auth_headers)
+    client.post("/user/savings/", json={"name": "Current Total Savings", "amount": 100000, "frequency": "yearly"}, headers=auth_headers)
+    client.post("/user/savings/", json={"name": "401k", "amount": 1000, "frequency": "monthly"}, headers=auth_headers)
+
+def test_get_projections(client, test_user, auth_headers):
+    _seed_ledger(client, auth_headers)
+    response = client.get("/user/projections/", headers=auth_headers)
+    assert response.status_code == 200
+    projections = response.json()["projections"]
+    assert [p["lifestyle"] for p in projections] == list(LIFESTYLE_MULTIPLIERS)
+    ages = [p["retirement_age"] for p in projections]
+    assert all(p["can_retire"] for p in projections)
+    assert ages == sorted(ages) # Costlier lifestyles never retire earlier
+
+def test_get_projections_requires_profile(client, auth_headers):
+    response = client.get("/user/projections/", headers=auth_headers)
+    assert response.status_code == 404
+
+def test_goal_seek(client, test_user, auth_headers):
+    _seed_ledger(client, auth_headers)
+    baseline = client.get("/user/projections/", headers=auth_headers).json()["projections"][1]
+    target_age = baseline["retirement_age"] - 5
+
+    response = client.get(
+        "/user/projections/goal",
+        params={"target_age": target_age, "lifestyle": "content", "mode": "annual_contribution"},
+        headers=auth_headers
+    )
+    assert response.status_code == 200
+    body = response.json()
+    assert body["achievable"] is True
+    assert body["required_amount"] > 0
+    assert body["projected_retirement_age"] <= target_age
+
+    client.post(
+        "/user/savings/",
+        json={"name": "Extra", "amount": body["required_amount"], "frequency": "yearly"},
+        headers=auth_headers
+    )
+    updated = client.get("/user/projections/", headers=auth_headers).json()["projections"][1]
+    assert updated["retirement_age"] <= target_age
+
+def test_goal_seek_invalid_inputs(client, test_user, auth_headers):
+    response = client.get("/user/projections/goal", params={"target_age": 50, "lifestyle": "royal"}, headers=auth_headers)
+    assert response.status_code == 400
+    response = client.get("/user/projections/goal", params={"target_age": 20}, headers=auth_headers)
+    assert response.status_code == 400
+
+def test_get_projections_montecarlo(client, test_user, auth_headers):
+    _seed_ledger(client, auth_headers)
+    params = {"mode": "montecarlo", "seed": 123, "paths": 2000}
+    response = client.get("/user/projections/", params=params, headers=auth_headers)
+    assert response.status_code == 200
+    body = response.json()
+    assert body["mode"] == "montecarlo"
+    for projection in body["projections"]:
+        probabilities = projection["success_probabilities"]
+        assert probabilities[0]["age"] == 30
+        assert all(0 <= p["probability"] <= 1 for p in probabilities)
+    # Same seed, same answer
+    assert client.get("/user/projections/", params=params, headers=auth_headers).json() == body
+
+def test_sensitivity_grid(client, test_user, auth_headers):
+    _seed_ledger(client, auth_headers)
+    params = {
+        "return_rate_min": 0.04, "return_rate_max": 0.10, "return_rate_steps": 4,
+        "inflation_rate_min": 0.0, "inflation_rate_max": 0.03, "inflation_rate_steps": 3,
+    }
+    response = client.get("/user/projections/sensitivity", params=params, headers=auth_headers)
+    assert response.status_code == 200
+    body = response.json()
+    assert body["return_rates"] == pytest.approx([0.04, 0.06, 0.08, 0.10])
+    assert body["inflation_rates"] == pytest.approx([0.0, 0.015, 0.03])
+    assert [grid["lifestyle"] for grid in body["grids"]] == list(LIFESTYLE_MULTIPLIERS)
+    frugal = body["grids"][0]["retirement_ages"]
+    assert len(frugal) == 4 and all(len(row) == 3 for row in frugal)
+    # Higher returns never delay retirement
+    for column in range(3):
+        ages = [row[column] for row in frugal]
+        assert ages == sorted(ages, reverse=True)
+
+def test_sensitivity_grid_defaults_and_validation(client, test_user, auth_headers):
+    response = client.get("/user/projections/sensitivity", headers=auth_headers)
+    assert response.status_code == 200
+    assert len(response.json()["return_rates"]) == 7
+    response = client.get(
+        "/user/projections/sensitivity", params={"return_rate_min": 0.1, "return_rate_max": 0.05}, headers=auth_headers
+    )
+    assert response.status_code == 400
+
+def test_projection_cache_hit_and_invalidation(client, test_user, auth_headers):
+    _seed_ledger(client, auth_headers)
+    first = client.get("/user/projections/", headers=auth_headers).json()
+    hits_before = projection_cache.stats().hits
+    assert client.get("/user/projections/", headers=auth_headers).json() == first
+    assert projection_cache.stats().hits == hits_before + 1
+
+    # A write bumps the data version, so the next read recomputes with the new data
+    client.post("/user/expenses/", json={"name": "Travel", "amount": 20000, "frequency": "yearly"}, headers=auth_headers)
+    updated = client.get("/user/projections/", headers=auth_headers).json()
+    assert projection_cache.stats().hits == hits_before + 1
+    assert updated["projections"][0]["retirement_age"] > first["projections"][0]["retirement_age"]
+
+def test_get_projections_queries(client, test_user, auth_headers, count_queries):
+    _seed_ledger(client, auth_headers)
+    with count_queries() as statements:
+        response = client.get("/user/projections/", headers=auth_headers)
+    assert response.status_code == 200
+    assert len(statements) == 2 # Data version, then user, assumption and ledger totals in one joined query
+    with count_queries() as statements:
+        cached = client.get("/user/projections/", headers=auth_headers)
+    assert cached.json() == response.json() and cached.headers["etag"] == response.headers["etag"]
+    assert len(statements) == 1 # Cache hit: the data version only, the user isn't loaded
+
+def test_projection_timeline_pages(client, test_user, auth_headers):
+    _seed_ledger(client, auth_headers)
+    frugal_age = client.get("/user/projections/", headers=auth_headers).json()["projections"][0]["retirement_age"]
+
+    response = client.get("/user/projections/timeline", params={"limit": 20}, headers=auth_headers)
+    assert response.status_code == 200
+    page = response.json()
+    assert page["lifestyle"] == "frugal"
+    assert page["retirement_age"] == frugal_age
+    assert page["offset"] == 0 and page["next_offset"] == 20
+    assert [year["age"] for year in page["items"]] == list(range(30, 50))
+
+    last_page = client.get(
+        "/user/projections/timeline", params={"offset": 60, "limit": 20}, headers=auth_headers
+    ).json()
+    assert last_page["next_offset"] is None
+    assert len(last_page["items"]) == last_page["total"] - 60
+
+def test_projection_timeline_streams(client, test_user, auth_headers):
+    _seed_ledger(client, auth_headers)
+    response = client.get(
+        "/user/projections/timeline", params={"format": "csv", "retirement_age": 55, "lifestyle": "content"}, headers=auth_headers
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    lines = response.text.splitlines()
+    assert lines[0] == "age,balance,contribution,expenses,phase"
+    assert lines[1].startswith("30,") and lines[1].endswith(",accumulation")
+    assert lines[26].startswith("55,") and not lines[26].endswith(",accumulation")
+
+def test_projection_timeline_invalid_inputs(client, test_user, auth_headers):
+    assert client.get("/user/projections/timeline", params={"lifestyle": "royal"}, headers=auth_headers).status_code == 400
+    assert client.get("/user/projections/timeline", params={"retirement_age": 20}, headers=auth_headers).status_code == 400
+    assert client.get("/user/projections/timeline", params={"limit": 0}, headers=auth_headers).status_code == 422
+
+def test_projection_executor_backpressure(client, test_user, auth_headers):
+    _seed_ledger(client, auth_headers)
+    projection_executor.configure(backend="thread", inline_cost=0, max_queue_depth=0)
+    try:
+        response = client.get("/user/projections/", params={"mode": "montecarlo", "paths": 100}, headers=auth_headers)
+        assert response.status_code == 503
+        assert response.headers["retry-after"] == "1"
+        # Served again once the executor has room
+        projection_executor.configure(backend="thread", inline_cost=0)
+        assert client.get("/user/projections/sensitivity", headers=auth_headers).status_code == 200
+    finally:
+        configure_projection_executor()
+
+def test_assumptions_reject_absurd_life_expectancy(client, test_user, auth_headers):
+    response = client.post("/user/assumptions/", json={"life_expectancy": 40_000}, headers=auth_headers)
+    assert response.status_code == 422
@@ -0,0 +1,50 @@
+from ...app.core.jobs import job_manager
+from ...app.core.montecarlo import MAX_SIMULATION_PATHS
+from .test_projection import _seed_ledger
+
+def _run_job(client, auth_headers, body):
+    response = client.post("/user/projections/jobs", json=body, headers=auth_headers)
+    assert response.status_code == 202
+    job = response.json()
+    assert job["status"] in ("queued", "running", "succeeded")
+    assert response.headers["location"].endswith(f"/user/projections/jobs/{job['id']}")
+    job_manager.shutdown() # Waits for the job to finish
+    return job["id"]
+
+def test_sensitivity_job_matches_sensitivity_endpoint(client, test_user, auth_headers):
+    _seed_ledger(client, auth_headers)
+    params = {"return_rate_steps": 40, "inflation_rate_steps": 3}
+    job_id = _run_job(client, auth_headers, {"kind": "sensitivity", **params})
+
+    status = client.get(f"/user/projections/jobs/{job_id}", headers=auth_headers).json()
+    assert (status["status"], status["progress"], status["error"]) == ("succeeded", 1.0, None)
+    assert status["expires_at"] > status["finished_at"]
+
+    result = client.get(f"/user/projections/jobs/{job_id}/result", headers=auth_headers)
+    assert result.status_code == 200
+    assert result.json() == client.get("/user/projections/sensitivity", params=params, headers=auth_headers).json()
+
+def test_montecarlo_job_matches_projection_endpoint(client, test_user, auth_headers):
+    _seed_ledger(client, auth_headers)
+    job_id = _run_job(client, auth_headers, {"kind": "montecarlo", "seed": 7, "paths": 500})
+    result = client.get(f"/user/projections/jobs/{job_id}/result", headers=auth_headers).json()
+    expected = client.get(
+        "/user/projections/", params={"mode": "montecarlo", "seed": 7, "paths": 500}, headers=auth_headers
+    ).json()
+    assert result == expected
+
+def test_montecarlo_job_allows_more_paths_than_requests(client, test_user, auth_headers):
+    _seed_ledger(client, auth_headers)
+    body = {"kind": "montecarlo", "seed": 1, "paths": MAX_SIMULATION_PATHS + 1}
+    job_id = _run_job(client, auth_headers, body)
+    status = client.get(f"/user/projections/jobs/{job_id}", headers=auth_headers).json()
+    assert (status["status"], status["error"]) == ("succeeded", None)
+
+def test_projection_job_errors(client, test_user, auth_headers):
+    assert client.get("/user/projections/jobs/unknown", headers=auth_headers).status_code == 404
+    response = client.post(
+        "/user/projections/jobs", json={"kind": "sensitivity", "return_rate_min": 0.1, "return_rate_max": 0.05},
+        headers=auth_headers
+    )
+    assert response.status_code == 400
+    assert client.post("/user/projections/jobs", json={"kind": "unknown"}, headers=auth_headers).status_code == 422
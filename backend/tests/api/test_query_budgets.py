@@ -0,0 +1,104 @@
+import logging
+
+import pytest
+from fastapi.routing import APIRoute
+from fastapi.testclient import TestClient
+
+from ...app.main import app, create_app
+from ...app.core.jobs import job_manager
+from ...app.core.query_budget import QueryRecord, budget_of, find_repeated_statements
+from .test_projection import _seed_ledger
+
+EXPENSE = {"name": "Rent", "amount": 2000, "frequency": "monthly"}
+SAVING = {"name": "401k", "amount": 1000, "frequency": "monthly"}
+
+# Every /user endpoint, with a request that exercises its usual path
+REQUESTS = [
+    ("POST", "/user/profile", {"json": {"email": "fakeuser@example.com", "google_id": "test-google-id", "age": 31}}),
+    ("GET", "/user/profile", {}),
+    ("POST", "/user/assumptions/", {"json": {"return_rate": 0.06}}),
+    ("GET", "/user/assumptions/", {}),
+    ("POST", "/user/expenses/", {"json": EXPENSE}),
+    ("POST", "/user/expenses/bulk", {"json": [EXPENSE] * 20}),
+    ("GET", "/user/expenses/", {"params": {"limit": 2}}),
+    ("GET", "/user/expenses/export", {"params": {"format": "csv"}}),
+    ("POST", "/user/savings/", {"json": SAVING}),
+    ("POST", "/user/savings/bulk", {"json": [SAVING] * 20}),
+    ("GET", "/user/savings/", {"params": {"limit": 2}}),
+    ("GET", "/user/savings/export", {"params": {"format": "csv"}}),
+    ("GET", "/user/projections/", {}),
+    ("GET", "/user/projections/goal", {"params": {"target_age": 55, "lifestyle": "content"}}),
+    ("GET", "/user/projections/sensitivity", {"params": {"return_rate_steps": 3, "inflation_rate_steps": 3}}),
+    ("GET", "/user/projections/inputs", {}),
+    ("GET", "/user/projections/timeline", {"params": {"lifestyle": "luxury"}}),
+    ("POST", "/user/projections/jobs", {"json": {"kind": "montecarlo", "paths": 100}}),
+    ("GET", "/user/projections/jobs/{job_id}", {}),
+    ("GET", "/user/projections/jobs/{job_id}/result", {}),
+]
+
+def _user_routes(application):
+    return [route for route in application.routes if isinstance(route, APIRoute) and route.path.startswith("/user")]
+
+def _budget(application, method, path):
+    for route in _user_routes(application):
+        if route.path == path and method in route.methods:
+            return budget_of(route.endpoint)
+    raise LookupError(f"{method} {path}")
+
+@pytest.mark.parametrize("use_async_db", [False, True])
+def test_every_endpoint_declares_a_budget(use_async_db):
+    if use_async_db:
+        pytest.importorskip("aiosqlite")
+    routes = _user_routes(create_app(use_async_db=use_async_db))
+    assert {(method, route.path) for route in routes for method in route.methods} == \
+        {(method, path) for method, path, _ in REQUESTS}
+    assert all(budget_of(route.endpoint) for route in routes)
+
+@pytest.mark.parametrize("method,path,kwargs", REQUESTS, ids=[f"{method} {path}" for method, path, _ in REQUESTS])
+def test_endpoint_stays_within_budget(client, test_user, auth_headers, count_queries, method, path, kwargs):
+    _seed_ledger(client, auth_headers)
+    client.post("/user/expenses/", json=EXPENSE, headers=auth_headers)
+    client.post("/user/savings/", json=SAVING, headers=auth_headers)
+    client.post("/user/assumptions/", json={"return_rate": 0.05}, headers=auth_headers)
+    job = client.post("/user/projections/jobs", json={"kind": "montecarlo", "paths": 100}, headers=auth_headers).json()
+    job_manager.shutdown() # Waits for the job to finish
+
+    with count_queries() as statements:
+        response = client.request(method, path.format(job_id=job["id"]), headers=auth_headers, **kwargs)
+    assert response.status_code < 300
+    assert len(statements) <= _budget(app, method, path), statements
+
+@pytest.mark.parametrize("method,path,kwargs", REQUESTS, ids=[f"{method} {path}" for method, path, _ in REQUESTS])
+def test_async_endpoint_stays_within_budget(async_client, async_engine, auth_headers, count_queries, method, path, kwargs):
+    profile = {"email": "fakeuser@example.com", "google_id": "test-google-id", "age": 30}
+    assert async_client.post("/user/profile", json=profile).status_code == 201
+    _seed_ledger(async_client, auth_headers)
+    async_client.post("/user/expenses/", json=EXPENSE, headers=auth_headers)
+    async_client.post("/user/savings/", json=SAVING, headers=auth_headers)
+    async_client.post("/user/assumptions/", json={"return_rate": 0.05}, headers=auth_headers)
+    job = async_client.post("/user/projections/jobs", json={"kind": "montecarlo", "paths": 100}, headers=auth_headers).json()
+    job_manager.shutdown()
+
+    with count_queries(async_engine) as statements:
+        response = async_client.request(method, path.format(job_id=job["id"]), headers=auth_headers, **kwargs)
+    assert response.status_code < 300
+    assert len(statements) <= _budget(async_client.app, method, path), statements
+
+def test_query_debug_logs_requests_over_budget(client, test_user, auth_headers, caplog, monkeypatch):
+    debug_app = create_app(use_async_db=False, metrics_enabled=False, query_debug=True)
+    debug_app.dependency_overrides = app.dependency_overrides
+    route = next(route for route in _user_routes(debug_app) if route.path == "/user/expenses/" and "GET" in route.methods)
+    monkeypatch.setattr(route.endpoint, "__query_budget__", 1)
+
+    with TestClient(debug_app) as debug_client, caplog.at_level(logging.WARNING):
+        assert debug_client.get("/user/expenses/", headers=auth_headers).status_code == 200
+
+    message = "\n".join(record.getMessage() for record in caplog.records)
+    assert "GET /user/expenses/ executed 3 SQL statements (budget 1)" in message
+    assert "crud/" in message and ".py:" in message
+
+def test_find_repeated_statements():
+    records = [QueryRecord("SELECT a", "crud/x.py:1 in f")] * 3 + [QueryRecord("SELECT b", "crud/x.py:2 in g")] * 2
+    repeated = find_repeated_statements(records)
+    assert [(r.statement, r.count, r.call_sites) for r in repeated] == [("SELECT a", 3, ("crud/x.py:1 in f",))]
+    assert find_repeated_statements(records, threshold=2)[1].count == 2
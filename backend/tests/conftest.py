@@ -1,23 +1,31 @@
 import pytest
+from contextlib import contextmanager
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker, Session
-from typing import Generator
+from sqlalchemy.pool import NullPool, StaticPool
+from typing import Generator, Iterator, List
 
 # Assuming your main FastAPI app and Base are here:
 # Adjust paths as necessary if your app/Base structure is different.
 # These imports need to resolve correctly from the backend/tests directory.
 # This implies that the 'backend' directory itself might need to be in PYTHONPATH for tests to run,
 # or tests are run with `python -m pytest` from the `backend` directory.
-from ..app.main import app # The FastAPI application instance
-from ..app.database import Base, get_db # The SQLAlchemy Base and original get_db dependency
+from ..app.main import app, create_app # The FastAPI application instance
+from ..app.database import Base, get_db, get_read_db # The SQLAlchemy Base and original session dependencies
+from ..app.database_async import get_async_db
+from ..app.core.cache import projection_cache
+from ..app.core.identity_cache import identity_cache
 
 # --- Test Database Setup ---
 SQLALCHEMY_DATABASE_URL_TEST = "sqlite:///:memory:" # In-memory SQLite for tests
 
 engine_test = create_engine(
     SQLALCHEMY_DATABASE_URL_TEST,
-    connect_args={"check_same_thread": False} # Needed for SQLite
+    connect_args={"check_same_thread": False}, # Needed for SQLite
+    poolclass=StaticPool # Share the single in-memory connection with TestClient worker threads
 )
 SessionLocal_test = sessionmaker(autocommit=False, autoflush=False, bind=engine_test)
 
@@ -40,11 +48,39 @@ def db_session(setup_database: None) -> Generator[Session, None, None]:
         db.rollback() # Ensure changes are rolled back if not committed (though typically tests shouldn't commit)
         db.close()
 
+# --- Query counting ---
+@pytest.fixture
+def count_queries():
+    """
+    Returns a context manager collecting the SQL statements executed on the test engine
+    (or on `engine`, e.g. the async_engine fixture):
+
+        with count_queries() as statements:
+            ...
+        assert len(statements) == 1
+    """
+    @contextmanager
+    def _count_queries(engine: Engine = engine_test) -> Iterator[List[str]]:
+        statements: List[str] = []
+        if isinstance(engine, AsyncEngine):
+            engine = engine.sync_engine # Async engines emit their events from the sync engine they wrap
+
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            yield statements
+        finally:
+            event.remove(engine, "before_cursor_execute", before_cursor_execute)
+    return _count_queries
+
 # --- TestClient Setup ---
 @pytest.fixture
 def client(db_session: Session) -> Generator[TestClient, None, None]:
     """
-    Provides a TestClient instance for API testing, with get_db dependency overridden.
+    Provides a TestClient instance for API testing, with the get_db and get_read_db
+    dependencies overridden (reads and writes share the test session).
     """
 
     def override_get_db() -> Generator[Session, None, None]:
@@ -55,12 +91,65 @@ def client(db_session: Session) -> Generator[TestClient, None, None]:
             pass
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
+    # Each test gets a fresh database, so cached results keyed by (user id, version) and
+    # cached token -> user identities must go too.
+    projection_cache.clear()
+    identity_cache.clear()
 
     with TestClient(app) as test_client:
         yield test_client
 
     # Clean up dependency override after test
     del app.dependency_overrides[get_db]
+    del app.dependency_overrides[get_read_db]
+
+# --- Async mode ---
+@pytest.fixture
+def async_engine(tmp_path) -> Generator[AsyncEngine, None, None]:
+    """Async engine on its own SQLite file (aiosqlite connections are per event loop)."""
+    pytest.importorskip("aiosqlite")
+    database_path = tmp_path / "async.db"
+    Base.metadata.create_all(bind=create_engine(f"sqlite:///{database_path}"))
+    engine = create_async_engine(f"sqlite+aiosqlite:///{database_path}", poolclass=NullPool)
+    yield engine
+    engine.sync_engine.dispose()
+
+@pytest.fixture
+def async_client(async_engine: AsyncEngine) -> Generator[TestClient, None, None]:
+    """TestClient for the async-mode app, on the async_engine database."""
+    AsyncSessionLocal_test = sessionmaker(
+        bind=async_engine, class_=AsyncSession, autocommit=False, autoflush=False, expire_on_commit=False
+    )
+
+    async def override_get_async_db():
+        async with AsyncSessionLocal_test() as db:
+            yield db
+
+    async_app = create_app(use_async_db=True, metrics_enabled=True) # Server-Timing is checked in async mode too
+    async_app.dependency_overrides[get_async_db] = override_get_async_db
+    projection_cache.clear()
+    identity_cache.clear()
+    with TestClient(async_app) as test_client:
+        yield test_client
+
+# --- Authenticated user ---
+# `get_current_active_user` is still a stub: any bearer token resolves to this email.
+AUTH_STUB_EMAIL = "fakeuser@example.com"
+
+@pytest.fixture
+def auth_headers() -> dict:
+    return {"Authorization": "Bearer test-token"}
+
+@pytest.fixture
+def test_user(client: TestClient) -> dict:
+    """Creates the profile that the auth stub resolves to."""
+    response = client.post(
+        "/user/profile",
+        json={"email": AUTH_STUB_EMAIL, "google_id": "test-google-id", "age": 30}
+    )
+    assert response.status_code == 201
+    return response.json()
 
 # --- Mock Authentication (Placeholder) ---
 # You'll likely need a fixture to mock `get_current_active_user`
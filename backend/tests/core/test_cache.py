@@ -0,0 +1,44 @@
+from ...app.core.cache import ProjectionCache
+
+def test_cache_hit_miss_counters():
+    cache = ProjectionCache(max_entries=10)
+    assert cache.get((1, 0, "deterministic")) is None
+    cache.put((1, 0, "deterministic"), {"age": 55})
+    assert cache.get((1, 0, "deterministic")) == {"age": 55}
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.entries) == (1, 1, 1)
+
+def test_cache_lru_eviction_by_entry_count():
+    cache = ProjectionCache(max_entries=2)
+    cache.put((1, 0, "a"), 1)
+    cache.put((2, 0, "a"), 2)
+    cache.get((1, 0, "a")) # User 1 becomes most recently used
+    cache.put((3, 0, "a"), 3)
+    assert cache.get((2, 0, "a")) is None
+    assert cache.get((1, 0, "a")) == 1
+    assert cache.stats().evictions == 1
+
+def test_cache_memory_cap():
+    cache = ProjectionCache(max_entries=100, max_bytes=250, sizeof=lambda value: 100)
+    for user_id in range(5):
+        cache.put((user_id, 0, "a"), user_id)
+    stats = cache.stats()
+    assert stats.entries == 2 and stats.size_bytes == 200
+    assert cache.get((4, 0, "a")) == 4
+
+def test_cache_newer_version_drops_older_entries():
+    cache = ProjectionCache()
+    cache.put((1, 0, "deterministic"), "old")
+    cache.put((1, 0, "montecarlo"), "old-mc")
+    cache.put((2, 0, "deterministic"), "other user")
+    cache.put((1, 1, "deterministic"), "new")
+    assert cache.stats().entries == 2
+    assert cache.get((1, 0, "deterministic")) is None
+    assert cache.get((2, 0, "deterministic")) == "other user"
+
+def test_cache_invalidate_user():
+    cache = ProjectionCache()
+    cache.put((1, 0, "a"), 1)
+    cache.put((1, 0, "b"), 2)
+    cache.invalidate_user(1)
+    assert cache.stats().entries == 0 and cache.stats().size_bytes == 0
@@ -0,0 +1,53 @@
+import threading
+
+import numpy as np
+import pytest
+
+from ...app.core.executor import ExecutorSaturated, ProjectionExecutor, ProjectionJob
+from ...app.core.montecarlo import simulate_retirement_projections
+from ...app.core.projections import LIFESTYLE_MULTIPLIERS
+
+SIMULATION = dict(
+    current_age=30, current_savings_total=100000, annual_savings_contribution=12000, base_annual_expenses=40000,
+    investment_return_rate=0.06, inflation_rate=0.025, life_expectancy=90,
+    expense_multipliers=list(LIFESTYLE_MULTIPLIERS.values()), paths=500, seed=7
+)
+
+def _add(a, b):
+    return a + b
+
+def test_executor_routes_jobs_by_cost():
+    executor = ProjectionExecutor(backend="thread", workers=1, inline_cost=100)
+    try:
+        assert executor.run(ProjectionJob(_add, {"a": 7, "b": 2}, cost=99)) == 9
+        assert executor.run(ProjectionJob(_add, {"a": 9, "b": 4}, cost=100)) == 13
+        stats = executor.stats()
+        assert (stats.inline, stats.offloaded, stats.in_flight) == (1, 1, 0)
+    finally:
+        executor.shutdown()
+
+def test_process_backend_matches_inline():
+    job = ProjectionJob(simulate_retirement_projections, SIMULATION, cost=10**9)
+    executor = ProjectionExecutor(backend="process", workers=1)
+    try:
+        offloaded = executor.run(job)
+    finally:
+        executor.shutdown()
+    inline = ProjectionExecutor(backend="inline").run(job)
+    assert np.array_equal(offloaded.retirement_ages, inline.retirement_ages)
+    assert np.array_equal(offloaded.success_probabilities, inline.success_probabilities)
+
+def test_executor_rejects_jobs_beyond_queue_depth():
+    release = threading.Event()
+    executor = ProjectionExecutor(backend="thread", workers=1, inline_cost=0, max_queue_depth=2)
+    try:
+        blocked = [executor.submit(ProjectionJob(release.wait, {"timeout": 5}, cost=1)) for _ in range(2)]
+        with pytest.raises(ExecutorSaturated):
+            executor.submit(ProjectionJob(release.wait, {"timeout": 5}, cost=1))
+        release.set()
+        assert all(future.result() for future in blocked)
+        assert executor.stats().rejected == 1
+        assert executor.run(ProjectionJob(_add, {"a": 1, "b": 1}, cost=1)) == 2
+    finally:
+        release.set()
+        executor.shutdown()
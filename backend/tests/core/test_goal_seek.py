@@ -0,0 +1,67 @@
+import pytest
+
+from ...app.core.goal_seek import solve_additional_savings
+from ...app.core.projections import calculate_retirement_projection, LIFESTYLE_MULTIPLIERS
+
+BASE_INPUTS = dict(
+    current_age=30,
+    current_savings_total=50000,
+    annual_savings_contribution=8000,
+    base_annual_expenses=40000,
+    investment_return_rate=0.06,
+    inflation_rate=0.02,
+    life_expectancy=95,
+)
+
+def _age_with_extra(mode: str, extra: float, multiplier: float):
+    inputs = dict(BASE_INPUTS)
+    if mode == "annual_contribution":
+        inputs["annual_savings_contribution"] += extra
+    else:
+        inputs["current_savings_total"] += extra
+    return calculate_retirement_projection(**inputs, expense_multiplier=multiplier)
+
+@pytest.mark.parametrize("mode", ["annual_contribution", "lump_sum"])
+@pytest.mark.parametrize("lifestyle", list(LIFESTYLE_MULTIPLIERS))
+@pytest.mark.parametrize("target_age", [45, 55, 65])
+def test_goal_seek_returns_minimum_amount(mode, lifestyle, target_age):
+    multiplier = LIFESTYLE_MULTIPLIERS[lifestyle]
+    result = solve_additional_savings(
+        **BASE_INPUTS, expense_multiplier=multiplier, target_retirement_age=target_age, mode=mode
+    )
+    assert result.required_amount is not None
+    assert result.projected_retirement_age <= target_age
+    age = _age_with_extra(mode, result.required_amount, multiplier)
+    assert age is not None and age <= target_age
+    if result.required_amount > 0:
+        # One cent less must miss the target
+        age = _age_with_extra(mode, result.required_amount - 0.01, multiplier)
+        assert age is None or age > target_age
+    assert result.engine_evaluations <= 10
+
+def test_goal_seek_already_on_track():
+    baseline_age = calculate_retirement_projection(**BASE_INPUTS, expense_multiplier=1.0)
+    result = solve_additional_savings(
+        **BASE_INPUTS, expense_multiplier=1.0, target_retirement_age=baseline_age + 5
+    )
+    assert result.required_amount == 0.0
+    assert result.projected_retirement_age == baseline_age
+    assert result.engine_evaluations == 1
+
+def test_goal_seek_contribution_cannot_help_when_retiring_today():
+    result = solve_additional_savings(
+        **BASE_INPUTS, expense_multiplier=1.0, target_retirement_age=30, mode="annual_contribution"
+    )
+    assert result.required_amount is None
+
+def test_goal_seek_lump_sum_when_retiring_today():
+    result = solve_additional_savings(
+        **BASE_INPUTS, expense_multiplier=1.0, target_retirement_age=30, mode="lump_sum"
+    )
+    assert result.required_amount is not None
+    assert result.projected_retirement_age == 30
+
+@pytest.mark.parametrize("target_age", [29, 95, 200])
+def test_goal_seek_target_outside_window(target_age):
+    with pytest.raises(ValueError):
+        solve_additional_savings(**BASE_INPUTS, expense_multiplier=1.0, target_retirement_age=target_age)
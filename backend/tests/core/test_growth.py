@@ -0,0 +1,70 @@
+import threading
+
+import pytest
+
+from ...app.core.growth import GrowthTableCache, growth_tables
+from ...app.core.projections import calculate_retirement_projection, iter_projection_timeline
+
+def test_factors_are_bit_identical_to_pow():
+    cache = GrowthTableCache()
+    table = cache.get(0.0237, 80)
+    assert table.factors == tuple((1 + 0.0237) ** k for k in range(81))
+    assert table.array.tolist() == list(table.factors)
+    with pytest.raises(ValueError):
+        table.array[0] = 2.0 # Shared between callers: read-only
+    assert cache.get(0.0237, 80) is table
+
+def test_lru_eviction_and_counters():
+    cache = GrowthTableCache(max_entries=2)
+    cache.get(0.02, 60)
+    cache.get(0.03, 60)
+    cache.get(0.02, 60) # Most recently used
+    cache.get(0.02, 50) # Another horizon is another table; evicts (0.03, 60)
+    cache.get(0.03, 60)
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.evictions, stats.entries, stats.factors) == (1, 4, 2, 2, 112)
+
+def test_factor_cap_and_uncached_tables():
+    cache = GrowthTableCache(max_factors=150, max_cached_periods=100)
+    cache.get(0.02, 60)
+    cache.get(0.03, 60)
+    cache.get(0.04, 60) # 183 factors: evicts the least recently used table
+    assert (cache.stats().entries, cache.stats().factors, cache.stats().evictions) == (2, 122, 1)
+
+    long_table = cache.get(0.02, 40_000) # Past max_cached_periods (and the float range)
+    assert long_table.factors[-1] == float("inf") and long_table.factors[100] == 1.02 ** 100
+    cache.get(0.05, 10, store=False) # One-off rate
+    assert (cache.stats().entries, cache.stats().factors) == (2, 122)
+
+def test_concurrent_lookups_share_tables():
+    cache = GrowthTableCache(max_entries=8)
+    results, errors = [], []
+
+    def lookup(worker: int) -> None:
+        try:
+            for i in range(200):
+                rate = 0.01 * ((worker + i) % 12)
+                results.append((rate, cache.get(rate, 40).factors[-1]))
+        except Exception as e: # pragma: no cover - reported below
+            errors.append(e)
+
+    threads = [threading.Thread(target=lookup, args=(worker,)) for worker in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+    assert all(last == (1 + rate) ** 40 for rate, last in results)
+    assert cache.stats().entries <= 8
+
+def test_engines_reuse_shared_tables():
+    growth_tables.clear()
+    inputs = dict(
+        current_age=30, current_savings_total=50_000, annual_savings_contribution=15_000, base_annual_expenses=40_000,
+        investment_return_rate=0.07, inflation_rate=0.02, life_expectancy=90
+    )
+    calculate_retirement_projection(**inputs, expense_multiplier=1.0)
+    calculate_retirement_projection(**inputs, expense_multiplier=1.5)
+    list(iter_projection_timeline(**inputs, expense_multiplier=1.0, retirement_age=60))
+    stats = growth_tables.stats()
+    assert (stats.misses, stats.hits, stats.entries) == (1, 2, 1)
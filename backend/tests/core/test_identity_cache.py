@@ -0,0 +1,32 @@
+from ...app.core.identity_cache import IdentityCache, UserIdentity
+
+ALICE = UserIdentity(id=1, email="alice@example.com", age=30, is_active=True)
+BOB = UserIdentity(id=2, email="bob@example.com", age=40, is_active=True)
+
+def test_identity_cache_expires_entries():
+    now = [0.0]
+    cache = IdentityCache(ttl_seconds=60, clock=lambda: now[0])
+    cache.put("token-a", ALICE)
+    now[0] = 59.9
+    assert cache.get("token-a") == ALICE
+    now[0] = 60.0
+    assert cache.get("token-a") is None
+    assert len(cache) == 0
+
+def test_identity_cache_lru_eviction():
+    cache = IdentityCache(max_entries=2)
+    cache.put("token-a", ALICE)
+    cache.put("token-b", BOB)
+    cache.get("token-a") # token-a becomes most recently used
+    cache.put("token-c", BOB)
+    assert cache.get("token-b") is None
+    assert cache.get("token-a") == ALICE
+
+def test_identity_cache_invalidate_email():
+    cache = IdentityCache()
+    cache.put("token-a", ALICE)
+    cache.put("token-a2", ALICE)
+    cache.put("token-b", BOB)
+    cache.invalidate_email(ALICE.email)
+    assert cache.get("token-a") is None and cache.get("token-a2") is None
+    assert cache.get("token-b") == BOB
@@ -0,0 +1,98 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from ...app.core.jobs import InMemoryJobStore, JobManager, JobQueueFull, JobRecord, JobStore
+
+def _wait_until_finished(manager, record):
+    manager.shutdown() # Waits for every submitted job
+    return manager.get(record.id, record.user_id)
+
+def test_job_manager_runs_jobs_and_reports_progress():
+    progress_seen = []
+    submitted = threading.Event()
+    manager = JobManager(workers=1)
+
+    def job(report_progress):
+        submitted.wait(5) # `record` is assigned once submit returns
+        for step in (0.25, 0.5, 1.0):
+            report_progress(step)
+            progress_seen.append(manager.store.get(record.id).progress)
+        return "done"
+
+    record = manager.submit(user_id=1, kind="sensitivity", fn=job)
+    submitted.set()
+    assert record.status == "queued"
+    finished = _wait_until_finished(manager, record)
+    assert (finished.status, finished.result, finished.progress) == ("succeeded", "done", 1.0)
+    assert progress_seen == [0.25, 0.5, 1.0]
+    assert manager.get(record.id, user_id=2) is None # Other users cannot see it
+
+def test_job_manager_records_failures():
+    manager = JobManager(workers=1)
+
+    def job(report_progress):
+        raise ValueError("No solution")
+
+    record = manager.submit(user_id=1, kind="montecarlo", fn=job)
+    finished = _wait_until_finished(manager, record)
+    assert (finished.status, finished.error, finished.result) == ("failed", "No solution", None)
+
+def test_job_manager_rejects_jobs_beyond_max_pending():
+    release = threading.Event()
+    manager = JobManager(workers=1, max_pending=1)
+    try:
+        manager.submit(user_id=1, kind="montecarlo", fn=lambda report_progress: release.wait(5))
+        with pytest.raises(JobQueueFull):
+            manager.submit(user_id=1, kind="montecarlo", fn=lambda report_progress: None)
+    finally:
+        release.set()
+        manager.shutdown()
+
+def test_job_manager_undoes_submissions_the_pool_refuses(monkeypatch):
+    manager = JobManager(workers=1, max_pending=1)
+    def refuse(*args, **kwargs):
+        raise RuntimeError("cannot schedule new futures after shutdown")
+    monkeypatch.setattr(ThreadPoolExecutor, "submit", refuse)
+    with pytest.raises(RuntimeError):
+        manager.submit(user_id=1, kind="montecarlo", fn=lambda report_progress: None)
+    assert len(manager.store) == 0 # No job left "queued" forever
+    monkeypatch.undo()
+    try:
+        record = manager.submit(user_id=1, kind="montecarlo", fn=lambda report_progress: 42) # Not JobQueueFull
+    finally:
+        manager.shutdown()
+    assert manager.get(record.id, user_id=1).result == 42
+
+def test_job_store_drops_expired_records():
+    now = [1000.0]
+    store = InMemoryJobStore(clock=lambda: now[0])
+    store.put(JobRecord("a", 1, "montecarlo", "succeeded", 1.0, 900.0, finished_at=950.0, expires_at=1100.0))
+    store.put(JobRecord("b", 1, "montecarlo", "running", 0.5, 900.0))
+    now[0] = 1100.0
+    assert store.get("a") is None
+    assert store.get("b").status == "running" # Unfinished jobs never expire
+
+def test_job_store_expires_records_on_put():
+    now = [1000.0]
+    store = InMemoryJobStore(clock=lambda: now[0])
+    store.put(JobRecord("a", 1, "montecarlo", "succeeded", 1.0, 900.0, finished_at=950.0, expires_at=1100.0))
+    store.put(JobRecord("b", 1, "montecarlo", "succeeded", 1.0, 900.0, finished_at=950.0, expires_at=1100.0))
+    store.put(JobRecord("b", 1, "montecarlo", "succeeded", 1.0, 900.0, finished_at=950.0, expires_at=1300.0)) # Replaced: the old expiry no longer applies
+    now[0] = 1200.0
+    store.put(JobRecord("c", 1, "montecarlo", "running", 0.5, 1200.0))
+    assert len(store) == 2 # "a" dropped by the put, without being read
+    assert store.get("b") is not None
+
+def test_job_store_is_abstract():
+    with pytest.raises(TypeError):
+        JobStore()
+
+def test_job_store_caps_retained_jobs():
+    store = InMemoryJobStore(max_records=2)
+    store.put(JobRecord("running", 1, "montecarlo", "running", 0.5, 900.0))
+    for job_id in ("a", "b", "c"):
+        store.put(JobRecord(job_id, 1, "montecarlo", "succeeded", 1.0, 900.0, finished_at=950.0, expires_at=float("inf")))
+    assert len(store) == 2
+    assert store.get("running") is not None and store.get("c") is not None # Oldest finished ones went first
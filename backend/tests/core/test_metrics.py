@@ -0,0 +1,25 @@
+from ...app.core.metrics import Histogram, RequestTimings
+
+def test_histogram_renders_cumulative_buckets():
+    histogram = Histogram("latency_seconds", "Test latency.", ("route",), (0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 3.0):
+        histogram.observe(value, "/a")
+    histogram.observe(0.2, "/b")
+
+    lines = histogram.render()
+    assert lines[:2] == ["# HELP latency_seconds Test latency.", "# TYPE latency_seconds histogram"]
+    assert 'latency_seconds_bucket{route="/a",le="0.1"} 2' in lines # Bounds are inclusive
+    assert 'latency_seconds_bucket{route="/a",le="1"} 3' in lines
+    assert 'latency_seconds_bucket{route="/a",le="+Inf"} 4' in lines
+    assert 'latency_seconds_sum{route="/a"} 3.65' in lines
+    assert 'latency_seconds_count{route="/a"} 4' in lines
+    assert 'latency_seconds_count{route="/b"} 1' in lines
+
+    histogram.clear()
+    assert len(histogram.render()) == 2
+
+def test_server_timing_header_value():
+    timings = RequestTimings()
+    timings.db, timings.db_queries, timings.compute, timings.serialization = 0.0015, 3, 0.002, 0.0005
+    header = timings.server_timing()
+    assert header.startswith('db;dur=1.50;desc="3 queries", compute;dur=2.00, serialize;dur=0.50, total;dur=')
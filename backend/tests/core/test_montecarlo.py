@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+from ...app.core.montecarlo import MAX_SIMULATION_PATHS, simulate_retirement_projections
+from ...app.core.projections import (
+    LIFESTYLE_MULTIPLIERS,
+    NO_RETIREMENT_AGE,
+    calculate_retirement_projections_batch,
+)
+
+BASE_INPUTS = dict(
+    current_age=30,
+    current_savings_total=100000,
+    annual_savings_contribution=15000,
+    base_annual_expenses=40000,
+    investment_return_rate=0.07,
+    inflation_rate=0.02,
+    life_expectancy=95,
+    expense_multipliers=list(LIFESTYLE_MULTIPLIERS.values()),
+)
+
+def test_montecarlo_is_reproducible_with_seed():
+    first = simulate_retirement_projections(**BASE_INPUTS, paths=2000, seed=42)
+    second = simulate_retirement_projections(**BASE_INPUTS, paths=2000, seed=42)
+    np.testing.assert_array_equal(first.success_probabilities, second.success_probabilities)
+    np.testing.assert_array_equal(first.retirement_ages, second.retirement_ages)
+
+def test_montecarlo_without_volatility_matches_deterministic_engine():
+    result = simulate_retirement_projections(
+        **BASE_INPUTS, paths=10, return_volatility=0.0, inflation_volatility=0.0, success_probability=1.0, seed=0
+    )
+    np.testing.assert_array_equal(result.retirement_ages, calculate_retirement_projections_batch(**BASE_INPUTS))
+    assert set(np.unique(result.success_probabilities)) <= {0.0, 1.0}
+
+def test_montecarlo_probabilities_shape_and_monotonicity():
+    result = simulate_retirement_projections(**BASE_INPUTS, paths=3000, seed=7)
+    assert result.candidate_ages[0] == 30 and result.candidate_ages[-1] == 94
+    assert result.success_probabilities.shape == (3, 65)
+    assert np.all((result.success_probabilities >= 0) & (result.success_probabilities <= 1))
+    # Retiring later never lowers the success probability, and costlier lifestyles never raise it
+    assert np.all(np.diff(result.success_probabilities, axis=1) >= 0)
+    assert np.all(np.diff(result.success_probabilities, axis=0) <= 0)
+
+def test_montecarlo_past_life_expectancy():
+    result = simulate_retirement_projections(**{**BASE_INPUTS, "current_age": 96}, paths=10, seed=0)
+    assert result.candidate_ages.size == 0
+    assert np.all(result.retirement_ages == NO_RETIREMENT_AGE)
+
+@pytest.mark.parametrize("paths", [0, 100_001])
+def test_montecarlo_rejects_invalid_path_count(paths):
+    with pytest.raises(ValueError):
+        simulate_retirement_projections(**BASE_INPUTS, paths=paths)
+
+def test_montecarlo_max_paths_raises_the_limit():
+    inputs = {**BASE_INPUTS, "current_age": 90}
+    result = simulate_retirement_projections(**inputs, paths=MAX_SIMULATION_PATHS + 1, seed=0, max_paths=MAX_SIMULATION_PATHS + 1)
+    assert result.success_probabilities.shape == (len(LIFESTYLE_MULTIPLIERS), 5)
@@ -1,12 +1,18 @@
+import math
 import pytest
+import random
 from typing import List, Union, NamedTuple # For mock items
 
 # Assuming the module to test is accessible like this:
 # This might require PYTHONPATH adjustments or running pytest from 'backend' directory
-from ....app.core.projections import (
+from ...app.core.projections import (
     normalize_item_to_annual,
     get_total_annual_amount,
     calculate_retirement_projection,
+    calculate_retirement_projection_reference,
+    calculate_retirement_projections_batch,
+    iter_projection_timeline,
+    NO_RETIREMENT_AGE,
     LIFESTYLE_MULTIPLIERS # If needed for test setup
 )
 # If the above import fails, a simpler relative import might work if structure allows:
@@ -170,3 +176,136 @@ def test_calc_ret_proj_content_lifestyle():
     # For this test, just ensure it runs and returns an age or None
     if age is not None:
         assert 30 < age < 95
+
+# --- Differential tests: linear solver vs. reference loop ---
+DIFFERENTIAL_CASES = [
+    # current_age, savings, contribution, expenses, return, inflation, life_expectancy
+    (30, 100000, 10000, 40000, 0.07, 0.02, 95),
+    (30, 10000, 1000, 100000, 0.05, 0.02, 95),
+    (96, 1000000, 10000, 40000, 0.07, 0.02, 95),
+    (60, 3000000, 0, 50000, 0.03, 0.01, 90),
+    (30, 0, 25000, 25000, 0.00, 0.00, 60),
+    (30, 0, 25000, 25000, 0.00, 0.00, 59), # Savings exactly equal the requirement at 45
+    (18, 0, 5000, 60000, 0.04, 0.03, 120), # Horizon longer than MAX_PROJECTION_YEARS
+    (40, 50000, 20000, 30000, -0.02, 0.02, 95), # Negative returns
+    (40, 50000, 20000, 30000, -1.5, 0.02, 95), # Return below -100% uses the reference fallback
+    (25, 20000, 12000, 0, 0.07, 0.02, 95), # No expenses
+    (25, -5000, 0, 0, 0.07, 0.02, 95), # Negative savings and no expenses
+]
+
+@pytest.mark.parametrize("case", DIFFERENTIAL_CASES)
+@pytest.mark.parametrize("multiplier", list(LIFESTYLE_MULTIPLIERS.values()))
+def test_calc_ret_proj_matches_reference(case, multiplier):
+    kwargs = dict(zip(
+        ["current_age", "current_savings_total", "annual_savings_contribution", "base_annual_expenses",
+         "investment_return_rate", "inflation_rate", "life_expectancy"],
+        case
+    ))
+    assert calculate_retirement_projection(**kwargs, expense_multiplier=multiplier) == \
+        calculate_retirement_projection_reference(**kwargs, expense_multiplier=multiplier)
+
+def test_calc_ret_proj_matches_reference_randomized():
+    rng = random.Random(1234)
+    for _ in range(500):
+        kwargs = dict(
+            current_age=rng.randint(18, 90),
+            current_savings_total=rng.choice([0.0, rng.uniform(0, 2_000_000)]),
+            annual_savings_contribution=rng.uniform(0, 80_000),
+            base_annual_expenses=rng.uniform(5_000, 150_000),
+            investment_return_rate=rng.uniform(-0.05, 0.12),
+            inflation_rate=rng.uniform(0.0, 0.06),
+            life_expectancy=rng.randint(60, 110),
+            expense_multiplier=rng.choice(list(LIFESTYLE_MULTIPLIERS.values())),
+        )
+        assert calculate_retirement_projection(**kwargs) == calculate_retirement_projection_reference(**kwargs), kwargs
+
+# --- Tests for calculate_retirement_projections_batch ---
+@pytest.mark.parametrize("case", DIFFERENTIAL_CASES)
+def test_calc_ret_proj_batch_matches_scalar(case):
+    kwargs = dict(zip(
+        ["current_age", "current_savings_total", "annual_savings_contribution", "base_annual_expenses",
+         "investment_return_rate", "inflation_rate", "life_expectancy"],
+        case
+    ))
+    multipliers = [0.25 * step for step in range(1, 21)] + list(LIFESTYLE_MULTIPLIERS.values())
+    ages = calculate_retirement_projections_batch(**kwargs, expense_multipliers=multipliers)
+    assert len(ages) == len(multipliers)
+    for multiplier, age in zip(multipliers, ages):
+        expected = calculate_retirement_projection_reference(**kwargs, expense_multiplier=multiplier)
+        assert (None if age == NO_RETIREMENT_AGE else age) == expected
+
+def test_calc_ret_proj_batch_empty_multipliers():
+    ages = calculate_retirement_projections_batch(
+        current_age=30,
+        current_savings_total=100000,
+        annual_savings_contribution=10000,
+        base_annual_expenses=40000,
+        investment_return_rate=0.07,
+        inflation_rate=0.02,
+        life_expectancy=95,
+        expense_multipliers=[]
+    )
+    assert ages.size == 0
+
+# --- Tests for iter_projection_timeline ---
+TIMELINE_INPUTS = dict(
+    current_age=30,
+    current_savings_total=100000,
+    annual_savings_contribution=20000,
+    base_annual_expenses=40000,
+    investment_return_rate=0.07,
+    inflation_rate=0.02,
+    life_expectancy=95,
+    expense_multiplier=1.0
+)
+
+def test_timeline_retires_at_computed_age_without_depleting():
+    retirement_age = calculate_retirement_projection(**TIMELINE_INPUTS)
+    years = list(iter_projection_timeline(**TIMELINE_INPUTS, retirement_age=retirement_age))
+
+    assert [year.age for year in years] == list(range(30, 96))
+    assert {year.phase for year in years if year.age < retirement_age} == {"accumulation"}
+    assert {year.phase for year in years if year.age >= retirement_age} == {"retirement"}
+    assert all(year.expenses == 0.0 for year in years if year.phase == "accumulation")
+    assert all(year.contribution == 0.0 for year in years if year.phase == "retirement")
+    # Contributions inflate year over year
+    assert years[1].contribution == pytest.approx(years[0].contribution * 1.02)
+
+def test_timeline_depletes_when_retiring_too_early():
+    retirement_age = calculate_retirement_projection(**TIMELINE_INPUTS)
+    years = list(iter_projection_timeline(**TIMELINE_INPUTS, retirement_age=retirement_age - 1))
+    phases = [year.phase for year in years]
+    assert "depleted" in phases
+    first_depleted = phases.index("depleted")
+    assert set(phases[first_depleted:]) == {"depleted"}
+    assert all(year.balance == 0.0 for year in years[first_depleted + 1:])
+
+def test_timeline_never_retiring_stays_in_accumulation():
+    years = list(iter_projection_timeline(**TIMELINE_INPUTS, retirement_age=None))
+    assert len(years) == 66
+    assert {year.phase for year in years} == {"accumulation"}
+
+def test_timeline_is_lazy():
+    timeline = iter_projection_timeline(**{**TIMELINE_INPUTS, "life_expectancy": 10**9}, retirement_age=None)
+    first_years = [next(timeline) for _ in range(3)]
+    assert [year.age for year in first_years] == [30, 31, 32]
+    assert first_years[0].balance == 100000
+
+def test_timeline_absurd_life_expectancy_does_not_overflow():
+    inputs = {**TIMELINE_INPUTS, "inflation_rate": 0.05, "life_expectancy": 40_000}
+    accumulating = list(iter_projection_timeline(**inputs, retirement_age=None))
+    assert len(accumulating) == 40_000 - inputs["current_age"] + 1
+    assert accumulating[-1].contribution == math.inf # Capped like the solver's growth factors
+    retiring = list(iter_projection_timeline(**{**inputs, "base_annual_expenses": 0.0}, retirement_age=60))
+    assert all(year.expenses == 0.0 for year in retiring) # Not nan
+
+def test_calc_ret_proj_absurd_life_expectancy_does_not_overflow():
+    # Inflation growth overflows floats long before this life expectancy
+    inputs = dict(
+        current_age=30, current_savings_total=10_000, annual_savings_contribution=1_000, base_annual_expenses=100_000,
+        investment_return_rate=0.05, inflation_rate=0.02, life_expectancy=40_000
+    )
+    assert calculate_retirement_projection(**inputs, expense_multiplier=1.0) is None
+    assert calculate_retirement_projection_reference(**inputs, expense_multiplier=1.0) is None
+    batch = calculate_retirement_projections_batch(**inputs, expense_multipliers=list(LIFESTYLE_MULTIPLIERS.values()))
+    assert list(batch) == [NO_RETIREMENT_AGE] * len(LIFESTYLE_MULTIPLIERS)
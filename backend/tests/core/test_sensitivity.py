@@ -0,0 +1,38 @@
+import numpy as np
+import pytest
+
+from ...app.core.projections import LIFESTYLE_MULTIPLIERS, NO_RETIREMENT_AGE, calculate_retirement_projection
+from ...app.core.sensitivity import calculate_sensitivity_grid
+
+@pytest.mark.parametrize("inputs", [
+    dict(current_age=30, current_savings_total=100000, annual_savings_contribution=10000, base_annual_expenses=40000, life_expectancy=95),
+    dict(current_age=30, current_savings_total=0, annual_savings_contribution=25000, base_annual_expenses=25000, life_expectancy=59),
+    dict(current_age=18, current_savings_total=0, annual_savings_contribution=5000, base_annual_expenses=60000, life_expectancy=120),
+    dict(current_age=50, current_savings_total=-2_000_000_000, annual_savings_contribution=0, base_annual_expenses=10000, life_expectancy=95),
+])
+def test_sensitivity_grid_matches_scalar_engine(inputs):
+    return_rates = [-1.5, -0.05, 0.0, 0.03, 0.07, 0.12]
+    inflation_rates = [0.0, 0.01, 0.02, 0.05]
+    multipliers = list(LIFESTYLE_MULTIPLIERS.values())
+    grid = calculate_sensitivity_grid(
+        **inputs, return_rates=return_rates, inflation_rates=inflation_rates, expense_multipliers=multipliers
+    )
+    assert grid.retirement_ages.shape == (len(multipliers), len(return_rates), len(inflation_rates))
+    for tier, multiplier in enumerate(multipliers):
+        for row, return_rate in enumerate(return_rates):
+            for column, inflation_rate in enumerate(inflation_rates):
+                expected = calculate_retirement_projection(
+                    **inputs,
+                    investment_return_rate=return_rate,
+                    inflation_rate=inflation_rate,
+                    expense_multiplier=multiplier
+                )
+                age = grid.retirement_ages[tier, row, column]
+                assert (None if age == NO_RETIREMENT_AGE else age) == expected
+
+def test_sensitivity_grid_past_life_expectancy():
+    grid = calculate_sensitivity_grid(
+        current_age=96, current_savings_total=0, annual_savings_contribution=0, base_annual_expenses=1000,
+        life_expectancy=95, return_rates=[0.05, 0.07], inflation_rates=[0.02], expense_multipliers=[1.0]
+    )
+    assert np.all(grid.retirement_ages == NO_RETIREMENT_AGE)
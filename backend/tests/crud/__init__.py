@@ -0,0 +1 @@
+# This file makes the 'crud' directory within 'tests' a Python package.
@@ -0,0 +1,32 @@
+from ...app import crud, models, schemas
+from ...app.core.projections import LUMP_SUM_SAVING_NAME
+
+def _seed_user(db_session):
+    db_user = crud.create_user(db_session, schemas.user.UserCreate(email="context@example.com", google_id="g-context", age=35))
+    for index in range(5):
+        db_session.add(models.expense.Expense(name=f"Expense {index}", amount=100, frequency="monthly", user_id=db_user.id))
+        db_session.add(models.saving.Saving(name=f"Saving {index}", amount=50, frequency="monthly", user_id=db_user.id))
+    db_session.add(models.saving.Saving(name=LUMP_SUM_SAVING_NAME, amount=1000, frequency="yearly", user_id=db_user.id))
+    crud.create_or_update_user_assumption(db_session, schemas.assumption.AssumptionCreate(), user_id=db_user.id)
+    db_session.expunge_all() # Start from an empty identity map, as a new request would
+
+def test_get_user_context_single_query(db_session, count_queries):
+    _seed_user(db_session)
+    with count_queries() as statements:
+        db_user = crud.get_user_context(db_session, email="context@example.com")
+        assert db_user.assumption.return_rate == 0.07
+        assert db_user.ledger_totals is not None
+    assert len(statements) == 1
+
+def test_get_user_context_with_ledger_bounded_queries(db_session, count_queries):
+    _seed_user(db_session)
+    with count_queries() as statements:
+        db_user = crud.get_user_context(db_session, email="context@example.com", include_ledger=True)
+        assert len(db_user.expenses) == 5
+        assert len(db_user.savings) == 6
+        assert db_user.assumption is not None
+        assert db_user.ledger_totals is not None
+    assert len(statements) == 3
+
+def test_get_user_context_unknown_email(db_session):
+    assert crud.get_user_context(db_session, email="nobody@example.com") is None
@@ -0,0 +1,84 @@
+import pytest
+
+from ...app import crud, models, schemas
+from ...app.core.projections import LUMP_SUM_SAVING_NAME
+
+@pytest.fixture
+def db_user(db_session):
+    return crud.create_user(db_session, schemas.user.UserCreate(email="totals@example.com", google_id="g-totals", age=40))
+
+def test_new_user_starts_with_zero_totals(db_session, db_user):
+    totals = crud.get_ledger_totals(db_session, user_id=db_user.id)
+    assert (totals.annual_expense_total, totals.annual_contribution_total, totals.lump_sum_total) == (0.0, 0.0, 0.0)
+
+def test_create_paths_maintain_totals(db_session, db_user):
+    crud.create_user_expense(db_session, schemas.expense.ExpenseCreate(name="Rent", amount=1500, frequency="monthly"), user_id=db_user.id)
+    crud.create_user_expense(db_session, schemas.expense.ExpenseCreate(name="Insurance", amount=300, frequency="quarterly"), user_id=db_user.id)
+    crud.create_user_saving(db_session, schemas.saving.SavingCreate(name="401k", amount=500, frequency="monthly"), user_id=db_user.id)
+    crud.create_user_saving(db_session, schemas.saving.SavingCreate(name=LUMP_SUM_SAVING_NAME, amount=80000, frequency="yearly"), user_id=db_user.id)
+
+    totals = crud.get_projection_totals(db_session, user_id=db_user.id)
+    assert totals.annual_expense_total == 1500 * 12 + 300 * 4
+    assert totals.annual_contribution_total == 500 * 12
+    assert totals.lump_sum_total == 80000
+    assert totals == crud.crud_ledger_totals.compute_ledger_totals_from_rows(db_session, user_id=db_user.id)
+
+def test_user_without_totals_record_is_backfilled_on_write(db_session, db_user):
+    # Simulate a user created before running totals existed
+    db_session.add(models.expense.Expense(name="Legacy", amount=100, frequency="monthly", user_id=db_user.id))
+    db_session.delete(crud.get_ledger_totals(db_session, user_id=db_user.id))
+    db_session.commit()
+
+    assert crud.get_projection_totals(db_session, user_id=db_user.id).annual_expense_total == 1200
+
+    crud.create_user_expense(db_session, schemas.expense.ExpenseCreate(name="New", amount=50, frequency="yearly"), user_id=db_user.id)
+    totals = crud.get_ledger_totals(db_session, user_id=db_user.id)
+    assert totals is not None
+    assert totals.annual_expense_total == 1250
+
+def test_backfill_losing_the_race_updates_the_concurrent_record(db_session, db_user, monkeypatch):
+    db_session.delete(crud.get_ledger_totals(db_session, user_id=db_user.id))
+    db_session.commit()
+    aggregate = crud.crud_ledger_totals.aggregate_ledger_totals
+
+    def aggregate_while_another_write_backfills(db, user_id):
+        totals = aggregate(db, user_id=user_id)
+        # The concurrent first write's record, from before this transaction's item
+        db.execute(models.ledger_totals.LedgerTotals.__table__.insert().values(
+            user_id=user_id, annual_expense_total=0.0, annual_contribution_total=0.0, lump_sum_total=1000.0
+        ))
+        return totals
+    monkeypatch.setattr(crud.crud_ledger_totals, "aggregate_ledger_totals", aggregate_while_another_write_backfills)
+
+    crud.create_user_expense(db_session, schemas.expense.ExpenseCreate(name="Rent", amount=100, frequency="monthly"), user_id=db_user.id)
+    totals = crud.get_ledger_totals(db_session, user_id=db_user.id)
+    assert (totals.annual_expense_total, totals.lump_sum_total) == (1200, 1000)
+
+def test_removal_delta(db_session, db_user):
+    crud.apply_saving_to_totals(db_session, user_id=db_user.id, name="IRA", amount=100, frequency="monthly")
+    crud.apply_saving_to_totals(db_session, user_id=db_user.id, name="IRA", amount=100, frequency="monthly", sign=-1)
+    db_session.commit()
+    assert crud.get_projection_totals(db_session, user_id=db_user.id).annual_contribution_total == 0.0
+
+def test_sql_aggregation_matches_python_path(db_session, db_user):
+    other_user = crud.create_user(db_session, schemas.user.UserCreate(email="other@example.com", google_id="g-other", age=30))
+    rows = [
+        models.expense.Expense(name="Rent", amount=1500, frequency="monthly", user_id=db_user.id),
+        models.expense.Expense(name="Car", amount=250, frequency="quarterly", user_id=db_user.id),
+        models.expense.Expense(name="Gift", amount=999, frequency="one-time", user_id=db_user.id),
+        models.expense.Expense(name="Odd", amount=5, frequency="fortnightly", user_id=db_user.id),
+        models.saving.Saving(name="401k", amount=700, frequency="monthly", user_id=db_user.id),
+        models.saving.Saving(name="Bonus", amount=3000, frequency="one-time", user_id=db_user.id),
+        models.saving.Saving(name=LUMP_SUM_SAVING_NAME, amount=25000, frequency="yearly", user_id=db_user.id),
+        models.saving.Saving(name=LUMP_SUM_SAVING_NAME, amount=5000, frequency="one-time", user_id=db_user.id),
+        models.expense.Expense(name="Not mine", amount=1, frequency="yearly", user_id=other_user.id),
+    ]
+    db_session.add_all(rows)
+    db_session.commit()
+
+    totals = crud.aggregate_ledger_totals(db_session, user_id=db_user.id)
+    assert totals == crud.crud_ledger_totals.compute_ledger_totals_from_rows(db_session, user_id=db_user.id)
+    assert totals == (1500 * 12 + 250 * 4, 700 * 12, 30000)
+
+def test_sql_aggregation_without_items(db_session, db_user):
+    assert crud.aggregate_ledger_totals(db_session, user_id=db_user.id) == (0.0, 0.0, 0.0)